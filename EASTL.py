@@ -32,6 +32,78 @@ from formatters.pair import (
     pair_SummaryProvider,
     pair_SyntheticChildrenProvider
 )
+from formatters.hash_table import (
+    HashTable_SummaryProvider,
+    HashTable_SyntheticChildrenProvider,
+)
+from formatters.deque import (
+    Deque_SummaryProvider,
+    Deque_SyntheticChildrenProvider,
+)
+from formatters.linked_list import (
+    List_SummaryProvider,
+    List_SyntheticChildrenProvider,
+)
+from formatters.fixed import (
+    FixedHashTable_SummaryProvider,
+    FixedHashTable_SyntheticChildrenProvider,
+    FixedList_SummaryProvider,
+    FixedList_SyntheticChildrenProvider,
+    FixedString_SummaryProvider,
+    FixedString_SyntheticChildrenProvider,
+    FixedTree_SummaryProvider,
+    FixedTree_SyntheticChildrenProvider,
+    FixedVector_SummaryProvider,
+    FixedVector_SyntheticChildrenProvider,
+)
+from formatters.intrusive import (
+    IntrusiveHashTable_SummaryProvider,
+    IntrusiveHashTable_SyntheticChildrenProvider,
+    IntrusiveList_SummaryProvider,
+    IntrusiveList_SyntheticChildrenProvider,
+)
+from formatters.ring_buffer import (
+    RingBuffer_SummaryProvider,
+    RingBuffer_SyntheticChildrenProvider,
+)
+from formatters.bitset import (
+    Bitset_SummaryProvider,
+    Bitset_SyntheticChildrenProvider,
+)
+from formatters.tuple_vector import (
+    TupleVector_SummaryProvider,
+    TupleVector_SyntheticChildrenProvider,
+)
+from formatters.segmented_vector import (
+    SegmentedVector_SummaryProvider,
+    SegmentedVector_SyntheticChildrenProvider,
+)
+from formatters.optional import (
+    Optional_SummaryProvider,
+    Optional_SyntheticChildrenProvider,
+)
+from formatters.variant import (
+    Variant_SummaryProvider,
+    Variant_SyntheticChildrenProvider,
+)
+from formatters.tuple import (
+    Tuple_SummaryProvider,
+    Tuple_SyntheticChildrenProvider,
+)
+from formatters.any import (
+    Any_SummaryProvider,
+    Any_SyntheticChildrenProvider,
+)
+from formatters.string_view import (
+    basic_string_view_SummaryProvider,
+    basic_string_view_SyntheticChildrenProvider,
+)
+from formatters.lru_cache import (
+    LruCache_SummaryProvider,
+    LruCache_SyntheticChildrenProvider,
+)
+from formatters.atomic import atomic_SummaryProvider
+from formatters.commands import run_find_command, run_settings_command
 
 
 #LLDB resolves formatter symbols against the Python module object loaded by command script import (EASTL.py). We cannot directly register
@@ -53,11 +125,58 @@ _ = (
     span_SummaryProvider,
     span_SyntheticChildrenProvider,
     pair_SummaryProvider,
-    pair_SyntheticChildrenProvider
+    pair_SyntheticChildrenProvider,
+    HashTable_SummaryProvider,
+    HashTable_SyntheticChildrenProvider,
+    Deque_SummaryProvider,
+    Deque_SyntheticChildrenProvider,
+    List_SummaryProvider,
+    List_SyntheticChildrenProvider,
+    FixedHashTable_SummaryProvider,
+    FixedHashTable_SyntheticChildrenProvider,
+    FixedList_SummaryProvider,
+    FixedList_SyntheticChildrenProvider,
+    FixedString_SummaryProvider,
+    FixedString_SyntheticChildrenProvider,
+    FixedTree_SummaryProvider,
+    FixedTree_SyntheticChildrenProvider,
+    FixedVector_SummaryProvider,
+    FixedVector_SyntheticChildrenProvider,
+    IntrusiveHashTable_SummaryProvider,
+    IntrusiveHashTable_SyntheticChildrenProvider,
+    IntrusiveList_SummaryProvider,
+    IntrusiveList_SyntheticChildrenProvider,
+    RingBuffer_SummaryProvider,
+    RingBuffer_SyntheticChildrenProvider,
+    Bitset_SummaryProvider,
+    Bitset_SyntheticChildrenProvider,
+    TupleVector_SummaryProvider,
+    TupleVector_SyntheticChildrenProvider,
+    SegmentedVector_SummaryProvider,
+    SegmentedVector_SyntheticChildrenProvider,
+    Optional_SummaryProvider,
+    Optional_SyntheticChildrenProvider,
+    Variant_SummaryProvider,
+    Variant_SyntheticChildrenProvider,
+    Tuple_SummaryProvider,
+    Tuple_SyntheticChildrenProvider,
+    Any_SummaryProvider,
+    Any_SyntheticChildrenProvider,
+    basic_string_view_SummaryProvider,
+    basic_string_view_SyntheticChildrenProvider,
+    LruCache_SummaryProvider,
+    LruCache_SyntheticChildrenProvider,
+    atomic_SummaryProvider,
 )
 
 EASTL_TYPE_CATEGORY = "EASTL"
 
+def eastl_settings_command(debugger, command, exe_ctx, result, internal_dict):
+    run_settings_command(debugger, command, result, EASTL_TYPE_CATEGORY)
+
+def eastl_find_command(debugger, command, exe_ctx, result, internal_dict):
+    run_find_command(exe_ctx, command, result)
+
 def __lldb_init_module(debugger, internal_dict):
     debugger.HandleCommand(
         f"type synthetic add -x ^eastl::basic_string<.*>$ -C true -l EASTL.basic_string_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
@@ -137,4 +256,146 @@ def __lldb_init_module(debugger, internal_dict):
     debugger.HandleCommand(
         f"type summary add -x ^eastl::pair<.*>$ -e -F EASTL.pair_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
     )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::hash_(multi)?(map|set)<.*>$ -C true -l EASTL.HashTable_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::hash_(multi)?(map|set)<.*>$ -e -F EASTL.HashTable_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::deque<.*>$ -C true -l EASTL.Deque_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::deque<.*>$ -e -F EASTL.Deque_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::s?list<.*>$ -C true -l EASTL.List_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::s?list<.*>$ -e -F EASTL.List_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::vector_(multi)?(map|set)<.*>$ -C true -l EASTL.VectorBase_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::vector_(multi)?(map|set)<.*>$ -e -F EASTL.VectorBase_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::fixed_vector<.*>$ -C true -l EASTL.FixedVector_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::fixed_vector<.*>$ -e -F EASTL.FixedVector_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::fixed_string<.*>$ -C true -l EASTL.FixedString_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::fixed_string<.*>$ -e -F EASTL.FixedString_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::fixed_(multi)?(map|set)<.*>$ -C true -l EASTL.FixedTree_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::fixed_(multi)?(map|set)<.*>$ -e -F EASTL.FixedTree_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::fixed_hash_(multi)?(map|set)<.*>$ -C true -l EASTL.FixedHashTable_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::fixed_hash_(multi)?(map|set)<.*>$ -e -F EASTL.FixedHashTable_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::fixed_s?list<.*>$ -C true -l EASTL.FixedList_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::fixed_s?list<.*>$ -e -F EASTL.FixedList_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::intrusive_list<.*>$ -C true -l EASTL.IntrusiveList_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::intrusive_list<.*>$ -e -F EASTL.IntrusiveList_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::intrusive_hash_(multi)?(map|set)<.*>$ -C true -l EASTL.IntrusiveHashTable_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::intrusive_hash_(multi)?(map|set)<.*>$ -e -F EASTL.IntrusiveHashTable_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::ring_buffer<.*>$ -C true -l EASTL.RingBuffer_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::ring_buffer<.*>$ -e -F EASTL.RingBuffer_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::bit(set|vector)<.*>$ -C true -l EASTL.Bitset_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::bit(set|vector)<.*>$ -e -F EASTL.Bitset_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::tuple_vector(_alloc)?<.*>$ -C true -l EASTL.TupleVector_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::tuple_vector(_alloc)?<.*>$ -e -F EASTL.TupleVector_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::TupleVecInternal::TupleVecImpl<.*>$ -C true -l EASTL.TupleVector_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::TupleVecInternal::TupleVecImpl<.*>$ -e -F EASTL.TupleVector_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::segmented_vector<.*>$ -C true -l EASTL.SegmentedVector_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::segmented_vector<.*>$ -e -F EASTL.SegmentedVector_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::optional<.*>$ -C true -l EASTL.Optional_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::optional<.*>$ -e -F EASTL.Optional_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::variant<.*>$ -C true -l EASTL.Variant_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::variant<.*>$ -e -F EASTL.Variant_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::tuple<.*>$ -C true -l EASTL.Tuple_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::tuple<.*>$ -e -F EASTL.Tuple_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::any$ -C true -l EASTL.Any_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::any$ -e -F EASTL.Any_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::basic_string_view<.*>$ -C true -l EASTL.basic_string_view_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::basic_string_view<.*>$ -e -F EASTL.basic_string_view_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type synthetic add -x ^eastl::lru_cache<.*>$ -C true -l EASTL.LruCache_SyntheticChildrenProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::lru_cache<.*>$ -e -F EASTL.LruCache_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
+    debugger.HandleCommand(
+        f"type summary add -x ^eastl::atomic<.*>$ -e -F EASTL.atomic_SummaryProvider -w {EASTL_TYPE_CATEGORY}"
+    )
     debugger.HandleCommand(f"type category enable {EASTL_TYPE_CATEGORY}")
+    debugger.HandleCommand('command container add -h "EASTL formatter commands" eastl')
+    debugger.HandleCommand(
+        'command script add -o -f EASTL.eastl_settings_command -h "Show or change EASTL formatter limits." eastl settings'
+    )
+    debugger.HandleCommand(
+        'command script add -o -f EASTL.eastl_find_command -h "Binary search a vector_map or vector_set for a key." eastl find'
+    )
@@ -0,0 +1,120 @@
+import re
+
+from formatters.layout import get_layout
+from formatters.utils import (
+    PointerFields,
+    find_type,
+    get_non_synthetic_value,
+    get_target_cache,
+    get_value_display,
+    read_value_bytes,
+)
+
+STATIC_SYNTHETIC_CHILDREN = {
+    "value": 0,
+}
+
+# m_handler points at the handler_func of the storage handler instantiated for the held type.
+_HANDLER_NAME = re.compile(r"^eastl::any::(internal|external)_storage_handler<(.+)>::handler_func\b")
+
+
+def _resolve_any_layout(layout):
+    storage = layout.offset("m_storage")
+    handler = layout.offset("m_handler")
+    if storage is None or handler is None:
+        return None
+    return {
+        # The first word of m_storage is external_storage, the heap pointer of values stored externally.
+        "header": PointerFields(layout.target, [storage, handler]),
+        "storage_offset": storage,
+    }
+
+
+def _lookup_handler(target, handler_addr):
+    address = target.ResolveLoadAddress(handler_addr)
+    function = address.GetFunction()
+    if function and function.IsValid():
+        name = function.GetName()
+    else:
+        symbol = address.GetSymbol()
+        name = symbol.GetName() if symbol and symbol.IsValid() else ""
+    match = _HANDLER_NAME.match(name or "")
+    if not match:
+        return None
+    value_type = find_type(target, match.group(2))
+    if not value_type or not value_type.IsValid():
+        return None
+    return (value_type, match.group(1) == "external")
+
+
+def resolve_any_handler(target, handler_addr):
+    """(held type, stored externally) for a storage handler address, resolved once per handler and target."""
+    handlers = get_target_cache(target).setdefault("any_handlers", {})
+    if handler_addr not in handlers:
+        handlers[handler_addr] = _lookup_handler(target, handler_addr)
+    return handlers[handler_addr]
+
+
+class Any_SyntheticChildrenProvider:
+    """eastl::any, with the held value as "value".
+
+    The held type is recovered from the symbol of m_handler once per handler, so a display is one read of the
+    storage pointer and handler followed by one typed child.
+    """
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.layout = None
+        self.handler = 0
+        self.held = None
+        self.external_addr = 0
+        self.fingerprint = None
+
+    def update(self):
+        self.handler = 0
+        self.held = None
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        self.layout = get_layout(self.valobj).fact("any", _resolve_any_layout)
+        if not self.layout:
+            return False
+        header = read_value_bytes(self.valobj, self.layout["header"].size)
+        if not header:
+            return False
+        self.external_addr, self.handler = self.layout["header"].unpack(header)
+        if self.handler:
+            self.held = resolve_any_handler(self.valobj.GetTarget(), self.handler)
+        # External values are address backed through the pointer, internal ones are children of the any itself.
+        self.fingerprint = (self.valobj.GetLoadAddress(), header)
+        return self.fingerprint == previous_fingerprint
+
+    def num_children(self):
+        return len(STATIC_SYNTHETIC_CHILDREN) if self.held else 0
+
+    def get_child_index(self, name):
+        return STATIC_SYNTHETIC_CHILDREN.get(name, -1)
+
+    def get_child_at_index(self, index):
+        if index != 0 or not self.held:
+            return None
+        value_type, is_external = self.held
+        if is_external:
+            if self.external_addr == 0:
+                return None
+            return self.valobj.CreateValueFromAddress("value", self.external_addr, value_type)
+        return self.valobj.CreateChildAtOffset("value", self.layout["storage_offset"], value_type)
+
+
+def Any_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = Any_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        if not provider.layout:
+            return ""
+        if not provider.handler:
+            return "empty"
+        if not provider.held:
+            return "?"
+        value = provider.get_child_at_index(0)
+        return f"({provider.held[0].GetDisplayTypeName()}) {get_value_display(value)}"
+    except Exception:
+        return ""
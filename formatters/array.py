@@ -1,11 +1,11 @@
-from formatters.constants import (
-    ARRAY_MAX_SIZE,
-    ARRAY_MAX_SUMMARY_SIZE,
-    TYPE_SIZE_T
-)
+from formatters.constants import TYPE_SIZE_T
+from formatters.layout import get_layout
+from formatters.paging import ChildRange, create_range_child
+from formatters.settings import get_setting
 from formatters.utils import (
     create_data_from_uint,
     find_type,
+    get_non_synthetic_value,
     get_value_display,
 )
 
@@ -13,62 +13,90 @@ STATIC_SYNTHETIC_CHILDREN = {
     "size": 0
 }
 
+def _resolve_array_layout(layout):
+    values = layout.member("mValue")
+    if not values:
+        return None
+    values_offset, values_type = values
+    element_type = values_type.GetArrayElementType()
+    element_size = element_type.GetByteSize() if element_type and element_type.IsValid() else 0
+    if element_size <= 0:
+        return (values_offset, element_type, 0, 0)
+    size = layout.template_integer_argument(1)
+    if size is None:
+        size = values_type.GetByteSize() // element_size
+    return (values_offset, element_type, element_size, size)
+
 class Array_SyntheticChildrenProvider:
     def __init__(self, valobj, internal_dict):
         self._valobj = valobj
+        self._size = 0
+        self._range = ChildRange(valobj, 0, get_setting("array-max-children"))
+        self._fingerprint = None
 
     def update(self):
-        self._values = self._valobj.GetChildMemberWithName("mValue")
-        self._size = self._calculate_size()
-        return False
+        self._size = 0
+        array_layout = get_layout(self._valobj).fact("array", _resolve_array_layout)
+        if array_layout:
+            self._values_offset, self._element_type, self._element_size, self._size = array_layout
+        self._range = ChildRange(self._valobj, self._size, get_setting("array-max-children"))
+        # Elements are children at fixed offsets, so only the object's own address and size can invalidate them.
+        fingerprint = (self._valobj.GetLoadAddress(), self._size) if array_layout else None
+        unchanged = fingerprint is not None and fingerprint == self._fingerprint
+        self._fingerprint = fingerprint
+        return unchanged
+
+    def _static_children(self):
+        return {} if self._range.is_group else STATIC_SYNTHETIC_CHILDREN
 
     def num_children(self):
-        return min(ARRAY_MAX_SIZE, self._size) + len(STATIC_SYNTHETIC_CHILDREN)
+        return self._range.num_children() + len(self._static_children())
 
     def get_child_index(self, name):
-        if name.startswith("[") and name.endswith("]"):
-            try:
-                return int(name.lstrip("[").rstrip("]")) + len(STATIC_SYNTHETIC_CHILDREN)
-            except Exception:
-                return -1
-        return STATIC_SYNTHETIC_CHILDREN.get(name, -1)
+        static_children = self._static_children()
+        if name in static_children:
+            return static_children[name]
+        index = self._range.child_index(name)
+        return index + len(static_children) if index >= 0 else -1
 
     def get_child_at_index(self, index):
         if index < 0 or index >= self.num_children():
             return None
-        if index == 0:
+        if index == 0 and not self._range.is_group:
             return self._create_size_child(self._size)
-        return self._create_element_child(index)
+        return self._create_element_child(index - len(self._static_children()))
 
     def _create_size_child(self, size):
         return self._valobj.CreateValueFromData(
             "size",
-            create_data_from_uint(self._size),
-            find_type(TYPE_SIZE_T)
+            create_data_from_uint(self._valobj.GetTarget(), self._size),
+            find_type(self._valobj.GetTarget(), TYPE_SIZE_T)
         )
     
-    def _create_element_child(self, index):
-        actual_index = index - len(STATIC_SYNTHETIC_CHILDREN)
-        value = self._values.GetChildAtIndex(actual_index)
-        if not value or not value.IsValid():
-            return None
-        return self._valobj.CreateValueFromData(
-            f"[{actual_index}]",
-            value.GetData(),
-            value.GetType(),
+    def _create_element_child(self, child_index):
+        if self._range.is_grouped:
+            return create_range_child(self._valobj, *self._range.group_bounds(child_index))
+        return self._create_element_value(self._range.element_index(child_index))
+
+    def _create_element_value(self, element_index):
+        return self._valobj.CreateChildAtOffset(
+            f"[{element_index}]",
+            self._values_offset + element_index * self._element_size,
+            self._element_type,
         )
-    
-    def _calculate_size(self):
-        return self._values.GetNumChildren() if self._values and self._values.IsValid() else 0
-        
+
 def Array_SummaryProvider(valobj, internal_dict):
-    size = valobj.GetChildAtIndex(STATIC_SYNTHETIC_CHILDREN.get("size")).GetValueAsUnsigned(0)
-    elems = [ 
-        get_value_display(valobj.GetChildAtIndex(i + len(STATIC_SYNTHETIC_CHILDREN))) 
-        for i in range(min(size, ARRAY_MAX_SUMMARY_SIZE))
+    provider = Array_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+    provider.update()
+    # A range group summarizes the elements it covers.
+    size = provider._range.count
+    summary_size = get_setting("array-summary-size")
+    elems = [
+        get_value_display(provider._create_element_value(provider._range.lo + i))
+        for i in range(min(size, summary_size))
     ]
-    if size > ARRAY_MAX_SUMMARY_SIZE:
+    if size > summary_size:
         elems.append("...")
     if not elems:
         return f"[{size}] {{}}"
-    return f"[{size}] {{ {', '.join(elems)} }}"
\ No newline at end of file
+    return f"[{size}] {{ {', '.join(elems)} }}"
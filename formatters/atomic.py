@@ -0,0 +1,58 @@
+import lldb
+
+from formatters.layout import get_layout, get_type_layout
+from formatters.utils import (
+    decode_integer,
+    get_non_synthetic_value,
+    get_value_display,
+    read_memory,
+)
+
+def _resolve_atomic_layout(layout):
+    found = layout.member("mAtomic")
+    if found:
+        offset, value_type = found
+        return (offset, value_type.GetByteSize(), value_type)
+    if layout.byte_size in (1, 2, 4, 8):
+        return (0, layout.byte_size, layout.template_argument_type(0))
+    return None
+
+
+def resolve_atomic_layout(target, atomic_type):
+    """(byte offset, byte size, value type) of the integer stored inside an eastl::atomic<T> type."""
+    layout = get_type_layout(target, atomic_type)
+    return layout.fact("atomic", _resolve_atomic_layout) if layout else None
+
+
+def is_signed_integer_type(sbtype):
+    return bool(sbtype and sbtype.IsValid() and sbtype.GetTypeFlags() & lldb.eTypeIsSigned)
+
+
+def read_atomic_value(process, address, layout):
+    """Reads the integer held by an eastl::atomic<T> at address with a single memory read."""
+    if not layout or address == 0:
+        return None
+    offset, byte_size, value_type = layout
+    raw = read_memory(process, address + offset, byte_size)
+    if len(raw) != byte_size:
+        return None
+    return decode_integer(raw, process.GetTarget(), is_signed_integer_type(value_type))
+
+
+def atomic_SummaryProvider(valobj, internal_dict):
+    try:
+        raw_valobj = get_non_synthetic_value(valobj)
+        layout = get_layout(raw_valobj).fact("atomic", _resolve_atomic_layout)
+        if not layout:
+            return ""
+        offset, byte_size, value_type = layout
+        address = raw_valobj.GetLoadAddress()
+        type_flags = value_type.GetTypeFlags() if value_type and value_type.IsValid() else 0
+        # Single byte integers (bool, char, int8_t) keep LLDB's own character/boolean formatting.
+        if address != lldb.LLDB_INVALID_ADDRESS and type_flags & lldb.eTypeIsInteger and byte_size > 1:
+            value = read_atomic_value(raw_valobj.GetProcess(), address, layout)
+            if value is not None:
+                return str(value)
+        return get_value_display(raw_valobj.CreateChildAtOffset("value", offset, value_type))
+    except Exception:
+        return ""
@@ -0,0 +1,234 @@
+import lldb
+
+from formatters.constants import TYPE_SIZE_T
+from formatters.layout import get_layout
+from formatters.paging import ChildRange, create_range_child
+from formatters.settings import get_setting
+from formatters.utils import (
+    PointerFields,
+    create_data_from_uint,
+    decode_field,
+    find_type,
+    get_non_synthetic_value,
+    read_memory,
+    read_value_bytes,
+)
+
+try:
+    import numpy
+except ImportError:
+    # LLDB's embedded Python often has no NumPy; Python integers do the same word level work a bit slower.
+    numpy = None
+
+STATIC_SYNTHETIC_CHILDREN = {
+    "size": 0,
+    "count": 1,
+}
+
+
+def _resolve_bitset_layout(layout):
+    words = layout.member("mWord")
+    if words:
+        # bitset<N, WordType>: word_type mWord[NW] stored inline.
+        offset, array_type = words
+        word_size = array_type.GetArrayElementType().GetByteSize()
+        size = layout.template_integer_argument(0)
+        return {
+            "is_vector": False,
+            "words_offset": offset,
+            "words_size": array_type.GetByteSize(),
+            "word_size": word_size,
+            "size": size if size is not None else array_type.GetByteSize() * 8,
+        }
+    # bitvector: the words live in mContainer (a vector) and mFreeBitCount bits of the last one are unused.
+    begin_type = layout.member_type("mContainer.mpBegin")
+    offsets = [layout.offset("mContainer.mpBegin"), layout.offset("mContainer.mpEnd")]
+    free_bits = layout.member("mFreeBitCount")
+    if not begin_type or None in offsets or not free_bits:
+        return None
+    free_bits_offset, free_bits_type = free_bits
+    return {
+        "is_vector": True,
+        "pointers": PointerFields(layout.target, offsets),
+        "free_bits_offset": free_bits_offset,
+        "free_bits_size": free_bits_type.GetByteSize(),
+        "header_end": max(
+            max(offsets) + layout.target.GetAddressByteSize(), free_bits_offset + free_bits_type.GetByteSize()
+        ),
+        "word_size": begin_type.GetPointeeType().GetByteSize(),
+    }
+
+
+class BitWords:
+    """Bits [lo, hi) of a bitset decoded at word level from the raw words holding them.
+
+    Bit i is bit i % W of word i / W. The words are turned into one little endian bit string, either a NumPy bit
+    array or a Python integer, so counting and finding set bits never touch individual bits in Python. Indices
+    passed to the methods are bitset indices.
+    """
+
+    def __init__(self, raw, word_size, lo, hi, big_endian):
+        if big_endian and word_size > 1:
+            raw = b"".join(raw[i:i + word_size][::-1] for i in range(0, len(raw), word_size))
+        base = lo - lo % (word_size * 8)
+        self.lo = lo
+        self.hi = max(lo, min(hi, base + len(raw) * 8))
+        if numpy is not None:
+            bits = numpy.unpackbits(numpy.frombuffer(raw, dtype=numpy.uint8), bitorder="little")
+            self._bits = bits[lo - base:self.hi - base]
+            self._value = None
+        else:
+            self._bits = None
+            self._value = int.from_bytes(raw, "little") >> (lo - base) & ((1 << (self.hi - lo)) - 1)
+
+    def _clamp(self, lo, hi):
+        return max(lo, self.lo) - self.lo, min(hi, self.hi) - self.lo
+
+    def count(self, lo, hi):
+        lo, hi = self._clamp(lo, hi)
+        if hi <= lo:
+            return 0
+        if self._bits is not None:
+            return int(numpy.count_nonzero(self._bits[lo:hi]))
+        return bin(self._value >> lo & ((1 << (hi - lo)) - 1)).count("1")
+
+    def set_positions(self, lo, hi, limit):
+        """Indices of the first limit set bits in [lo, hi)."""
+        lo, hi = self._clamp(lo, hi)
+        if hi <= lo or limit <= 0:
+            return []
+        if self._bits is not None:
+            return [self.lo + lo + int(i) for i in numpy.flatnonzero(self._bits[lo:hi])[:limit]]
+        positions = []
+        value = self._value >> lo & ((1 << (hi - lo)) - 1)
+        while value and len(positions) < limit:
+            lowest = value & -value
+            positions.append(self.lo + lo + lowest.bit_length() - 1)
+            value ^= lowest
+        return positions
+
+    def test(self, index):
+        index -= self.lo
+        if self._bits is not None:
+            return bool(self._bits[index])
+        return bool(self._value >> index & 1)
+
+
+class Bitset_SyntheticChildrenProvider:
+    """eastl::bitset and eastl::bitvector.
+
+    Only the words holding the bits of the value (or of the range group it is) are fetched, with one read per
+    update(), and they are decoded at word level, so count and every bit child come from the same bytes. Children
+    are paged over the bits with range groups like vector elements.
+    """
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.layout = None
+        self.bits = None
+        self.size = 0
+        self.range = ChildRange(valobj, 0, get_setting("bitset-max-children"))
+        # The raw words of the previous update(); every child is data backed and derives from them.
+        self.fingerprint = None
+
+    def _static_children(self):
+        return {} if self.range.is_group else STATIC_SYNTHETIC_CHILDREN
+
+    def _read_size(self):
+        """(size in bits, address of the first word or None for inline words), or None."""
+        if not self.layout["is_vector"]:
+            return self.layout["size"], None
+        header = read_value_bytes(self.valobj, self.layout["header_end"])
+        if not header:
+            return None
+        begin, end = self.layout["pointers"].unpack(header)
+        free_bits = decode_field(
+            header, self.layout["free_bits_offset"], self.layout["free_bits_size"], self.valobj.GetTarget()
+        )
+        if end < begin or free_bits > (end - begin) * 8:
+            return None
+        return (end - begin) * 8 - free_bits, begin
+
+    def _read_words(self, words_addr, first_word, word_count):
+        byte_offset = first_word * self.layout["word_size"]
+        byte_count = word_count * self.layout["word_size"]
+        if words_addr is None:
+            return read_value_bytes(self.valobj, byte_count, self.layout["words_offset"] + byte_offset)
+        return read_memory(self.valobj.GetProcess(), words_addr + byte_offset, byte_count)
+
+    def update(self):
+        self.bits = None
+        self.size = 0
+        self.range = ChildRange(self.valobj, 0, get_setting("bitset-max-children"))
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        self.layout = get_layout(self.valobj).fact("bitset", _resolve_bitset_layout)
+        if not self.layout or self.layout["word_size"] <= 0:
+            return False
+        size = self._read_size()
+        if not size:
+            return False
+        self.size, words_addr = size
+        self.range = ChildRange(self.valobj, self.size, get_setting("bitset-max-children"))
+        word_bits = self.layout["word_size"] * 8
+        first_word = self.range.lo // word_bits
+        word_count = (self.range.hi + word_bits - 1) // word_bits - first_word
+        raw = self._read_words(words_addr, first_word, word_count)
+        if len(raw) != word_count * self.layout["word_size"]:
+            return False
+        big_endian = self.valobj.GetTarget().GetByteOrder() == lldb.eByteOrderBig
+        self.bits = BitWords(raw, self.layout["word_size"], self.range.lo, self.range.hi, big_endian)
+        self.fingerprint = (raw, self.size, words_addr)
+        return self.fingerprint == previous_fingerprint
+
+    def _create_count_child(self, name, value):
+        return self.valobj.CreateValueFromData(
+            name,
+            create_data_from_uint(self.valobj.GetTarget(), value),
+            find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
+        )
+
+    def num_children(self):
+        return self.range.num_children() + len(self._static_children())
+
+    def get_child_index(self, name):
+        static_children = self._static_children()
+        if name in static_children:
+            return static_children[name]
+        index = self.range.child_index(name)
+        return index + len(static_children) if index >= 0 else -1
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children() or self.bits is None:
+            return None
+        if not self.range.is_group:
+            if index == 0:
+                return self._create_count_child("size", self.size)
+            if index == 1:
+                return self._create_count_child("count", self.bits.count(0, self.size))
+        child_index = index - len(self._static_children())
+        if self.range.is_grouped:
+            return create_range_child(self.valobj, *self.range.group_bounds(child_index))
+        bit = self.range.element_index(child_index)
+        return self.valobj.CreateValueFromData(
+            f"[{bit}]",
+            create_data_from_uint(self.valobj.GetTarget(), 1 if self.bits.test(bit) else 0, 1),
+            find_type(self.valobj.GetTarget(), "bool"),
+        )
+
+
+def Bitset_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = Bitset_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        if provider.bits is None:
+            return ""
+        # A range group summarizes the bits it covers.
+        lo, hi = provider.range.lo, provider.range.hi
+        count = provider.bits.count(lo, hi)
+        summary_size = get_setting("bitset-summary-size")
+        positions = [str(position) for position in provider.bits.set_positions(lo, hi, summary_size)]
+        if count > summary_size:
+            positions.append("...")
+        return f"[{hi - lo} bits, {count} set] {{{', '.join(positions)}}}"
+    except Exception:
+        return ""
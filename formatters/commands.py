@@ -0,0 +1,82 @@
+import shlex
+
+from formatters.settings import SETTINGS, get_setting, reset_setting, set_setting
+from formatters.utils import get_non_synthetic_value
+from formatters.vector_map import find_sorted_vector_key, format_find_result
+
+SETTINGS_USAGE = """\
+eastl settings                      show every setting
+eastl settings show [<name>]        show one or every setting
+eastl settings set <name> <value>   change a setting for the rest of the session
+eastl settings reset [<name>]       restore one or every setting to its default"""
+
+FIND_USAGE = "eastl find <variable> <key>"
+
+
+def _format_setting(name):
+    default, description = SETTINGS[name]
+    value = get_setting(name)
+    suffix = "" if value == default else f" (default {default})"
+    return f"{name} = {value}{suffix}  -- {description}"
+
+
+def _refresh_formatters(debugger, category):
+    # Toggling the category bumps LLDB's formatter revision, so values drop their synthetic children and are
+    # formatted again with the new limits instead of reusing children cached under the old ones.
+    debugger.HandleCommand(f"type category disable {category}")
+    debugger.HandleCommand(f"type category enable {category}")
+
+
+def run_settings_command(debugger, command, result, category):
+    try:
+        args = shlex.split(command)
+    except ValueError as e:
+        result.SetError(str(e))
+        return
+    action = args[0] if args else "show"
+    try:
+        if action == "show" and len(args) <= 2:
+            names = args[1:] or sorted(SETTINGS)
+            result.AppendMessage("\n".join(_format_setting(name) for name in names))
+        elif action == "set" and len(args) == 3:
+            set_setting(args[1], args[2])
+            _refresh_formatters(debugger, category)
+            result.AppendMessage(_format_setting(args[1]))
+        elif action == "reset" and len(args) <= 2:
+            reset_setting(args[1] if len(args) == 2 else None)
+            _refresh_formatters(debugger, category)
+        else:
+            result.SetError(f"usage:\n{SETTINGS_USAGE}")
+    except KeyError as e:
+        result.SetError(f"unknown setting {e}, expected one of: {', '.join(sorted(SETTINGS))}")
+    except ValueError as e:
+        result.SetError(str(e))
+
+
+def run_find_command(exe_ctx, command, result):
+    """Looks a key up in a vector_map/vector_set of the selected frame with a binary search over raw key reads."""
+    try:
+        args = shlex.split(command)
+    except ValueError as e:
+        result.SetError(str(e))
+        return
+    if len(args) != 2:
+        result.SetError(f"usage: {FIND_USAGE}")
+        return
+    name, key_text = args
+    frame = exe_ctx.GetFrame()
+    if not frame or not frame.IsValid():
+        result.SetError("no selected frame")
+        return
+    valobj = frame.GetValueForVariablePath(name)
+    if not valobj or not valobj.IsValid():
+        valobj = frame.EvaluateExpression(name)
+    if not valobj or not valobj.IsValid() or valobj.GetError().Fail():
+        result.SetError(f"cannot find variable {name}")
+        return
+    try:
+        found = find_sorted_vector_key(get_non_synthetic_value(valobj), key_text)
+    except ValueError as e:
+        result.SetError(str(e))
+        return
+    result.AppendMessage(format_find_result(name, key_text, found))
@@ -6,9 +6,42 @@ VECTOR_MAX_SUMMARY_SIZE = 6
 ARRAY_MAX_SIZE = 500
 ARRAY_MAX_SUMMARY_SIZE = 6
 
+DEQUE_MAX_SIZE = 500
+DEQUE_MAX_SUMMARY_SIZE = 6
+
 SPAN_MAX_SIZE = 500
+SPAN_MAX_SUMMARY_SIZE = 6
+
+RING_BUFFER_MAX_SIZE = 500
+RING_BUFFER_MAX_SUMMARY_SIZE = 6
+
+TUPLE_VECTOR_MAX_SIZE = 500
+TUPLE_VECTOR_MAX_SUMMARY_SIZE = 6
+
+SEGMENTED_VECTOR_MAX_SIZE = 500
+SEGMENTED_VECTOR_MAX_SUMMARY_SIZE = 6
+
+LRU_CACHE_MAX_SIZE = 500
+LRU_CACHE_MAX_SUMMARY_SIZE = 6
+
+BITSET_MAX_SIZE = 500
+# Set bit positions listed in a bitset summary.
+BITSET_MAX_SUMMARY_SIZE = 6
+
 STRING_MAX_SIZE = 500
+STRING_MAX_SUMMARY_SIZE = 256
+STRING_CHUNK_SIZE = 4096
 TREE_MAX_SIZE = 500
+HASH_MAX_SIZE = 500
+LIST_MAX_SIZE = 500
+# Bucket heads fetched per memory read while scanning a hash table.
+HASH_BUCKET_CHUNK_SIZE = 1024
+
+# Entries listed by `eastl find` for a key of a vector_multimap/vector_multiset.
+VECTOR_MAP_FIND_MAX_MATCHES = 20
+
+# Wall clock budget of a provider walking a container, 0 for no limit. See `eastl settings`.
+PROVIDER_TIME_BUDGET_MS = 0
 
 TYPE_SIZE_T = "eastl_size_t"
 
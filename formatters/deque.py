@@ -0,0 +1,186 @@
+import struct
+
+import lldb
+
+from formatters.constants import TYPE_SIZE_T
+from formatters.layout import get_layout
+from formatters.paging import ChildRange, create_range_child
+from formatters.settings import get_setting
+from formatters.utils import (
+    PointerFields,
+    create_data_from_uint,
+    decode_field,
+    find_type,
+    format_sequence_summary,
+    get_non_synthetic_value,
+    get_value_display,
+    read_memory,
+    read_value_bytes,
+)
+
+HEADER_FIELDS = (
+    "mpPtrArray",
+    "mItBegin.mpCurrent",
+    "mItBegin.mpBegin",
+    "mItBegin.mpEnd",
+    "mItBegin.mpCurrentArrayPtr",
+    "mItEnd.mpCurrent",
+    "mItEnd.mpBegin",
+    "mItEnd.mpCurrentArrayPtr",
+)
+
+
+def _resolve_deque_layout(layout):
+    offsets = [layout.offset(path) for path in HEADER_FIELDS]
+    current_type = layout.member_type("mItBegin.mpCurrent")
+    if None in offsets or not current_type:
+        return None
+    value_type = current_type.GetPointeeType()
+    value_size = value_type.GetByteSize()
+    if value_size <= 0:
+        return None
+    pointer_size = layout.target.GetAddressByteSize()
+    pointer_code = "Q" if pointer_size == 8 else "I"
+    header = PointerFields(layout.target, offsets)
+    # mnPtrArraySize bounds the pointer table, so a corrupted iterator cannot make it arbitrarily long.
+    table_size = layout.member("mnPtrArraySize")
+    return {
+        "header": header,
+        "header_size": max(header.size, table_size[0] + table_size[1].GetByteSize() if table_size else 0),
+        "table_size": (table_size[0], table_size[1].GetByteSize()) if table_size else None,
+        "value_type": value_type,
+        "value_size": value_size,
+        # deque<T, Allocator, kDequeSubarraySize>; when the argument is missing it is recovered from an iterator.
+        "subarray_size": layout.template_integer_argument(2),
+        "pointer_format": (">" if layout.target.GetByteOrder() == lldb.eByteOrderBig else "<") + pointer_code,
+    }
+
+
+class Deque_SyntheticChildrenProvider:
+    """eastl::deque, with every element address computed from mItBegin and the subarray pointer table in O(1)."""
+
+    STATIC_SYNTHETIC_CHILDREN = {
+        "size": 0,
+    }
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.size = 0
+        self.layout = None
+        self.range = ChildRange(valobj, 0, get_setting("deque-max-children"))
+        # Subarray pointers from mItBegin.mpCurrentArrayPtr to mItEnd.mpCurrentArrayPtr, read once per update().
+        self.subarrays = None
+        self.fingerprint = None
+
+    def _static_children(self):
+        return {} if self.range.is_group else self.STATIC_SYNTHETIC_CHILDREN
+
+    def update(self):
+        self.size = 0
+        self.subarrays = None
+        self.range = ChildRange(self.valobj, 0, get_setting("deque-max-children"))
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        self.layout = get_layout(self.valobj).fact("deque", _resolve_deque_layout)
+        if not self.layout:
+            return False
+        header = read_value_bytes(self.valobj, self.layout["header_size"])
+        if not header:
+            return False
+        (
+            ptr_array,
+            begin_current,
+            begin_first,
+            begin_last,
+            self.begin_array_ptr,
+            end_current,
+            end_first,
+            self.end_array_ptr,
+        ) = self.layout["header"].unpack(header)
+        value_size = self.layout["value_size"]
+        pointer_size = self.valobj.GetTarget().GetAddressByteSize()
+        self.subarray_size = self.layout["subarray_size"] or (begin_last - begin_first) // value_size
+        if self.subarray_size <= 0:
+            return False
+        if self.end_array_ptr < self.begin_array_ptr or begin_current < begin_first or end_current < end_first:
+            return False
+        if self.layout["table_size"]:
+            table_size = decode_field(header, *self.layout["table_size"], self.valobj.GetTarget())
+            if self.begin_array_ptr < ptr_array or self.end_array_ptr >= ptr_array + table_size * pointer_size:
+                return False
+        self.begin_offset = (begin_current - begin_first) // value_size
+        subarray_span = (self.end_array_ptr - self.begin_array_ptr) // pointer_size
+        self.size = max(0, subarray_span * self.subarray_size + (end_current - end_first) // value_size - self.begin_offset)
+        self.range = ChildRange(self.valobj, self.size, get_setting("deque-max-children"))
+        # Elements are address backed and the used part of the pointer table only moves with the iterators.
+        self.fingerprint = header
+        return header == previous_fingerprint
+
+    def _get_subarrays(self):
+        if self.subarrays is None:
+            pointer_format = self.layout["pointer_format"]
+            pointer_size = struct.calcsize(pointer_format)
+            # The table is never read past the subarrays the size reaches, however far mItEnd points.
+            count = min(
+                (self.end_array_ptr - self.begin_array_ptr) // pointer_size + 1,
+                (self.begin_offset + self.size) // self.subarray_size + 1,
+            )
+            raw = read_memory(self.valobj.GetProcess(), self.begin_array_ptr, count * pointer_size)
+            if len(raw) == count * pointer_size:
+                self.subarrays = struct.unpack(f"{pointer_format[0]}{count}{pointer_format[1]}", raw)
+            else:
+                self.subarrays = ()
+        return self.subarrays
+
+    def _element_address(self, index):
+        position = self.begin_offset + index
+        subarray, slot = divmod(position, self.subarray_size)
+        subarrays = self._get_subarrays()
+        if subarray >= len(subarrays) or subarrays[subarray] == 0:
+            return 0
+        return subarrays[subarray] + slot * self.layout["value_size"]
+
+    def _build_element_child(self, index):
+        address = self._element_address(index) if 0 <= index < self.size else 0
+        if address == 0:
+            return None
+        return self.valobj.CreateValueFromAddress(f"[{index}]", address, self.layout["value_type"])
+
+    def num_children(self):
+        return self.range.num_children() + len(self._static_children())
+
+    def get_child_index(self, name):
+        static_children = self._static_children()
+        if name in static_children:
+            return static_children[name]
+        index = self.range.child_index(name)
+        return index + len(static_children) if index >= 0 else -1
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children():
+            return None
+        if index == 0 and not self.range.is_group:
+            return self.valobj.CreateValueFromData(
+                "size",
+                create_data_from_uint(self.valobj.GetTarget(), self.size),
+                find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
+            )
+        child_index = index - len(self._static_children())
+        if self.range.is_grouped:
+            return create_range_child(self.valobj, *self.range.group_bounds(child_index))
+        return self._build_element_child(self.range.element_index(child_index))
+
+
+def Deque_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = Deque_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        # A range group summarizes the elements it covers.
+        size = provider.range.count
+        summary_size = get_setting("deque-summary-size")
+        preview = [
+            get_value_display(provider._build_element_child(provider.range.lo + index))
+            for index in range(min(size, summary_size))
+        ]
+        return format_sequence_summary(size, preview, truncated=size > summary_size)
+    except Exception:
+        return ""
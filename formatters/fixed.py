@@ -0,0 +1,255 @@
+from formatters.hash_table import HashTable_SyntheticChildrenProvider, get_hashtable_summary
+from formatters.layout import get_layout, has_load_address
+from formatters.linked_list import List_SyntheticChildrenProvider, get_list_summary
+from formatters.paging import parse_range_name
+from formatters.settings import Deadline
+from formatters.string import basic_string_SyntheticChildrenProvider, get_string_summary
+from formatters.tree import RBTree_SyntheticChildrenProvider, get_tree_summary
+from formatters.utils import (
+    PointerFields,
+    create_data_from_uint,
+    create_message_child,
+    find_type,
+    get_non_synthetic_value,
+    read_memory,
+)
+from formatters.vector import VectorBase_SyntheticChildrenProvider, get_vector_summary
+
+
+# Candidate paths of the fixed_pool_base of a fixed_node_allocator inside the container, by container base class.
+_POOL_PATHS = ("mNodeAllocator.mPool", "mNodeAllocator.mSecond.mPool", "mAllocator.mPool", "mSizeAllocator.mSecond.mPool")
+
+
+def _resolve_buffer_layout(layout):
+    """(offset, size) of the inline storage of a fixed container and, for fixed hash tables, of its buckets, plus
+    the offsets of the mpNext and mpCapacity pointers of its node pool."""
+    nodes = layout.member("mBuffer") or layout.member("mNodeBuffer")
+    buckets = layout.member("mBucketBuffer")
+    pool = None
+    for path in _POOL_PATHS:
+        offsets = [layout.offset(f"{path}.{name}") for name in ("mpNext", "mpCapacity")]
+        if None not in offsets:
+            pool = (min(offsets), PointerFields(layout.target, [offset - min(offsets) for offset in offsets]))
+            break
+    return {
+        "nodes": (nodes[0], nodes[1].GetByteSize()) if nodes else None,
+        "buckets": (buckets[0], buckets[1].GetByteSize()) if buckets else None,
+        "pool": pool,
+    }
+
+
+def _walk_indexed_nodes(provider):
+    provider._get_node_addr(provider.size - 1)
+    return provider.node_addrs
+
+
+def _walk_list_nodes(provider):
+    provider._walk_to(provider.size - 1)
+    return provider.node_addrs
+
+
+def _tree_node_size_bound(provider):
+    value_type = provider.value_type
+    return provider.value_offset + (value_type.GetByteSize() if value_type and value_type.IsValid() else 0)
+
+
+def _layout_node_size_bound(provider):
+    layout = provider.layout
+    return layout["value_offset"] + layout["value_type"].GetByteSize() if layout else 0
+
+
+class _FixedContainerProvider:
+    """Wraps the provider of the matching non-fixed container and adds an "overflowed" child that tells whether
+    the container has spilled out of its inline buffer into the overflow allocator.
+
+    The flag is only worked out once the child is requested, and is then recomputed by update() like the element
+    windows of vector; summaries use the constant cost _overflow_bound() alone.
+    """
+
+    BASE_PROVIDER = None
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.base = self.BASE_PROVIDER(valobj, internal_dict)
+        self.overflowed = None
+        self._has_overflow_child = False
+        self._overflow_materialized = False
+        # Range groups of a fixed_vector are copies of it; the flag belongs on the container itself only.
+        self._show_overflow = parse_range_name(valobj.GetName()) is None
+
+    def _buffer_layout(self):
+        return get_layout(self.valobj).fact("fixed_buffer", _resolve_buffer_layout)
+
+    def _buffer_range(self, kind):
+        buffer = self._buffer_layout()[kind]
+        if not buffer or not has_load_address(self.valobj):
+            return None
+        start = self.valobj.GetLoadAddress() + buffer[0]
+        return (start, start + buffer[1])
+
+    def _overflow_bound(self):
+        """True/False when the already read header tells whether the container overflowed, otherwise None."""
+        return None
+
+    def _compute_overflow(self):
+        """True/False, or None when it cannot be told (e.g. a node walk stopped early)."""
+        return self._overflow_bound()
+
+    def update(self):
+        unchanged = self.base.update()
+        # The overflowed child is data backed, so a change of the flag invalidates the cached children too; it is
+        # only recomputed when it was shown before.
+        previous = (self._has_overflow_child, self.overflowed)
+        self._has_overflow_child = self._show_overflow and self._buffer_range("nodes") is not None
+        self.overflowed = None
+        if not self._has_overflow_child:
+            self._overflow_materialized = False
+        elif self._overflow_materialized:
+            self.overflowed = self._compute_overflow()
+        return unchanged and (self._has_overflow_child, self.overflowed) == previous
+
+    def num_children(self):
+        return self.base.num_children() + (1 if self._has_overflow_child else 0)
+
+    def get_child_index(self, name):
+        if name == "overflowed" and self._has_overflow_child:
+            return self.base.num_children()
+        return self.base.get_child_index(name)
+
+    def get_child_at_index(self, index):
+        if self._has_overflow_child and index == self.base.num_children():
+            if not self._overflow_materialized:
+                self.overflowed = self._compute_overflow()
+                self._overflow_materialized = True
+            if self.overflowed is None:
+                return create_message_child(self.valobj, "overflowed", "unknown")
+            return self.valobj.CreateValueFromData(
+                "overflowed",
+                create_data_from_uint(self.valobj.GetTarget(), 1 if self.overflowed else 0, 1),
+                find_type(self.valobj.GetTarget(), "bool"),
+            )
+        return self.base.get_child_at_index(index)
+
+
+class _FixedNodeContainerProvider(_FixedContainerProvider):
+    """Node based fixed containers overflow when any node lives outside the node buffer.
+
+    The buffer holds at most buffer size / NODE_SIZE_BOUND nodes, so larger containers have overflowed for sure, and
+    a node pool that still has fresh nodes left has never fallen back to the overflow allocator. Otherwise the (at
+    most that many) nodes returned by WALK_NODES are checked one by one.
+    """
+
+    WALK_NODES = None
+    NODE_SIZE_BOUND = None
+
+    def _pool_exhausted(self):
+        """Whether the node pool ran out of fresh nodes (mpNext == mpCapacity), or None when it cannot be read."""
+        pool = self._buffer_layout()["pool"]
+        if not pool or not has_load_address(self.valobj):
+            return None
+        offset, fields = pool
+        raw = read_memory(self.valobj.GetProcess(), self.valobj.GetLoadAddress() + offset, fields.size)
+        if len(raw) != fields.size:
+            return None
+        next_addr, capacity_addr = fields.unpack(raw)
+        return next_addr == capacity_addr
+
+    def _overflow_bound(self):
+        buffer = self._buffer_range("nodes")
+        if not buffer:
+            return None
+        if self.base.size == 0:
+            return False
+        if self.base.size > (buffer[1] - buffer[0]) // max(1, self.NODE_SIZE_BOUND(self.base)):
+            return True
+        # The pool hands out fresh nodes up to mpCapacity and only then falls back to the overflow allocator.
+        return False if self._pool_exhausted() is False else None
+
+    def _compute_overflow(self):
+        bound = self._overflow_bound()
+        buffer = self._buffer_range("nodes")
+        if bound is not None or not buffer:
+            return bound
+        self.base.deadline = Deadline()
+        node_addrs = self.WALK_NODES(self.base)
+        outside = any(not buffer[0] <= addr < buffer[1] for addr in node_addrs)
+        if len(node_addrs) < self.base.size:
+            # The walk stopped early (time budget or a corrupted chain): only a node seen outside counts.
+            return outside or None
+        return outside
+
+
+class FixedVector_SyntheticChildrenProvider(_FixedContainerProvider):
+    BASE_PROVIDER = VectorBase_SyntheticChildrenProvider
+
+    def _overflow_bound(self):
+        buffer = self._buffer_range("nodes")
+        if not buffer:
+            return None
+        return self.base._capacity > 0 and not buffer[0] <= self.base._begin_addr < buffer[1]
+
+
+class FixedString_SyntheticChildrenProvider(_FixedContainerProvider):
+    BASE_PROVIDER = basic_string_SyntheticChildrenProvider
+
+    def _overflow_bound(self):
+        buffer = self._buffer_range("nodes")
+        if not buffer or not self.base._valid_layout:
+            return None
+        return self.base._is_heap and not buffer[0] <= self.base._data_address < buffer[1]
+
+
+class FixedTree_SyntheticChildrenProvider(_FixedNodeContainerProvider):
+    BASE_PROVIDER = RBTree_SyntheticChildrenProvider
+    WALK_NODES = staticmethod(_walk_indexed_nodes)
+    NODE_SIZE_BOUND = staticmethod(_tree_node_size_bound)
+
+
+class FixedHashTable_SyntheticChildrenProvider(_FixedNodeContainerProvider):
+    BASE_PROVIDER = HashTable_SyntheticChildrenProvider
+    WALK_NODES = staticmethod(_walk_indexed_nodes)
+    NODE_SIZE_BOUND = staticmethod(_layout_node_size_bound)
+
+    def _overflow_bound(self):
+        if not self.base.layout:
+            return None
+        buckets = self._buffer_range("buckets")
+        if buckets and not buckets[0] <= self.base.bucket_array < buckets[1]:
+            return True
+        return super()._overflow_bound()
+
+
+class FixedList_SyntheticChildrenProvider(_FixedNodeContainerProvider):
+    BASE_PROVIDER = List_SyntheticChildrenProvider
+    WALK_NODES = staticmethod(_walk_list_nodes)
+    NODE_SIZE_BOUND = staticmethod(_layout_node_size_bound)
+
+
+def _fixed_summary(provider_class, summarize, valobj, internal_dict):
+    try:
+        provider = provider_class(get_non_synthetic_value(valobj), internal_dict)
+        # summarize updates the wrapped provider; the flag comes from the same header, never from a node walk.
+        summary = summarize(provider.base)
+        return f"{summary} (overflowed)" if provider._overflow_bound() else summary
+    except Exception:
+        return ""
+
+
+def FixedVector_SummaryProvider(valobj, internal_dict):
+    return _fixed_summary(FixedVector_SyntheticChildrenProvider, get_vector_summary, valobj, internal_dict)
+
+
+def FixedString_SummaryProvider(valobj, internal_dict):
+    return _fixed_summary(FixedString_SyntheticChildrenProvider, get_string_summary, valobj, internal_dict)
+
+
+def FixedTree_SummaryProvider(valobj, internal_dict):
+    return _fixed_summary(FixedTree_SyntheticChildrenProvider, get_tree_summary, valobj, internal_dict)
+
+
+def FixedHashTable_SummaryProvider(valobj, internal_dict):
+    return _fixed_summary(FixedHashTable_SyntheticChildrenProvider, get_hashtable_summary, valobj, internal_dict)
+
+
+def FixedList_SummaryProvider(valobj, internal_dict):
+    return _fixed_summary(FixedList_SyntheticChildrenProvider, get_list_summary, valobj, internal_dict)
@@ -0,0 +1,227 @@
+import struct
+from collections import deque
+
+import lldb
+
+from formatters.constants import HASH_BUCKET_CHUNK_SIZE, TYPE_SIZE_T
+from formatters.layout import get_layout, get_type_layout
+from formatters.settings import Deadline, get_setting
+from formatters.utils import (
+    create_data_from_uint,
+    create_message_child,
+    decode_field,
+    decode_integer,
+    find_type,
+    format_sequence_summary,
+    get_non_synthetic_value,
+    get_value_display,
+    read_memory,
+    read_value_bytes,
+)
+
+
+def get_bucket_chunk_struct(target):
+    """Decodes HASH_BUCKET_CHUNK_SIZE bucket head pointers from one read."""
+    pointer_code = "Q" if target.GetAddressByteSize() == 8 else "I"
+    byte_order = ">" if target.GetByteOrder() == lldb.eByteOrderBig else "<"
+    return struct.Struct(f"{byte_order}{HASH_BUCKET_CHUNK_SIZE}{pointer_code}")
+
+
+def _resolve_hashtable_layout(layout):
+    bucket_array = layout.member("mpBucketArray")
+    bucket_count = layout.member("mnBucketCount")
+    element_count = layout.member("mnElementCount")
+    if not bucket_array or not bucket_count or not element_count:
+        return None
+    # mpBucketArray is a node_type**; the node holds mValue followed by mpNext (and maybe a cached hash code).
+    node_type = bucket_array[1].GetPointeeType().GetPointeeType()
+    node_layout = get_type_layout(layout.target, node_type)
+    value = node_layout.member("mValue") if node_layout else None
+    next_offset = node_layout.offset("mpNext") if node_layout else None
+    if not value or next_offset is None:
+        return None
+    members = (bucket_array, bucket_count, element_count)
+    return {
+        "header_size": max(offset + member_type.GetByteSize() for offset, member_type in members),
+        "bucket_array_offset": bucket_array[0],
+        "bucket_count_offset": bucket_count[0],
+        "bucket_count_size": bucket_count[1].GetByteSize(),
+        "element_count_offset": element_count[0],
+        "element_count_size": element_count[1].GetByteSize(),
+        "bucket_chunk": get_bucket_chunk_struct(layout.target),
+        "value_offset": value[0],
+        "value_type": value[1],
+        "next_offset": next_offset,
+    }
+
+
+class HashTable_SyntheticChildrenProvider:
+    """hash_map/hash_set and their multi variants.
+
+    The bucket array is scanned in chunks of HASH_BUCKET_CHUNK_SIZE pointers with one read each, empty buckets are
+    skipped in Python, and only the chains of non-empty buckets are followed, one raw read per node. The scan stops
+    as soon as the requested child is found, so the cost follows the number of elements shown rather than the
+    bucket count or the size.
+    """
+
+    STATIC_CHILD_NAMES = ("size",)
+    STATIC_CHILD_INDEX = {name: idx for idx, name in enumerate(STATIC_CHILD_NAMES)}
+    STATIC_CHILD_COUNT = len(STATIC_CHILD_NAMES)
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.size = 0
+        self.layout = None
+        self.bucket_array = 0
+        self.bucket_count = 0
+        # Node addresses in iteration order, discovered lazily up to the highest index requested.
+        self.node_addrs = []
+        self.deadline = Deadline()
+        # Header bytes and walked node addresses seen by the previous update().
+        self.fingerprint = None
+        self._reset_scan()
+
+    def _reset_scan(self):
+        self.node_addrs = []
+        self._next_bucket = 0
+        self._bucket_heads = deque()
+        self._chain_node = 0
+
+    def _resolve_layout(self):
+        return get_layout(self.valobj).fact("hashtable", _resolve_hashtable_layout)
+
+    def _decode_header(self, header):
+        """Sets bucket_array, bucket_count and size from the header bytes."""
+        target = self.valobj.GetTarget()
+        self.bucket_array = decode_field(
+            header, self.layout["bucket_array_offset"], target.GetAddressByteSize(), target
+        )
+        self.bucket_count = decode_field(
+            header, self.layout["bucket_count_offset"], self.layout["bucket_count_size"], target
+        )
+        # The element count is stored, so the size never requires a walk.
+        self.size = decode_field(
+            header, self.layout["element_count_offset"], self.layout["element_count_size"], target
+        )
+
+    def _read_next(self, node_addr):
+        pointer_size = self.valobj.GetTarget().GetAddressByteSize()
+        raw = read_memory(self.valobj.GetProcess(), node_addr + self.layout["next_offset"], pointer_size)
+        if len(raw) != pointer_size:
+            return 0
+        return decode_integer(raw, self.valobj.GetTarget())
+
+    def _load_bucket_chunk(self):
+        """Reads the next chunk of bucket heads with one memory read; returns False once the array is exhausted."""
+        if self._next_bucket >= self.bucket_count:
+            return False
+        chunk = self.layout["bucket_chunk"]
+        count = min(HASH_BUCKET_CHUNK_SIZE, self.bucket_count - self._next_bucket)
+        pointer_size = chunk.size // HASH_BUCKET_CHUNK_SIZE
+        raw = read_memory(
+            self.valobj.GetProcess(), self.bucket_array + self._next_bucket * pointer_size, count * pointer_size
+        )
+        if len(raw) != count * pointer_size:
+            self._next_bucket = self.bucket_count
+            return False
+        if count < HASH_BUCKET_CHUNK_SIZE:
+            raw += b"\0" * (chunk.size - len(raw))
+        self._bucket_heads.extend(head for head in chunk.unpack(raw) if head != 0)
+        self._next_bucket += count
+        return True
+
+    def _next_node(self):
+        if self._chain_node == 0:
+            while not self._bucket_heads:
+                if self.deadline.expired() or not self._load_bucket_chunk():
+                    return 0
+            self._chain_node = self._bucket_heads.popleft()
+        node_addr = self._chain_node
+        self._chain_node = self._read_next(node_addr)
+        return node_addr
+
+    def _get_node_addr(self, index):
+        # Never walking past mnElementCount nodes bounds the work on a corrupted (e.g. cyclic) chain.
+        if index < 0 or index >= self.size:
+            return 0
+        while len(self.node_addrs) <= index:
+            if self.deadline.expired():
+                return 0
+            node_addr = self._next_node()
+            if node_addr == 0:
+                return 0
+            self.node_addrs.append(node_addr)
+        return self.node_addrs[index]
+
+    def _build_size_child(self):
+        return self.valobj.CreateValueFromData(
+            "size",
+            create_data_from_uint(self.valobj.GetTarget(), self.size),
+            find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
+        )
+
+    def _build_element_child(self, index):
+        node_addr = self._get_node_addr(index)
+        if node_addr == 0:
+            if self.deadline.exceeded and index == len(self.node_addrs):
+                return create_message_child(self.valobj, "<truncated>", "time budget exceeded")
+            return None
+        return self.valobj.CreateValueFromAddress(
+            f"[{index}]", node_addr + self.layout["value_offset"], self.layout["value_type"]
+        )
+
+    def num_children(self):
+        return min(get_setting("hash-max-children"), self.size) + self.STATIC_CHILD_COUNT
+
+    def get_child_index(self, name):
+        if name.startswith("[") and name.endswith("]"):
+            try:
+                return int(name.lstrip("[").rstrip("]")) + self.STATIC_CHILD_COUNT
+            except Exception:
+                return -1
+        return self.STATIC_CHILD_INDEX.get(name, -1)
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children():
+            return None
+        self.deadline = Deadline()
+        if index == 0:
+            return self._build_size_child()
+        return self._build_element_child(index - self.STATIC_CHILD_COUNT)
+
+    def update(self):
+        materialized_count = len(self.node_addrs)
+        self.deadline = Deadline()
+        self.size = 0
+        self.bucket_array = 0
+        self.bucket_count = 0
+        self._reset_scan()
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        self.layout = self._resolve_layout()
+        if not self.layout:
+            return False
+        header = read_value_bytes(self.valobj, self.layout["header_size"])
+        if not header:
+            return False
+        self._decode_header(header)
+        # As with trees, an erase plus an insert can keep the header intact, so the nodes LLDB already holds
+        # children for are found again before the cached children are declared valid.
+        if materialized_count:
+            self._get_node_addr(min(materialized_count, self.size) - 1)
+        self.fingerprint = (header, tuple(self.node_addrs))
+        return self.fingerprint == previous_fingerprint
+
+
+def get_hashtable_summary(provider):
+    provider.update()
+    preview = []
+    if provider.size > 0:
+        preview.append(get_value_display(provider._build_element_child(0)))
+    return format_sequence_summary(provider.size, preview, truncated=provider.size > 1 or provider.deadline.exceeded)
+
+
+def HashTable_SummaryProvider(valobj, internal_dict):
+    try:
+        return get_hashtable_summary(HashTable_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict))
+    except Exception:
+        return ""
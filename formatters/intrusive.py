@@ -0,0 +1,118 @@
+from formatters.hash_table import HashTable_SyntheticChildrenProvider, get_bucket_chunk_struct, get_hashtable_summary
+from formatters.layout import get_layout, get_type_layout, has_load_address
+from formatters.linked_list import List_SyntheticChildrenProvider, get_list_summary
+from formatters.utils import PointerFields, decode_field, get_non_synthetic_value
+
+
+def _resolve_intrusive_list_layout(layout):
+    anchor = layout.member("mAnchor")
+    value_type = layout.template_argument_type(0)
+    if not anchor or not value_type or not value_type.IsValid():
+        return None
+    anchor_offset, hook_type = anchor
+    hook_layout = get_type_layout(layout.target, hook_type)
+    next_offset = hook_layout.offset("mpNext")
+    prev_offset = hook_layout.offset("mpPrev")
+    # The links point at the intrusive_list_node hook, which need not be at offset 0 of the element.
+    hook_offset = get_type_layout(layout.target, value_type).base_offset(hook_type.GetCanonicalType().GetName())
+    if next_offset is None or prev_offset is None or hook_offset is None:
+        return None
+    return {
+        "is_slist": False,
+        "anchor_offset": anchor_offset,
+        "links": PointerFields(layout.target, [next_offset, prev_offset]),
+        # intrusive_list has no mSize; size() walks the list, so the provider counts up to the child cap.
+        "size_offset": None,
+        "size_byte_size": 0,
+        "header_end": anchor_offset + hook_type.GetByteSize(),
+        "value_type": value_type,
+        "value_offset": -hook_offset,
+    }
+
+
+def _resolve_intrusive_hashtable_layout(layout):
+    bucket_array = layout.member("mBucketArray")
+    element_count = layout.member("mnElementCount")
+    if not bucket_array or not element_count:
+        return None
+    # node_type* mBucketArray[kBucketCount + 1]; the nodes are the user's elements themselves.
+    bucket_array_offset, bucket_array_type = bucket_array
+    value_type = bucket_array_type.GetArrayElementType().GetPointeeType()
+    value_layout = get_type_layout(layout.target, value_type)
+    next_member = value_layout.member("mpNext") if value_layout else None
+    if not next_member:
+        return None
+    next_offset, next_type = next_member
+    # mpNext points at the hook (intrusive_hash_node or intrusive_hash_node_key<Key>), not at the element.
+    hook_offset = value_layout.base_offset(next_type.GetPointeeType().GetCanonicalType().GetName())
+    if hook_offset is None:
+        return None
+    pointer_size = layout.target.GetAddressByteSize()
+    return {
+        "header_size": element_count[0] + element_count[1].GetByteSize(),
+        "bucket_array_offset": bucket_array_offset,
+        # The extra last bucket is the non-null end sentinel iterators stop on.
+        "bucket_count": bucket_array_type.GetByteSize() // pointer_size - 1,
+        "element_count_offset": element_count[0],
+        "element_count_size": element_count[1].GetByteSize(),
+        "bucket_chunk": get_bucket_chunk_struct(layout.target),
+        "value_offset": 0,
+        "value_type": value_type,
+        "next_offset": next_offset,
+        "hook_offset": hook_offset,
+    }
+
+
+class IntrusiveList_SyntheticChildrenProvider(List_SyntheticChildrenProvider):
+    """eastl::intrusive_list, walked like eastl::list with the containing objects as children.
+
+    The hook offset inside the element type is resolved once per type, so each child is one subtraction from the
+    node address the walk already has.
+    """
+
+    def _resolve_layout(self):
+        return get_layout(self.valobj).fact("intrusive_list", _resolve_intrusive_list_layout)
+
+
+class IntrusiveHashTable_SyntheticChildrenProvider(HashTable_SyntheticChildrenProvider):
+    """intrusive_hash_map/intrusive_hash_set and their multi variants, scanned like hash_map.
+
+    The bucket array is stored inside the container and its size is fixed at compile time, so only the element
+    count is read from the header.
+    """
+
+    def _resolve_layout(self):
+        return get_layout(self.valobj).fact("intrusive_hashtable", _resolve_intrusive_hashtable_layout)
+
+    def _decode_header(self, header):
+        target = self.valobj.GetTarget()
+        self.size = decode_field(
+            header, self.layout["element_count_offset"], self.layout["element_count_size"], target
+        )
+        if not has_load_address(self.valobj):
+            # Inline buckets cannot be scanned without the container's address; show it empty rather than with
+            # children that cannot be found.
+            self.size = 0
+            return
+        self.bucket_array = self.valobj.GetLoadAddress() + self.layout["bucket_array_offset"]
+        self.bucket_count = self.layout["bucket_count"]
+
+    def _read_next(self, node_addr):
+        next_hook = super()._read_next(node_addr)
+        return next_hook - self.layout["hook_offset"] if next_hook else 0
+
+
+def IntrusiveList_SummaryProvider(valobj, internal_dict):
+    try:
+        return get_list_summary(IntrusiveList_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict))
+    except Exception:
+        return ""
+
+
+def IntrusiveHashTable_SummaryProvider(valobj, internal_dict):
+    try:
+        return get_hashtable_summary(
+            IntrusiveHashTable_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        )
+    except Exception:
+        return ""
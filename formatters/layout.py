@@ -0,0 +1,170 @@
+import lldb
+
+from formatters.utils import find_type, get_raw_type, get_target_cache
+
+
+def _is_anonymous(field):
+    return not field.GetName()
+
+
+def _lookup_member(sbtype, name, depth=0):
+    """C++ style member lookup: direct fields, anonymous unions/structs, then base classes."""
+    if depth > 16 or not sbtype or not sbtype.IsValid():
+        return None
+    sbtype = sbtype.GetCanonicalType()
+    anonymous = []
+    for idx in range(sbtype.GetNumberOfFields()):
+        field = sbtype.GetFieldAtIndex(idx)
+        if field.GetName() == name:
+            return (field.GetOffsetInBytes(), field.GetType())
+        if _is_anonymous(field):
+            anonymous.append(field)
+    for field in anonymous:
+        found = _lookup_member(field.GetType(), name, depth + 1)
+        if found:
+            return (field.GetOffsetInBytes() + found[0], found[1])
+    for idx in range(sbtype.GetNumberOfDirectBaseClasses()):
+        base = sbtype.GetDirectBaseClassAtIndex(idx)
+        found = _lookup_member(base.GetType(), name, depth + 1)
+        if found:
+            return (base.GetOffsetInBytes() + found[0], found[1])
+    return None
+
+
+def _lookup_base(sbtype, name, depth=0):
+    """Offset of the base class subobject whose canonical type is name (the type itself counts), or None."""
+    if depth > 16 or not sbtype or not sbtype.IsValid():
+        return None
+    sbtype = sbtype.GetCanonicalType()
+    if sbtype.GetName() == name:
+        return 0
+    for idx in range(sbtype.GetNumberOfDirectBaseClasses()):
+        base = sbtype.GetDirectBaseClassAtIndex(idx)
+        found = _lookup_base(base.GetType(), name, depth + 1)
+        if found is not None:
+            return base.GetOffsetInBytes() + found
+    return None
+
+
+def _split_template_arguments(type_name):
+    begin = type_name.find("<")
+    if begin == -1:
+        return []
+    args = []
+    depth = 0
+    current = ""
+    for char in type_name[begin + 1:]:
+        if char in "<([":
+            depth += 1
+        elif char in ">)]":
+            if depth == 0:
+                break
+            depth -= 1
+        elif char == "," and depth == 0:
+            args.append(current.strip())
+            current = ""
+            continue
+        current += char
+    args.append(current.strip())
+    return args
+
+
+def _parse_integer(text):
+    text = text.strip().rstrip("uUlL")
+    try:
+        return int(text, 0)
+    except ValueError:
+        return None
+
+
+class TypeLayout:
+    """Field offsets, element types, byte sizes and template facts of one type, resolved on first use."""
+
+    def __init__(self, target, sbtype):
+        self.target = target
+        self.type = sbtype
+        self.name = sbtype.GetName() or ""
+        self.byte_size = sbtype.GetByteSize()
+        self._members = {}
+        self._facts = {}
+
+    def member(self, path):
+        """Returns (byte offset, type) of a dotted member path such as "mPair.mFirst", or None."""
+        if path not in self._members:
+            offset = 0
+            current = self.type
+            found = None
+            for name in path.split("."):
+                found = _lookup_member(current, name)
+                if not found:
+                    break
+                offset += found[0]
+                current = found[1]
+            self._members[path] = (offset, current) if found else None
+        return self._members[path]
+
+    def offset(self, path):
+        member = self.member(path)
+        return member[0] if member else None
+
+    def member_type(self, path):
+        member = self.member(path)
+        return member[1] if member else None
+
+    def base_offset(self, name):
+        """Byte offset of the base class name inside this type, e.g. of an intrusive hook in the element type."""
+        return self.fact(("base_offset", name), lambda layout: _lookup_base(layout.type, name))
+
+    def fact(self, key, resolver):
+        """Memoizes a formatter specific fact computed by resolver(layout)."""
+        if key not in self._facts:
+            self._facts[key] = resolver(self)
+        return self._facts[key]
+
+    def template_argument_type(self, index):
+        return self.fact(("template_argument_type", index), lambda layout: layout.type.GetTemplateArgumentType(index))
+
+    def template_argument_types(self):
+        """Every type argument of a template whose arguments are all types, e.g. the alternatives of a variant."""
+        def resolve(layout):
+            count = layout.type.GetNumberOfTemplateArguments()
+            types = [layout.type.GetTemplateArgumentType(index) for index in range(count)]
+            names = _split_template_arguments(layout.name)
+            if len(names) > count or not all(arg and arg.IsValid() for arg in types):
+                # Older LLDB releases report a parameter pack as one argument; look the types up by name instead.
+                types = [find_type(layout.target, name) for name in names if name]
+            return types if all(arg and arg.IsValid() for arg in types) else None
+
+        return self.fact("template_argument_types", resolve)
+
+    def template_integer_argument(self, index):
+        """Integer (non-type) template argument, e.g. the extent of eastl::span<int, 3>."""
+        def resolve(layout):
+            args = _split_template_arguments(layout.name)
+            if not -len(args) <= index < len(args):
+                return None
+            return _parse_integer(args[index])
+
+        return self.fact(("template_integer_argument", index), resolve)
+
+
+def get_type_layout(target, sbtype):
+    if not sbtype or not sbtype.IsValid():
+        return None
+    sbtype = sbtype.GetCanonicalType()
+    # Layouts live in the target cache: everything stored here is derived from debug info only, so it is
+    # resolved once per type and shared by every value and every stop until the module list changes.
+    layouts = get_target_cache(target).setdefault("layouts", {})
+    layout = layouts.get(sbtype.GetName())
+    if layout is None:
+        layout = TypeLayout(target, sbtype)
+        layouts[sbtype.GetName()] = layout
+    return layout
+
+
+def get_layout(valobj):
+    return get_type_layout(valobj.GetTarget(), get_raw_type(valobj))
+
+
+def has_load_address(valobj):
+    return valobj.GetLoadAddress() != lldb.LLDB_INVALID_ADDRESS
@@ -0,0 +1,243 @@
+from formatters.constants import TYPE_SIZE_T
+from formatters.layout import get_layout, get_type_layout, has_load_address
+from formatters.settings import Deadline, get_setting
+from formatters.utils import (
+    PointerFields,
+    create_data_from_uint,
+    create_message_child,
+    decode_field,
+    find_type,
+    format_sequence_summary,
+    get_field,
+    get_non_synthetic_value,
+    get_value_display,
+    read_memory,
+    read_value_bytes,
+)
+
+
+def _find_node_type(target, container_type, node_template, value_type):
+    for value_name in (value_type.GetName(), value_type.GetCanonicalType().GetName()):
+        node_type = target.FindFirstType(f"{node_template}<{value_name}>")
+        if node_type and node_type.IsValid() and get_field(node_type, "mValue"):
+            return node_type
+    # The node type is always named in the signatures of the node allocation helpers.
+    for idx in range(container_type.GetNumberOfMemberFunctions()):
+        return_type = container_type.GetMemberFunctionAtIndex(idx).GetReturnType()
+        if not return_type or not return_type.IsPointerType():
+            continue
+        node_type = return_type.GetPointeeType().GetCanonicalType()
+        if (node_type.GetName() or "").startswith(f"{node_template}<") and get_field(node_type, "mValue"):
+            return node_type
+    return None
+
+
+def _resolve_list_layout(layout):
+    # Newer EASTL keeps the anchor node in a compressed_pair with the allocator, older releases in mNode.
+    anchor = layout.member("mNodeAllocator.mFirst") or layout.member("mNode")
+    value_type = layout.template_argument_type(0)
+    if not anchor or not value_type or not value_type.IsValid():
+        return None
+    anchor_offset, node_base_type = anchor
+    base_layout = get_type_layout(layout.target, node_base_type)
+    next_offset = base_layout.offset("mpNext")
+    if next_offset is None:
+        return None
+    prev_offset = base_layout.offset("mpPrev")
+    is_slist = prev_offset is None
+    node_type = _find_node_type(
+        layout.target, layout.type, "eastl::SListNode" if is_slist else "eastl::ListNode", value_type
+    )
+    if node_type:
+        field = get_field(node_type, "mValue")
+        value_type, value_offset = field.GetType(), field.GetOffsetInBytes()
+    else:
+        # The node only adds mValue after the pointer-aligned node base.
+        value_offset = node_base_type.GetByteSize()
+    # mSize exists only when EASTL_LIST_SIZE_CACHE / EASTL_SLIST_SIZE_CACHE is enabled.
+    size = layout.member("mSize")
+    header_end = anchor_offset + node_base_type.GetByteSize()
+    if size:
+        header_end = max(header_end, size[0] + size[1].GetByteSize())
+    return {
+        "is_slist": is_slist,
+        "anchor_offset": anchor_offset,
+        "links": PointerFields(layout.target, [next_offset] if is_slist else [next_offset, prev_offset]),
+        "size_offset": size[0] if size else None,
+        "size_byte_size": size[1].GetByteSize() if size else 0,
+        "header_end": header_end,
+        "value_type": value_type,
+        "value_offset": value_offset,
+    }
+
+
+class List_SyntheticChildrenProvider:
+    """eastl::list and eastl::slist.
+
+    Node addresses are cached as the chain is walked, so expanding n children costs n raw link reads in total.
+    The walk never visits a node twice, never goes past the cached size and checks each mpPrev against the node it
+    came from, so a corrupted list ends in a <corrupted> child instead of hanging the debugger.
+    """
+
+    STATIC_CHILD_NAMES = ("size",)
+    STATIC_CHILD_INDEX = {name: idx for idx, name in enumerate(STATIC_CHILD_NAMES)}
+    STATIC_CHILD_COUNT = len(STATIC_CHILD_NAMES)
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.layout = None
+        self.size = 0
+        self.size_known = False
+        self.anchor_addr = 0
+        self.node_addrs = []
+        self.corrupted = False
+        self.deadline = Deadline()
+        # Header bytes and walked node addresses seen by the previous update().
+        self.fingerprint = None
+        self._reset_walk(0)
+
+    def _resolve_layout(self):
+        return get_layout(self.valobj).fact("list", _resolve_list_layout)
+
+    def _reset_walk(self, first_addr):
+        self.node_addrs = []
+        self.corrupted = False
+        self._visited = set()
+        self._cursor = first_addr
+        self._expected_prev = self.anchor_addr
+
+    def _read_links(self, node_addr):
+        links = self.layout["links"]
+        raw = read_memory(self.valobj.GetProcess(), node_addr, links.size)
+        if len(raw) != links.size:
+            return None
+        values = links.unpack(raw)
+        return values if len(values) == 2 else (values[0], None)
+
+    def _is_end(self, node_addr):
+        return node_addr == 0 or (not self.layout["is_slist"] and node_addr == self.anchor_addr)
+
+    def _walk_to(self, index):
+        """Extends the cached walk up to index; returns False at the end of the list or when it had to stop."""
+        while len(self.node_addrs) <= index:
+            if self.corrupted or self.deadline.expired() or self._is_end(self._cursor):
+                return False
+            node_addr = self._cursor
+            links = self._read_links(node_addr) if node_addr not in self._visited else None
+            if links is None or (self.size_known and len(self.node_addrs) >= self.size):
+                self.corrupted = True
+                return False
+            next_addr, prev_addr = links
+            if prev_addr is not None and prev_addr != self._expected_prev:
+                self.corrupted = True
+                return False
+            self._visited.add(node_addr)
+            self.node_addrs.append(node_addr)
+            self._expected_prev = node_addr
+            self._cursor = next_addr
+        return True
+
+    def _count(self):
+        """Size of a list without mSize, counted up to one past the child cap."""
+        self._walk_to(get_setting("list-max-children"))
+        return len(self.node_addrs)
+
+    def _build_size_child(self):
+        return self.valobj.CreateValueFromData(
+            "size",
+            create_data_from_uint(self.valobj.GetTarget(), self.size),
+            find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
+        )
+
+    def _build_element_child(self, index):
+        if not self._walk_to(index):
+            if index != len(self.node_addrs):
+                return None
+            if self.corrupted:
+                return create_message_child(self.valobj, "<corrupted>", "broken or cyclic node chain")
+            if self.deadline.exceeded:
+                return create_message_child(self.valobj, "<truncated>", "time budget exceeded")
+            return None
+        return self.valobj.CreateValueFromAddress(
+            f"[{index}]", self.node_addrs[index] + self.layout["value_offset"], self.layout["value_type"]
+        )
+
+    def num_children(self):
+        count = min(get_setting("list-max-children"), self.size)
+        if self.corrupted:
+            count = min(count, len(self.node_addrs) + 1)
+        return count + self.STATIC_CHILD_COUNT
+
+    def get_child_index(self, name):
+        if name.startswith("[") and name.endswith("]"):
+            try:
+                return int(name.lstrip("[").rstrip("]")) + self.STATIC_CHILD_COUNT
+            except Exception:
+                return -1
+        return self.STATIC_CHILD_INDEX.get(name, -1)
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children():
+            return None
+        self.deadline = Deadline()
+        if index == 0:
+            return self._build_size_child()
+        return self._build_element_child(index - self.STATIC_CHILD_COUNT)
+
+    def get_summary_size(self):
+        cap = get_setting("list-max-children")
+        if self.size_known or self.size <= cap:
+            return self.size
+        return f"{cap}+"
+
+    def update(self):
+        materialized_count = len(self.node_addrs)
+        self.deadline = Deadline()
+        self.size = 0
+        self.size_known = False
+        self.anchor_addr = 0
+        self._reset_walk(0)
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        self.layout = self._resolve_layout()
+        if not self.layout:
+            return False
+        header = read_value_bytes(self.valobj, self.layout["header_end"])
+        if not header:
+            return False
+        if not self.layout["is_slist"]:
+            # The list anchor is its own end marker, so walking it needs the anchor's address.
+            if not has_load_address(self.valobj):
+                return False
+            self.anchor_addr = self.valobj.GetLoadAddress() + self.layout["anchor_offset"]
+        anchor_offset = self.layout["anchor_offset"]
+        first_addr = self.layout["links"].unpack(header[anchor_offset:])[0]
+        self._reset_walk(first_addr)
+        if self.layout["size_offset"] is not None:
+            self.size_known = True
+            self.size = decode_field(
+                header, self.layout["size_offset"], self.layout["size_byte_size"], self.valobj.GetTarget()
+            )
+        else:
+            self.size = self._count()
+        # As with trees, the nodes LLDB already holds children for are walked again before reusing them.
+        if materialized_count:
+            self._walk_to(min(materialized_count, self.size) - 1)
+        self.fingerprint = (header, tuple(self.node_addrs), self.corrupted)
+        return self.fingerprint == previous_fingerprint
+
+
+def get_list_summary(provider):
+    provider.update()
+    preview = []
+    if provider.size and provider._walk_to(0):
+        preview.append(get_value_display(provider._build_element_child(0)))
+    elif provider.corrupted:
+        preview.append("<corrupted>")
+    return format_sequence_summary(provider.get_summary_size(), preview, truncated=provider.size > 1)
+
+
+def List_SummaryProvider(valobj, internal_dict):
+    try:
+        return get_list_summary(List_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict))
+    except Exception:
+        return ""
@@ -0,0 +1,269 @@
+from formatters.constants import TYPE_SIZE_T
+from formatters.hash_table import HashTable_SyntheticChildrenProvider
+from formatters.layout import get_layout, get_type_layout
+from formatters.linked_list import List_SyntheticChildrenProvider
+from formatters.settings import Deadline, get_setting
+from formatters.string import basic_string_SyntheticChildrenProvider
+from formatters.utils import (
+    PointerFields,
+    create_data_from_uint,
+    decode_field,
+    find_type,
+    format_sequence_summary,
+    get_integer_decoder,
+    get_non_synthetic_value,
+    get_value_display,
+    read_memory,
+    read_value_bytes,
+)
+
+STATIC_SYNTHETIC_CHILDREN = {
+    "size": 0,
+    "capacity": 1,
+}
+
+# eastl::hash<basic_string> is a 32 bit FNV-1 over the bytes up to the first zero byte.
+_FNV_OFFSET_BASIS = 2166136261
+_FNV_PRIME = 16777619
+# String keys longer than this are not hashed; their entries show the key only.
+_MAX_HASHED_KEY_LENGTH = 4096
+
+
+def _resolve_lru_cache_layout(layout):
+    members = [layout.member(path) for path in ("m_list", "m_map", "m_capacity")]
+    if None in members:
+        return None
+    (list_offset, list_type), (map_offset, map_type), capacity = members
+    # Values live in the map only; it can be probed for the key of a list node when its hash is known, which is
+    # the case for eastl::hash of integral and string keys.
+    key_type = layout.template_argument_type(0)
+    map_layout = get_type_layout(layout.target, map_type)
+    hasher = map_layout.template_argument_type(2) if map_layout else None
+    hasher_name = hasher.GetCanonicalType().GetName() if hasher and hasher.IsValid() else ""
+    key_name = key_type.GetCanonicalType().GetName() if key_type and key_type.IsValid() else ""
+    key_kind = None
+    if hasher_name.startswith("eastl::hash<"):
+        if get_integer_decoder(layout.target, key_type):
+            key_kind = "integer"
+        elif key_name.startswith("eastl::basic_string<"):
+            key_kind = "string"
+    return {
+        "list_offset": list_offset,
+        "list_type": list_type,
+        "map_offset": map_offset,
+        "map_type": map_type,
+        "capacity_offset": capacity[0],
+        "capacity_size": capacity[1].GetByteSize(),
+        "key_type": key_type,
+        "key_kind": key_kind,
+    }
+
+
+def _resolve_map_node_layout(layout):
+    # The map holds pair<const Key, pair<Value, list::iterator>>; the iterator identifies the list node of an entry.
+    mapped = layout.member("second.first")
+    iterator = layout.offset("second.second.mpNode")
+    if not mapped or iterator is None:
+        return None
+    return {"mapped_offset": mapped[0], "mapped_type": mapped[1], "iterator_offset": iterator}
+
+
+def hash_string_key(raw):
+    """eastl::hash of a basic_string with these character bytes."""
+    result = _FNV_OFFSET_BASIS
+    for byte in raw.split(b"\0", 1)[0]:
+        result = ((result * _FNV_PRIME) & 0xFFFFFFFF) ^ byte
+    return result
+
+
+class LruCache_SyntheticChildrenProvider:
+    """eastl::lru_cache, with its entries in recency order from the most recently used one.
+
+    The recency list is walked like eastl::list with raw node reads, up to the child cap. The hash map is never
+    scanned: the value of an entry is found by probing the one bucket its key hashes to and matching the list
+    iterator stored with it, which needs the hash of the key. Every child is named after its key; for keys hashed
+    by eastl::hash of an integral or string type it shows the value, in other caches the key itself.
+    """
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.layout = None
+        self.list = None
+        self.map = None
+        self.node_layout = None
+        self.size = 0
+        self.capacity = 0
+        self.fingerprint = None
+
+    def update(self):
+        materialized_count = len(self.list.node_addrs) if self.list else 0
+        self.list = None
+        self.map = None
+        self.node_layout = None
+        self.size = 0
+        self.capacity = 0
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        self.layout = get_layout(self.valobj).fact("lru_cache", _resolve_lru_cache_layout)
+        if not self.layout:
+            return False
+        header = read_value_bytes(self.valobj, self.layout["capacity_offset"] + self.layout["capacity_size"])
+        if not header:
+            return False
+        self.capacity = decode_field(
+            header, self.layout["capacity_offset"], self.layout["capacity_size"], self.valobj.GetTarget()
+        )
+        self.list = List_SyntheticChildrenProvider(
+            self.valobj.CreateChildAtOffset("m_list", self.layout["list_offset"], self.layout["list_type"]), None
+        )
+        self.list.update()
+        if not self.list.layout:
+            return False
+        self.size = self.list.size
+        # Only the map header is read: its element count is the size even without a list size cache.
+        self.map = HashTable_SyntheticChildrenProvider(
+            self.valobj.CreateChildAtOffset("m_map", self.layout["map_offset"], self.layout["map_type"]), None
+        )
+        self.map.update()
+        if self.map.layout:
+            self.size = self.map.size
+            value_layout = get_type_layout(self.valobj.GetTarget(), self.map.layout["value_type"])
+            if value_layout:
+                self.node_layout = value_layout.fact("lru_cache_entry", _resolve_map_node_layout)
+        if materialized_count:
+            self.list._walk_to(min(materialized_count, self.size) - 1)
+        # Keys and values are address backed through the list and map nodes, so the walked list nodes and both
+        # headers cover every child.
+        self.fingerprint = (header, self.list.fingerprint, tuple(self.list.node_addrs), self.map.fingerprint)
+        return self.fingerprint == previous_fingerprint
+
+    def _hash_key(self, key_addr):
+        target = self.valobj.GetTarget()
+        if self.layout["key_kind"] == "integer":
+            decoder = get_integer_decoder(target, self.layout["key_type"])
+            raw = read_memory(self.valobj.GetProcess(), key_addr, decoder.size)
+            if len(raw) != decoder.size:
+                return None
+            # eastl::hash of an integral type is the value converted to size_t.
+            return decoder.unpack(raw)[0] & ((1 << (8 * target.GetAddressByteSize())) - 1)
+        if self.layout["key_kind"] == "string":
+            key = self.valobj.CreateValueFromAddress("key", key_addr, self.layout["key_type"])
+            provider = basic_string_SyntheticChildrenProvider(key, None)
+            provider.update()
+            if not provider._valid_layout or provider._length > _MAX_HASHED_KEY_LENGTH:
+                return None
+            return hash_string_key(provider.read_characters(provider._length))
+        return None
+
+    def _find_value_addr(self, list_node_addr):
+        """Address of the value of the entry whose list node is list_node_addr, from one bucket chain, or 0."""
+        if not self.node_layout or not self.map.bucket_count:
+            return 0
+        hash_code = self._hash_key(list_node_addr + self.list.layout["value_offset"])
+        if hash_code is None:
+            return 0
+        target = self.valobj.GetTarget()
+        process = self.valobj.GetProcess()
+        pointer_size = target.GetAddressByteSize()
+        bucket_addr = self.map.bucket_array + (hash_code % self.map.bucket_count) * pointer_size
+        raw = read_memory(process, bucket_addr, pointer_size)
+        node_addr = decode_field(raw, 0, pointer_size, target) if len(raw) == pointer_size else 0
+        value_offset = self.map.layout["value_offset"]
+        # One read per chain node covers both the stored list iterator and mpNext.
+        links = PointerFields(
+            target, [value_offset + self.node_layout["iterator_offset"], self.map.layout["next_offset"]]
+        )
+        for _ in range(self.size):
+            if node_addr == 0:
+                break
+            raw = read_memory(process, node_addr, links.size)
+            if len(raw) != links.size:
+                break
+            iterator_node, next_addr = links.unpack(raw)
+            if iterator_node == list_node_addr:
+                return node_addr + value_offset + self.node_layout["mapped_offset"]
+            node_addr = next_addr
+        return 0
+
+    def _build_entry_child(self, index):
+        key = self.list._build_element_child(index)
+        if not key or not key.IsValid() or index >= len(self.list.node_addrs):
+            # Past the end of the walk: None, or the list's <corrupted>/<truncated> child.
+            return key
+        name = f"[{get_value_display(key)}]"
+        node_addr = self.list.node_addrs[index]
+        value_addr = self._find_value_addr(node_addr)
+        if value_addr == 0:
+            return self.valobj.CreateValueFromAddress(
+                name, node_addr + self.list.layout["value_offset"], self.list.layout["value_type"]
+            )
+        return self.valobj.CreateValueFromAddress(name, value_addr, self.node_layout["mapped_type"])
+
+    def _create_count_child(self, name, value):
+        return self.valobj.CreateValueFromData(
+            name,
+            create_data_from_uint(self.valobj.GetTarget(), value),
+            find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
+        )
+
+    def num_children(self):
+        if not self.list:
+            return 0
+        count = min(get_setting("lru-cache-max-children"), self.size)
+        if self.list.corrupted:
+            count = min(count, len(self.list.node_addrs) + 1)
+        return count + len(STATIC_SYNTHETIC_CHILDREN)
+
+    def get_child_index(self, name):
+        if name in STATIC_SYNTHETIC_CHILDREN:
+            return STATIC_SYNTHETIC_CHILDREN[name]
+        if not self.list or not name.startswith("[") or not name.endswith("]"):
+            return -1
+        # Entries are named after their keys, so the name is matched against the keys of the shown entries.
+        self.list.deadline = Deadline()
+        for index in range(self.num_children() - len(STATIC_SYNTHETIC_CHILDREN)):
+            key = self.list._build_element_child(index)
+            if not key or index >= len(self.list.node_addrs):
+                break
+            if f"[{get_value_display(key)}]" == name:
+                return index + len(STATIC_SYNTHETIC_CHILDREN)
+        return -1
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children():
+            return None
+        if index == 0:
+            return self._create_count_child("size", self.size)
+        if index == 1:
+            return self._create_count_child("capacity", self.capacity)
+        self.list.deadline = Deadline()
+        return self._build_entry_child(index - len(STATIC_SYNTHETIC_CHILDREN))
+
+    def get_preview(self, count):
+        """Display strings ("key → value", or the key alone) of the count most recently used entries."""
+        preview = []
+        for index in range(min(count, self.size)):
+            key = self.list._build_element_child(index)
+            if not key or index >= len(self.list.node_addrs):
+                break
+            value_addr = self._find_value_addr(self.list.node_addrs[index])
+            if value_addr == 0:
+                preview.append(get_value_display(key))
+                continue
+            value = self.valobj.CreateValueFromAddress("value", value_addr, self.node_layout["mapped_type"])
+            preview.append(f"{get_value_display(key)} → {get_value_display(value)}")
+        return preview
+
+
+def LruCache_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = LruCache_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        if not provider.list:
+            return ""
+        summary_size = get_setting("lru-cache-summary-size")
+        preview = provider.get_preview(summary_size)
+        return format_sequence_summary(
+            f"{provider.size}/{provider.capacity}", preview, truncated=provider.size > summary_size
+        )
+    except Exception:
+        return ""
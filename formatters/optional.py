@@ -0,0 +1,73 @@
+from formatters.layout import get_layout
+from formatters.utils import decode_field, get_non_synthetic_value, get_value_display, read_value_bytes
+
+STATIC_SYNTHETIC_CHILDREN = {
+    "value": 0,
+}
+
+
+def _resolve_optional_layout(layout):
+    # optional<T> derives from Internal::optional_storage<T>: aligned storage val and a bool engaged.
+    engaged = layout.member("engaged")
+    storage = layout.member("val")
+    value_type = layout.template_argument_type(0)
+    if not engaged or not storage or not value_type or not value_type.IsValid():
+        return None
+    return {
+        "engaged_offset": engaged[0],
+        "engaged_size": engaged[1].GetByteSize(),
+        "value_offset": storage[0],
+        "value_type": value_type,
+    }
+
+
+class Optional_SyntheticChildrenProvider:
+    """eastl::optional, with a "value" child while it is engaged.
+
+    The flag and value offsets are resolved once per instantiation, so a display is one read of the engaged flag
+    followed by one typed child.
+    """
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.layout = None
+        self.engaged = False
+        self.fingerprint = None
+
+    def update(self):
+        self.engaged = False
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        self.layout = get_layout(self.valobj).fact("optional", _resolve_optional_layout)
+        if not self.layout:
+            return False
+        raw = read_value_bytes(self.valobj, self.layout["engaged_size"], self.layout["engaged_offset"])
+        if not raw:
+            return False
+        self.engaged = decode_field(raw, 0, len(raw), self.valobj.GetTarget()) != 0
+        # The value is a child of the optional itself, so only the flag decides which children there are.
+        self.fingerprint = (self.valobj.GetLoadAddress(), self.engaged)
+        return self.fingerprint == previous_fingerprint
+
+    def num_children(self):
+        return len(STATIC_SYNTHETIC_CHILDREN) if self.engaged else 0
+
+    def get_child_index(self, name):
+        return STATIC_SYNTHETIC_CHILDREN.get(name, -1)
+
+    def get_child_at_index(self, index):
+        if index != 0 or not self.engaged:
+            return None
+        return self.valobj.CreateChildAtOffset("value", self.layout["value_offset"], self.layout["value_type"])
+
+
+def Optional_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = Optional_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        if not provider.layout:
+            return ""
+        if not provider.engaged:
+            return "nullopt"
+        return get_value_display(provider.get_child_at_index(0))
+    except Exception:
+        return ""
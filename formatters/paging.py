@@ -0,0 +1,89 @@
+import re
+
+import lldb
+
+from formatters.utils import get_raw_type
+
+# Range groups cover powers of this many elements, so their bounds stay readable ([0..9999], [10000..19999], ...).
+RANGE_GROUP_BASE = 10
+
+_RANGE_NAME = re.compile(r"^\[(\d+)\.\.(\d+)\]$")
+
+
+def format_range_name(lo, hi):
+    return f"[{lo}..{hi - 1}]"
+
+
+def parse_range_name(name):
+    """(lo, hi) of a "[lo..last]" range group name, or None for anything else."""
+    match = _RANGE_NAME.match(name or "")
+    if not match:
+        return None
+    lo, last = int(match.group(1)), int(match.group(2))
+    return (lo, last + 1) if last >= lo else None
+
+
+def create_range_child(valobj, lo, hi, prefix=""):
+    """A copy of the container named after the range it shows; its own provider expands only that range."""
+    name = prefix + format_range_name(lo, hi)
+    container_type = get_raw_type(valobj)
+    address = valobj.GetLoadAddress()
+    if address != lldb.LLDB_INVALID_ADDRESS:
+        return valobj.CreateValueFromAddress(name, address, container_type)
+    return valobj.CreateValueFromData(name, valobj.GetData(), container_type)
+
+
+class ChildRange:
+    """The elements a sequence provider shows: the whole container, or the range group its value is named after.
+
+    More than max_children elements are split into range groups of RANGE_GROUP_BASE ** k elements, choosing the
+    smallest k that fits, so each level costs at most max_children children and any element is reachable in
+    O(log n) expansions. name overrides the value name the range group is parsed from, for views that carry more
+    than a range in their name.
+    """
+
+    def __init__(self, valobj, size, max_children, name=None):
+        page = parse_range_name(valobj.GetName() if name is None else name)
+        self.is_group = page is not None
+        lo, hi = page if page else (0, size)
+        self.lo = min(lo, size)
+        self.hi = min(hi, size)
+        self.span = 1
+        max_children = max(1, max_children)
+        while (self.count + self.span - 1) // self.span > max_children:
+            self.span *= RANGE_GROUP_BASE
+
+    @property
+    def count(self):
+        return self.hi - self.lo
+
+    @property
+    def is_grouped(self):
+        return self.span > 1
+
+    def num_children(self):
+        return (self.count + self.span - 1) // self.span
+
+    def group_bounds(self, index):
+        lo = self.lo + index * self.span
+        return (lo, min(lo + self.span, self.hi))
+
+    def element_index(self, index):
+        """Container index shown by child index, when this range shows elements rather than groups."""
+        return self.lo + index
+
+    def child_index(self, name):
+        """Child index of an element ("[i]") or range group ("[lo..last]") name, or -1."""
+        page = parse_range_name(name)
+        if page is not None:
+            if not self.is_grouped or (page[0] - self.lo) % self.span != 0:
+                return -1
+            index = (page[0] - self.lo) // self.span
+        elif self.is_grouped or not (name.startswith("[") and name.endswith("]")):
+            return -1
+        else:
+            try:
+                index = int(name[1:-1]) - self.lo
+            except ValueError:
+                return -1
+        return index if 0 <= index < self.num_children() else -1
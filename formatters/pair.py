@@ -1,4 +1,5 @@
 
+from formatters.layout import get_layout
 from formatters.utils import (
     get_value_display,
     get_non_synthetic_value
@@ -9,14 +10,24 @@ STATIC_SYNTHETIC_CHILDREN = {
     "second": 1
 }
 
+def _create_member_child(valobj, name):
+    member = get_layout(valobj).member(name)
+    if not member:
+        return None
+    return valobj.CreateChildAtOffset(name, member[0], member[1])
+
 class pair_SyntheticChildrenProvider:
     def __init__(self, valobj, internal_dict):
         self.valobj = valobj
+        self.fingerprint = None
     
     def update(self):
-        self.first = self.valobj.GetChildMemberWithName("first")
-        self.second = self.valobj.GetChildMemberWithName("second")
-        return False
+        self.first = _create_member_child(self.valobj, "first")
+        self.second = _create_member_child(self.valobj, "second")
+        fingerprint = self.valobj.GetLoadAddress()
+        unchanged = fingerprint == self.fingerprint
+        self.fingerprint = fingerprint
+        return unchanged
     
     def num_children(self):
         return len(STATIC_SYNTHETIC_CHILDREN)
@@ -34,6 +45,6 @@ class pair_SyntheticChildrenProvider:
 
 def pair_SummaryProvider(valobj, internal_dict):
     raw_valobj = get_non_synthetic_value(valobj)
-    first = get_value_display(raw_valobj.GetChildMemberWithName("first"))
-    second = get_value_display(raw_valobj.GetChildMemberWithName("second"))
+    first = get_value_display(_create_member_child(raw_valobj, "first"))
+    second = get_value_display(_create_member_child(raw_valobj, "second"))
     return f"({first}, {second})"
\ No newline at end of file
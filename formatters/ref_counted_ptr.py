@@ -1,10 +1,46 @@
+from formatters.atomic import is_signed_integer_type, resolve_atomic_layout
+from formatters.layout import get_layout, get_type_layout
 from formatters.utils import (
+    PointerFields,
     create_data_from_uint,
+    decode_integer,
     find_type,
     get_value_display,
     get_non_synthetic_value,
+    read_memory,
+    read_value_bytes,
 )
 
+
+def _resolve_count_layout(layout, member_name):
+    member = layout.member(member_name)
+    if not member:
+        return None
+    member_offset, atomic_type = member
+    atomic_layout = resolve_atomic_layout(layout.target, atomic_type)
+    if not atomic_layout:
+        return None
+    offset, byte_size, value_type = atomic_layout
+    return (member_offset + offset, byte_size, value_type)
+
+
+def _resolve_ref_count_layout(layout):
+    """((offset, size, type) of mRefCount, (offset, size, type) of mWeakRefCount) for a ref_count_sp type."""
+    return (_resolve_count_layout(layout, "mRefCount"), _resolve_count_layout(layout, "mWeakRefCount"))
+
+
+def _resolve_pointer_layout(layout):
+    value = layout.member("mpValue")
+    refcount = layout.member("mpRefCount")
+    if not value or not refcount:
+        return None
+    return {
+        "value_offset": value[0],
+        "value_type": value[1],
+        "header": PointerFields(layout.target, [value[0], refcount[0]]),
+        "ref_count_layout": get_type_layout(layout.target, refcount[1].GetPointeeType()),
+    }
+
 class RefCountedPtrSyntheticChildrenProvider:
     SHARED_CHILDREN_NAMES = ("pointer", "use_count", "weak_count", "value")
     SHARED_CHILD_INDEX = {
@@ -26,8 +62,10 @@ class RefCountedPtrSyntheticChildrenProvider:
         self.valobj = valobj
         self.value = None
         self._valid_layout = False
-        self.ref_count_obj = None
+        self.use_count = 0
+        self.weak_count = 0
         self._is_weak = False
+        self.fingerprint = None
         self._children_names = self.SHARED_CHILDREN_NAMES
         self._child_index = self.SHARED_CHILD_INDEX
 
@@ -38,67 +76,49 @@ class RefCountedPtrSyntheticChildrenProvider:
         return len(self._children_names) if self._valid_layout else 0
 
     def _count_type(self):
-        count_type = find_type("int32_t")
+        count_type = find_type(self.valobj.GetTarget(), "int32_t")
         if count_type and count_type.IsValid():
             return count_type
-        return find_type("int")
-
-    def _read_atomic_count(self, atomic_value):
-        if not atomic_value or not atomic_value.IsValid():
-            return 0
-        loaded = atomic_value.EvaluateExpression("load()")
-        if loaded and loaded.IsValid() and loaded.GetError().Success():
-            return loaded.GetValueAsUnsigned(0)
-        nested = self._find_nested_child(atomic_value, "mAtomic", 0, 8)
-        if nested and nested.IsValid():
-            return nested.GetValueAsUnsigned(0)
-        return atomic_value.GetValueAsUnsigned(0)
-
-    def _find_nested_child(self, value, child_name, depth, max_depth):
-        if depth > max_depth or not value or not value.IsValid():
-            return None
-        num_children = value.GetNumChildren()
-        for idx in range(num_children):
-            child = value.GetChildAtIndex(idx)
-            if not child or not child.IsValid():
-                continue
-            if child.GetName() == child_name:
-                return child
-            found = self._find_nested_child(child, child_name, depth + 1, max_depth)
-            if found and found.IsValid():
-                return found
-        return None
+        return find_type(self.valobj.GetTarget(), "int")
+
+    def _read_counts(self, refcount_addr, use_layout, weak_layout):
+        if refcount_addr == 0 or not use_layout or not weak_layout:
+            return (0, 0)
+        # Both counters live next to each other in ref_count_sp, so one read covers them.
+        begin = min(use_layout[0], weak_layout[0])
+        end = max(use_layout[0] + use_layout[1], weak_layout[0] + weak_layout[1])
+        raw = read_memory(self.valobj.GetProcess(), refcount_addr + begin, end - begin)
+        if len(raw) != end - begin:
+            return (0, 0)
+        target = self.valobj.GetTarget()
+        counts = []
+        for offset, byte_size, value_type in (use_layout, weak_layout):
+            start = offset - begin
+            counts.append(
+                decode_integer(raw[start:start + byte_size], target, is_signed_integer_type(value_type))
+            )
+        return tuple(counts)
 
     def _get_pointer_child(self):
-        return self.valobj.CreateValueFromData(
-            "pointer", self.value.GetData(), self.value.GetType()
-        )
+        return self.value
 
     def _get_use_count_value(self):
-        if not self.ref_count_obj or not self.ref_count_obj.IsValid():
-            return 0
-        return self._read_atomic_count(
-            self.ref_count_obj.GetChildMemberWithName("mRefCount")
-        )
+        return self.use_count
 
     def _get_use_count_child(self):
         return self.valobj.CreateValueFromData(
             "use_count",
-            create_data_from_uint(self._get_use_count_value(), 4),
+            create_data_from_uint(self.valobj.GetTarget(), self._get_use_count_value(), 4),
             self._count_type(),
         )
 
     def _get_weak_count_value(self):
-        if not self.ref_count_obj or not self.ref_count_obj.IsValid():
-            return 0
-        return self._read_atomic_count(
-            self.ref_count_obj.GetChildMemberWithName("mWeakRefCount")
-        )
+        return self.weak_count
 
     def _get_weak_count_child(self):
         return self.valobj.CreateValueFromData(
             "weak_count",
-            create_data_from_uint(self._get_weak_count_value(), 4),
+            create_data_from_uint(self.valobj.GetTarget(), self._get_weak_count_value(), 4),
             self._count_type(),
         )
 
@@ -108,8 +128,8 @@ class RefCountedPtrSyntheticChildrenProvider:
     def _get_expired_child(self):
         return self.valobj.CreateValueFromData(
             "expired",
-            create_data_from_uint(1 if self._is_expired() else 0, 1),
-            find_type("bool"),
+            create_data_from_uint(self.valobj.GetTarget(), 1 if self._is_expired() else 0, 1),
+            find_type(self.valobj.GetTarget(), "bool"),
         )
 
     def _get_value_child(self):
@@ -118,10 +138,7 @@ class RefCountedPtrSyntheticChildrenProvider:
         ptr = self.value.GetValueAsUnsigned(0)
         if ptr == 0:
             return None
-        deref = self.value.Dereference()
-        if not deref or not deref.IsValid():
-            return None
-        return self.valobj.CreateValueFromData("value", deref.GetData(), deref.GetType())
+        return self.valobj.CreateValueFromAddress("value", ptr, self.value.GetType().GetPointeeType())
 
     def get_child_at_index(self, index):
         if not self._valid_layout or index < 0 or index >= len(self._children_names):
@@ -150,14 +167,29 @@ class RefCountedPtrSyntheticChildrenProvider:
             self._children_names = self.SHARED_CHILDREN_NAMES
             self._child_index = self.SHARED_CHILD_INDEX
 
-        self.value = self.valobj.GetChildMemberWithName("mpValue")
+        self.value = None
+        self._valid_layout = False
+        self.use_count = 0
+        self.weak_count = 0
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        pointer_layout = get_layout(self.valobj).fact("ref_counted_ptr", _resolve_pointer_layout)
+        if not pointer_layout:
+            return False
+        header = read_value_bytes(self.valobj, pointer_layout["header"].size)
+        if not header:
+            return False
+        self.value = self.valobj.CreateChildAtOffset(
+            "pointer", pointer_layout["value_offset"], pointer_layout["value_type"]
+        )
         self._valid_layout = bool(self.value and self.value.IsValid())
-        self.ref_count_obj = None
-        refcount_obj = self.valobj.GetChildMemberWithName("mpRefCount")
-        if refcount_obj and refcount_obj.IsValid() and refcount_obj.GetValueAsUnsigned(0) != 0:
-            self.ref_count_obj = refcount_obj.Dereference()
-
-        return False
+        _, refcount_addr = pointer_layout["header"].unpack(header)
+        if refcount_addr != 0 and pointer_layout["ref_count_layout"]:
+            use_layout, weak_layout = pointer_layout["ref_count_layout"].fact("ref_counts", _resolve_ref_count_layout)
+            self.use_count, self.weak_count = self._read_counts(refcount_addr, use_layout, weak_layout)
+
+        # The counts are data backed children, so they are part of the fingerprint next to the pointers.
+        self.fingerprint = (header, self.use_count, self.weak_count)
+        return self.fingerprint == previous_fingerprint
 
 
 def shared_ptr_SummaryProvider(valobj, internal_dict):
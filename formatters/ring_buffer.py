@@ -0,0 +1,249 @@
+from formatters.constants import TYPE_SIZE_T
+from formatters.deque import Deque_SyntheticChildrenProvider
+from formatters.layout import get_layout, get_type_layout
+from formatters.paging import ChildRange, create_range_child
+from formatters.settings import get_setting
+from formatters.utils import (
+    PointerFields,
+    create_data_from_bytes,
+    create_data_from_uint,
+    decode_field,
+    find_type,
+    format_sequence_summary,
+    get_integer_decoder,
+    get_non_synthetic_value,
+    get_value_display,
+    is_scalar_type,
+    read_memory,
+    read_value_bytes,
+)
+
+STATIC_SYNTHETIC_CHILDREN = {
+    "size": 0,
+    "capacity": 1,
+}
+
+
+def _resolve_ring_buffer_layout(layout):
+    container = layout.member("c")
+    begin = layout.member("mBegin")
+    size = layout.member("mSize")
+    value_type = layout.template_argument_type(0)
+    if not container or not begin or not size or not value_type or not value_type.IsValid():
+        return None
+    value_size = value_type.GetByteSize()
+    if value_size <= 0:
+        return None
+    container_offset, container_type = container
+    begin_offset, begin_type = begin
+    is_deque = (container_type.GetCanonicalType().GetName() or "").startswith("eastl::deque<")
+    if is_deque:
+        # mBegin is a DequeIterator; its slot follows from the subarray it points into.
+        iterator_layout = get_type_layout(layout.target, begin_type)
+        iterator_offsets = [iterator_layout.offset(path) for path in ("mpCurrent", "mpBegin", "mpCurrentArrayPtr")]
+        if None in iterator_offsets:
+            return None
+        begin_fields = PointerFields(layout.target, [begin_offset + offset for offset in iterator_offsets])
+    else:
+        # vector and fixed_vector: mBegin is a T* into [c.mpBegin, c.mpEnd).
+        data_offsets = [layout.offset("c.mpBegin"), layout.offset("c.mpEnd")]
+        if None in data_offsets:
+            return None
+        begin_fields = PointerFields(layout.target, data_offsets + [begin_offset])
+    members = (container, begin, size)
+    return {
+        "is_deque": is_deque,
+        "container_offset": container_offset,
+        "container_type": container_type,
+        "begin_fields": begin_fields,
+        "size_offset": size[0],
+        "size_byte_size": size[1].GetByteSize(),
+        "header_end": max(offset + member_type.GetByteSize() for offset, member_type in members),
+        "value_type": value_type,
+        "value_size": value_size,
+        "is_scalar": is_scalar_type(value_type),
+    }
+
+
+class RingBuffer_SyntheticChildrenProvider:
+    """eastl::ring_buffer, shown in logical order from mBegin.
+
+    The backing container holds capacity + 1 slots and logical index i lives in slot (begin + i) % slots, so any
+    element is addressed in O(1). Over a vector or fixed_vector the visible elements are contiguous on either side
+    of the wrap point, and scalar elements are sliced from at most two bulk reads. Over a deque each element is
+    addressed through the deque's subarray table.
+    """
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.layout = None
+        self.size = 0
+        self.slots = 0
+        self.begin_slot = 0
+        self.data_addr = 0
+        self.deque = None
+        self.range = ChildRange(valobj, 0, get_setting("ring-buffer-max-children"))
+        # Raw bytes of the visible elements of a scalar ring buffer in logical order, read at most once per update().
+        self._window = None
+        self._header = None
+        # (header, window) as of the last update(); window is None until scalar children were sliced from it.
+        self._fingerprint = None
+
+    def _static_children(self):
+        return {} if self.range.is_group else STATIC_SYNTHETIC_CHILDREN
+
+    def _decode_begin_slot(self, header):
+        target = self.valobj.GetTarget()
+        value_size = self.layout["value_size"]
+        if not self.layout["is_deque"]:
+            data_begin, data_end, begin = self.layout["begin_fields"].unpack(header)
+            if data_end < data_begin or not data_begin <= begin <= data_end:
+                return False
+            self.data_addr = data_begin
+            self.slots = (data_end - data_begin) // value_size
+            self.begin_slot = (begin - data_begin) // value_size
+            return True
+        container = self.valobj.CreateChildAtOffset(
+            "c", self.layout["container_offset"], self.layout["container_type"]
+        )
+        self.deque = Deque_SyntheticChildrenProvider(container, None)
+        self.deque.update()
+        if not self.deque.size:
+            return False
+        current, first, array_ptr = self.layout["begin_fields"].unpack(header)
+        subarray = (array_ptr - self.deque.begin_array_ptr) // target.GetAddressByteSize()
+        self.slots = self.deque.size
+        slot_in_subarray = (current - first) // value_size
+        self.begin_slot = subarray * self.deque.subarray_size + slot_in_subarray - self.deque.begin_offset
+        return True
+
+    def update(self):
+        self.size = 0
+        self.slots = 0
+        self.deque = None
+        self.range = ChildRange(self.valobj, 0, get_setting("ring-buffer-max-children"))
+        self._window = None
+        previous_fingerprint, self._fingerprint = self._fingerprint, None
+        self.layout = get_layout(self.valobj).fact("ring_buffer", _resolve_ring_buffer_layout)
+        if not self.layout:
+            return False
+        header = read_value_bytes(self.valobj, self.layout["header_end"])
+        if not header or not self._decode_begin_slot(header):
+            return False
+        size = decode_field(header, self.layout["size_offset"], self.layout["size_byte_size"], self.valobj.GetTarget())
+        if not 0 <= self.begin_slot < self.slots or size >= self.slots:
+            return False
+        self.size = size
+        self.range = ChildRange(self.valobj, self.size, get_setting("ring-buffer-max-children"))
+        # As with vector, struct elements are address backed and scalar ones are checked through the window.
+        self._header = header
+        self._fingerprint = (header, None)
+        if previous_fingerprint and previous_fingerprint[1] is not None:
+            self._get_window()
+        return self._fingerprint == previous_fingerprint
+
+    def physical_slot(self, index):
+        return (self.begin_slot + index) % self.slots
+
+    def _segments(self, lo, count):
+        """(first slot, element count) runs covering logical [lo, lo + count): one, or two across the wrap."""
+        start = self.physical_slot(lo)
+        first = min(count, self.slots - start)
+        return [(start, first)] + ([(0, count - first)] if count > first else [])
+
+    def _element_address(self, index):
+        if self.deque:
+            return self.deque._element_address(self.physical_slot(index))
+        return self.data_addr + self.physical_slot(index) * self.layout["value_size"]
+
+    def _read_elements(self, lo, count):
+        """Raw bytes of logical elements [lo, lo + count) with at most two reads, or b"" over a deque."""
+        if self.deque or count <= 0:
+            return b""
+        value_size = self.layout["value_size"]
+        process = self.valobj.GetProcess()
+        raw = b""
+        for slot, length in self._segments(lo, count):
+            chunk = read_memory(process, self.data_addr + slot * value_size, length * value_size)
+            if len(chunk) != length * value_size:
+                return b""
+            raw += chunk
+        return raw
+
+    def _get_window(self):
+        if self._window is None:
+            count = 0 if self.range.is_grouped else self.range.count
+            self._window = self._read_elements(self.range.lo, count)
+            self._fingerprint = (self._header, self._window)
+        return self._window
+
+    def _create_element_value(self, index, raw):
+        """Element index, sliced from raw when it holds the elements starting at the range start."""
+        value_size = self.layout["value_size"]
+        offset = (index - self.range.lo) * value_size
+        if raw and 0 <= offset and len(raw) >= offset + value_size:
+            return self.valobj.CreateValueFromData(
+                f"[{index}]",
+                create_data_from_bytes(self.valobj.GetTarget(), raw[offset:offset + value_size]),
+                self.layout["value_type"],
+            )
+        address = self._element_address(index)
+        if address == 0:
+            return None
+        return self.valobj.CreateValueFromAddress(f"[{index}]", address, self.layout["value_type"])
+
+    def _create_count_child(self, name, value):
+        return self.valobj.CreateValueFromData(
+            name,
+            create_data_from_uint(self.valobj.GetTarget(), value),
+            find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
+        )
+
+    def num_children(self):
+        return self.range.num_children() + len(self._static_children())
+
+    def get_child_index(self, name):
+        static_children = self._static_children()
+        if name in static_children:
+            return static_children[name]
+        index = self.range.child_index(name)
+        return index + len(static_children) if index >= 0 else -1
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children():
+            return None
+        if not self.range.is_group:
+            if index == 0:
+                return self._create_count_child("size", self.size)
+            if index == 1:
+                return self._create_count_child("capacity", self.slots - 1)
+        child_index = index - len(self._static_children())
+        if self.range.is_grouped:
+            return create_range_child(self.valobj, *self.range.group_bounds(child_index))
+        element_index = self.range.element_index(child_index)
+        return self._create_element_value(element_index, self._get_window() if self.layout["is_scalar"] else None)
+
+    def get_preview(self, count):
+        """Display strings of the first count elements, decoded from at most two reads for integer elements."""
+        count = min(count, self.range.count)
+        if count <= 0:
+            return []
+        first = self.range.lo
+        raw = self._read_elements(first, count) if self.layout["is_scalar"] else None
+        decoder = get_integer_decoder(self.valobj.GetTarget(), self.layout["value_type"])
+        if decoder and raw:
+            return [str(value) for (value,) in decoder.iter_unpack(raw)]
+        return [get_value_display(self._create_element_value(first + index, raw)) for index in range(count)]
+
+
+def RingBuffer_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = RingBuffer_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        # A range group summarizes the elements it covers.
+        size = provider.range.count
+        summary_size = get_setting("ring-buffer-summary-size")
+        preview = provider.get_preview(summary_size) if provider.layout else []
+        return format_sequence_summary(size, preview, truncated=size > summary_size)
+    except Exception:
+        return ""
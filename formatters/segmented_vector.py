@@ -0,0 +1,280 @@
+from formatters.constants import TYPE_SIZE_T
+from formatters.layout import get_layout, get_type_layout
+from formatters.paging import ChildRange, create_range_child
+from formatters.settings import Deadline, get_setting
+from formatters.utils import (
+    PointerFields,
+    create_data_from_uint,
+    create_message_child,
+    decode_field,
+    find_type,
+    format_sequence_summary,
+    get_integer_decoder,
+    get_non_synthetic_value,
+    get_stop_cache,
+    get_value_display,
+    is_scalar_type,
+    read_memory,
+    read_value_bytes,
+)
+from formatters.vector import create_contiguous_element
+
+STATIC_SYNTHETIC_CHILDREN = {
+    "size": 0,
+    "segment_count": 1,
+}
+
+# segment::mPrev holds the previous segment's address with this bit set on the last segment, whose mNext/mEnd union
+# then holds the end of its elements instead of the next segment.
+_IS_LAST_SEGMENT = 1
+
+
+def _resolve_segmented_vector_layout(layout):
+    members = [layout.member(path) for path in ("mFirstSegment", "mLastSegment", "mSegmentCount")]
+    if None in members:
+        return None
+    first, last, segment_count = members
+    segment_layout = get_type_layout(layout.target, first[1].GetPointeeType())
+    if not segment_layout:
+        return None
+    # mNext and mEnd share a union, so the second link is read once and means mEnd on the last segment.
+    link_offsets = [segment_layout.offset(path) for path in ("mPrev", "mNext")]
+    data = segment_layout.member("mData")
+    if None in link_offsets or not data:
+        return None
+    data_offset, data_type = data
+    value_type = data_type.GetArrayElementType()
+    value_size = value_type.GetByteSize()
+    if value_size <= 0:
+        return None
+    return {
+        "header": PointerFields(layout.target, [first[0], last[0]]),
+        "segment_count_offset": segment_count[0],
+        "segment_count_size": segment_count[1].GetByteSize(),
+        "header_end": max(offset + member_type.GetByteSize() for offset, member_type in members),
+        "links": PointerFields(layout.target, link_offsets),
+        "data_offset": data_offset,
+        # segmented_vector<T, Count, Allocator>: every segment but the last holds exactly Count elements.
+        "segment_size": data_type.GetByteSize() // value_size,
+        "value_type": value_type,
+        "value_size": value_size,
+        "is_scalar": is_scalar_type(value_type),
+    }
+
+
+def _get_cached_chain(process, key):
+    """The segment chain walked so far in this stop, keyed by (first segment, last segment, segment count), so range
+    groups and summaries of the same container extend one table instead of walking the chain again."""
+    chains = get_stop_cache(process, "segmented_vector_chains")
+    return chains.setdefault(key, {"segments": [key[0]], "corrupted": False})
+
+
+class SegmentedVector_SyntheticChildrenProvider:
+    """eastl::segmented_vector, a linked chain of segments of segment_size elements each.
+
+    The chain is walked at most once per update(), only as far as the visible range reaches, and the segment
+    addresses are kept in a table, so element i is at slot i % segment_size of segment i // segment_size with no
+    per-element walking. Scalar elements of the visible range are sliced from one bulk read per segment it covers.
+    The walk checks every mPrev back link and stops at mSegmentCount, so a corrupted chain ends in a <corrupted>
+    child instead of hanging the debugger.
+    """
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.layout = None
+        self.size = 0
+        self.segment_count = 0
+        self.segments = ()
+        self.corrupted = False
+        self.deadline = Deadline()
+        self._chain_ends = (0, 0)
+        self.range = ChildRange(valobj, 0, get_setting("segmented-vector-max-children"))
+        # segment index -> (first slot, raw bytes) of the visible scalar elements, read at most once per update().
+        self._windows = None
+        self._header = None
+        # (header, walked segments, windows) as of the last update(); windows is None until children were sliced.
+        self._fingerprint = None
+
+    def _static_children(self):
+        return {} if self.range.is_group else STATIC_SYNTHETIC_CHILDREN
+
+    def _read_links(self, segment_addr):
+        """(mPrev, mNext or mEnd) of a segment, or None."""
+        links = self.layout["links"]
+        raw = read_memory(self.valobj.GetProcess(), segment_addr, links.size)
+        return links.unpack(raw) if len(raw) == links.size else None
+
+    def _walk_to(self, needed):
+        """Extends self.segments to the first needed segments, continuing the walk cached for this stop."""
+        needed = min(needed, self.segment_count)
+        if len(self.segments) >= needed or self.corrupted:
+            return
+        first, last = self._chain_ends
+        chain = _get_cached_chain(self.valobj.GetProcess(), (first, last, self.segment_count))
+        segments = chain["segments"]
+        while len(segments) < needed and not chain["corrupted"]:
+            if self.deadline.expired():
+                break
+            links = self._read_links(segments[-1])
+            expected_prev = segments[-2] if len(segments) > 1 else 0
+            if links is None or links[0] != expected_prev or links[1] == 0:
+                chain["corrupted"] = True
+                break
+            segments.append(links[1])
+        if len(segments) == self.segment_count and segments[-1] != last:
+            chain["corrupted"] = True
+        self.corrupted = chain["corrupted"]
+        self.segments = tuple(segments[:needed])
+
+    def update(self):
+        self.size = 0
+        self.segment_count = 0
+        self.segments = ()
+        self.corrupted = False
+        self.deadline = Deadline()
+        self._chain_ends = (0, 0)
+        self.range = ChildRange(self.valobj, 0, get_setting("segmented-vector-max-children"))
+        self._windows = None
+        previous_fingerprint, self._fingerprint = self._fingerprint, None
+        self.layout = get_layout(self.valobj).fact("segmented_vector", _resolve_segmented_vector_layout)
+        if not self.layout or self.layout["segment_size"] <= 0:
+            return False
+        header = read_value_bytes(self.valobj, self.layout["header_end"])
+        if not header:
+            return False
+        first, last = self.layout["header"].unpack(header)
+        segment_count = decode_field(
+            header, self.layout["segment_count_offset"], self.layout["segment_count_size"], self.valobj.GetTarget()
+        )
+        if segment_count and first and last:
+            # The size follows from the segment count and the end pointer of the last segment alone.
+            links = self._read_links(last)
+            if links is None or not links[0] & _IS_LAST_SEGMENT:
+                return False
+            data_addr = last + self.layout["data_offset"]
+            last_bytes = links[1] - data_addr
+            if not 0 <= last_bytes <= self.layout["segment_size"] * self.layout["value_size"]:
+                return False
+            self.segment_count = segment_count
+            self._chain_ends = (first, last)
+            self.size = (segment_count - 1) * self.layout["segment_size"] + last_bytes // self.layout["value_size"]
+        self.range = ChildRange(self.valobj, self.size, get_setting("segmented-vector-max-children"))
+        if self.range.count and not self.range.is_grouped:
+            self._walk_to((self.range.hi - 1) // self.layout["segment_size"] + 1)
+        # Elements are address backed through the segment table, so it is part of the fingerprint; scalar elements
+        # are sliced from the windows, which are compared as well once they were read.
+        self._header = header
+        self._fingerprint = (header, self.segments, None)
+        if previous_fingerprint and previous_fingerprint[2] is not None:
+            self._get_windows()
+        return self._fingerprint == previous_fingerprint
+
+    def _read_elements(self, lo, count):
+        """{segment index: (first slot, raw bytes)} of elements [lo, lo + count), one read per walked segment."""
+        segment_size = self.layout["segment_size"]
+        value_size = self.layout["value_size"]
+        process = self.valobj.GetProcess()
+        chunks = {}
+        index, end = lo, lo + count
+        while index < end:
+            segment, slot = divmod(index, segment_size)
+            if segment >= len(self.segments):
+                break
+            length = min(segment_size - slot, end - index)
+            address = self.segments[segment] + self.layout["data_offset"] + slot * value_size
+            raw = read_memory(process, address, length * value_size)
+            if len(raw) != length * value_size:
+                break
+            chunks[segment] = (slot, raw)
+            index += length
+        return chunks
+
+    def _get_windows(self):
+        if self._windows is None:
+            count = 0 if self.range.is_grouped else self.range.count
+            self._windows = self._read_elements(self.range.lo, count)
+            self._fingerprint = (self._header, self.segments, tuple(sorted(self._windows.items())))
+        return self._windows
+
+    def _create_element_value(self, index, windows):
+        segment, slot = divmod(index, self.layout["segment_size"])
+        if segment >= len(self.segments):
+            # Only the first unreachable element reports why the rest of the range is missing.
+            if index != max(self.range.lo, len(self.segments) * self.layout["segment_size"]):
+                return None
+            if self.corrupted:
+                return create_message_child(self.valobj, "<corrupted>", "broken segment chain")
+            if self.deadline.exceeded:
+                return create_message_child(self.valobj, "<truncated>", "time budget exceeded")
+            return None
+        raw_lo, raw = (windows or {}).get(segment, (0, None))
+        return create_contiguous_element(
+            self.valobj,
+            slot,
+            self.segments[segment] + self.layout["data_offset"],
+            self.layout["value_type"],
+            raw,
+            raw_lo,
+            name=f"[{index}]",
+        )
+
+    def _create_count_child(self, name, value):
+        return self.valobj.CreateValueFromData(
+            name,
+            create_data_from_uint(self.valobj.GetTarget(), value),
+            find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
+        )
+
+    def num_children(self):
+        return self.range.num_children() + len(self._static_children())
+
+    def get_child_index(self, name):
+        static_children = self._static_children()
+        if name in static_children:
+            return static_children[name]
+        index = self.range.child_index(name)
+        return index + len(static_children) if index >= 0 else -1
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children():
+            return None
+        self.deadline = Deadline()
+        if not self.range.is_group:
+            if index == 0:
+                return self._create_count_child("size", self.size)
+            if index == 1:
+                return self._create_count_child("segment_count", self.segment_count)
+        child_index = index - len(self._static_children())
+        if self.range.is_grouped:
+            return create_range_child(self.valobj, *self.range.group_bounds(child_index))
+        element_index = self.range.element_index(child_index)
+        # A walk that stopped at the time budget of update() continues here with a budget of its own.
+        self._walk_to(element_index // self.layout["segment_size"] + 1)
+        return self._create_element_value(element_index, self._get_windows() if self.layout["is_scalar"] else None)
+
+    def get_preview(self, count):
+        """Display strings of the first count elements, decoded from one read per segment for integer elements."""
+        count = min(count, self.range.count)
+        if count <= 0:
+            return []
+        first = self.range.lo
+        self._walk_to((first + count - 1) // self.layout["segment_size"] + 1)
+        chunks = self._read_elements(first, count) if self.layout["is_scalar"] else None
+        decoder = get_integer_decoder(self.valobj.GetTarget(), self.layout["value_type"])
+        raw = b"".join(chunk for _, chunk in (chunks or {}).values())
+        if decoder and len(raw) == count * self.layout["value_size"]:
+            return [str(value) for (value,) in decoder.iter_unpack(raw)]
+        return [get_value_display(self._create_element_value(first + index, chunks)) for index in range(count)]
+
+
+def SegmentedVector_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = SegmentedVector_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        # A range group summarizes the elements it covers.
+        size = provider.range.count
+        summary_size = get_setting("segmented-vector-summary-size")
+        preview = provider.get_preview(summary_size) if provider.layout else []
+        return format_sequence_summary(size, preview, truncated=size > summary_size)
+    except Exception:
+        return ""
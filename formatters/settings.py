@@ -0,0 +1,96 @@
+import time
+
+from formatters.constants import (
+    ARRAY_MAX_SIZE,
+    ARRAY_MAX_SUMMARY_SIZE,
+    BITSET_MAX_SIZE,
+    BITSET_MAX_SUMMARY_SIZE,
+    DEQUE_MAX_SIZE,
+    DEQUE_MAX_SUMMARY_SIZE,
+    HASH_MAX_SIZE,
+    LIST_MAX_SIZE,
+    LRU_CACHE_MAX_SIZE,
+    LRU_CACHE_MAX_SUMMARY_SIZE,
+    PROVIDER_TIME_BUDGET_MS,
+    RING_BUFFER_MAX_SIZE,
+    RING_BUFFER_MAX_SUMMARY_SIZE,
+    SEGMENTED_VECTOR_MAX_SIZE,
+    SEGMENTED_VECTOR_MAX_SUMMARY_SIZE,
+    SPAN_MAX_SIZE,
+    SPAN_MAX_SUMMARY_SIZE,
+    STRING_MAX_SIZE,
+    STRING_MAX_SUMMARY_SIZE,
+    TREE_MAX_SIZE,
+    TUPLE_VECTOR_MAX_SIZE,
+    TUPLE_VECTOR_MAX_SUMMARY_SIZE,
+    VECTOR_MAX_SIZE,
+    VECTOR_MAX_SUMMARY_SIZE,
+)
+
+# Runtime adjustable limits, changed with `eastl settings set <name> <value>`. The constants are the defaults.
+SETTINGS = {
+    "vector-max-children": (VECTOR_MAX_SIZE, "children per level of a vector before they are grouped into ranges"),
+    "vector-summary-size": (VECTOR_MAX_SUMMARY_SIZE, "elements previewed in a vector summary"),
+    "array-max-children": (ARRAY_MAX_SIZE, "children per level of an array before they are grouped into ranges"),
+    "array-summary-size": (ARRAY_MAX_SUMMARY_SIZE, "elements previewed in an array summary"),
+    "deque-max-children": (DEQUE_MAX_SIZE, "children per level of a deque before they are grouped into ranges"),
+    "deque-summary-size": (DEQUE_MAX_SUMMARY_SIZE, "elements previewed in a deque summary"),
+    "span-max-children": (SPAN_MAX_SIZE, "children per level of a span before they are grouped into ranges"),
+    "span-summary-size": (SPAN_MAX_SUMMARY_SIZE, "elements previewed in a span summary"),
+    "ring-buffer-max-children": (RING_BUFFER_MAX_SIZE, "children per level of a ring_buffer before they are grouped into ranges"),
+    "ring-buffer-summary-size": (RING_BUFFER_MAX_SUMMARY_SIZE, "elements previewed in a ring_buffer summary"),
+    "tuple-vector-max-children": (TUPLE_VECTOR_MAX_SIZE, "rows or column elements per level of a tuple_vector before they are grouped into ranges"),
+    "tuple-vector-summary-size": (TUPLE_VECTOR_MAX_SUMMARY_SIZE, "rows previewed in a tuple_vector summary"),
+    "segmented-vector-max-children": (SEGMENTED_VECTOR_MAX_SIZE, "children per level of a segmented_vector before they are grouped into ranges"),
+    "segmented-vector-summary-size": (SEGMENTED_VECTOR_MAX_SUMMARY_SIZE, "elements previewed in a segmented_vector summary"),
+    "lru-cache-max-children": (LRU_CACHE_MAX_SIZE, "entries of an lru_cache shown, from the most recently used one"),
+    "lru-cache-summary-size": (LRU_CACHE_MAX_SUMMARY_SIZE, "entries previewed in an lru_cache summary"),
+    "bitset-max-children": (BITSET_MAX_SIZE, "bits per level of a bitset/bitvector before they are grouped into ranges"),
+    "bitset-summary-size": (BITSET_MAX_SUMMARY_SIZE, "set bit positions listed in a bitset/bitvector summary"),
+    "tree-max-children": (TREE_MAX_SIZE, "children of a set/map"),
+    "hash-max-children": (HASH_MAX_SIZE, "children of a hash_map/hash_set"),
+    "list-max-children": (LIST_MAX_SIZE, "children of a list/slist"),
+    "string-max-length": (STRING_MAX_SIZE, "characters in a string value child before it is split into chunks"),
+    "string-summary-length": (STRING_MAX_SUMMARY_SIZE, "characters shown in a string summary"),
+    "time-budget-ms": (PROVIDER_TIME_BUDGET_MS, "wall clock milliseconds a provider may spend walking a container, 0 for no limit"),
+}
+
+_values = {}
+
+
+def get_setting(name):
+    return _values.get(name, SETTINGS[name][0])
+
+
+def set_setting(name, value):
+    """Sets a known setting to a non-negative integer, raising KeyError or ValueError otherwise."""
+    if name not in SETTINGS:
+        raise KeyError(name)
+    value = int(value)
+    if value < 0:
+        raise ValueError(f"{name} must not be negative")
+    _values[name] = value
+
+
+def reset_setting(name=None):
+    if name is None:
+        _values.clear()
+        return
+    if name not in SETTINGS:
+        raise KeyError(name)
+    _values.pop(name, None)
+
+
+class Deadline:
+    """Time budget of one provider call that walks (update(), a child or a summary), after which the walk stops and
+    reports truncation. Every such call starts a new one, so expanding more children later continues the walk."""
+
+    def __init__(self):
+        budget_ms = get_setting("time-budget-ms")
+        self._end = time.monotonic() + budget_ms / 1000.0 if budget_ms > 0 else None
+        self.exceeded = False
+
+    def expired(self):
+        if not self.exceeded and self._end is not None and time.monotonic() > self._end:
+            self.exceeded = True
+        return self.exceeded
@@ -1,7 +1,40 @@
-import re
+from formatters.constants import TYPE_SIZE_T
+from formatters.layout import get_layout
+from formatters.paging import ChildRange, create_range_child
+from formatters.settings import get_setting
+from formatters.utils import (
+    PointerFields,
+    create_data_from_uint,
+    decode_field,
+    find_type,
+    format_sequence_summary,
+    get_value_display,
+    read_value_bytes,
+)
+
+# EASTL dynamic extent may appear as size_t(-1) in type names.
+DYNAMIC_EXTENT_VALUES = ((1 << 64) - 1, (1 << 32) - 1, -1)
+
+
+def _resolve_span_layout(layout):
+    data_offset = layout.offset("mStorage.mpData")
+    data_ptr_type = layout.member_type("mStorage.mpData")
+    if data_offset is None or not data_ptr_type:
+        return None
+    data_type = data_ptr_type.GetPointeeType()
+    extent = layout.template_integer_argument(1)
+    if extent in DYNAMIC_EXTENT_VALUES:
+        extent = None
+    size_member = layout.member("mStorage.mnSize")
+    return {
+        "data_fields": PointerFields(layout.target, [data_offset]),
+        "data_type": data_type,
+        "data_size": data_type.GetByteSize() if data_type and data_type.IsValid() else 0,
+        "static_extent": extent,
+        "size_offset": size_member[0] if size_member else None,
+        "size_byte_size": size_member[1].GetByteSize() if size_member else 0,
+    }
 
-from formatters.constants import SPAN_MAX_SIZE
-from formatters.utils import create_data_from_uint, find_type, format_sequence_summary, get_value_display
 
 class span_SyntheticChildrenProvider:
     STATIC_CHILD_NAMES = ("size",)
@@ -11,73 +44,80 @@ class span_SyntheticChildrenProvider:
     def __init__(self, valobj, internal_dict):
         self.valobj = valobj
         self.size = 0
-        self.data_ptr = None
+        self.data_addr = 0
         self.data_type = None
         self.data_size = 0
+        self.range = ChildRange(valobj, 0, get_setting("span-max-children"))
+        self.fingerprint = None
 
-    def _static_extent_from_type_name(self):
-        type_name = self.valobj.GetTypeName() or ""
-        match = re.search(r"eastl::span<.*,\s*(-?\d+)\s*>", type_name)
-        if not match:
-            return None
-        try:
-            return int(match.group(1))
-        except Exception:
-            return None
-
-    def _resolve_size(self):
-        extent = self._static_extent_from_type_name()
-        # EASTL dynamic extent may appear as size_t(-1) in type names.
-        if extent == ((1 << 64) - 1):
-            extent = None
+    def _resolve_size(self, span_layout, header):
+        extent = span_layout["static_extent"]
         if extent is not None and extent >= 0:
             return extent
-        storage = self.valobj.GetChildMemberWithName("mStorage")
-        size_child = storage.GetChildMemberWithName("mnSize")
-        if size_child and size_child.IsValid():
-            return size_child.GetValueAsUnsigned(0)
-        return 0
+        if span_layout["size_offset"] is None:
+            return 0
+        return decode_field(
+            header, span_layout["size_offset"], span_layout["size_byte_size"], self.valobj.GetTarget()
+        )
 
     def _build_size_child(self):
         return self.valobj.CreateValueFromData(
-            "size", create_data_from_uint(self.size), find_type("eastl_size_t")
+            "size",
+            create_data_from_uint(self.valobj.GetTarget(), self.size),
+            find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
         )
 
+    def _static_child_index(self):
+        return {} if self.range.is_group else self.STATIC_CHILD_INDEX
+
     def num_children(self):
-        return min(self.size, SPAN_MAX_SIZE) + self.STATIC_CHILD_COUNT
+        return self.range.num_children() + len(self._static_child_index())
 
     def get_child_index(self, name):
-        if name.startswith("[") and name.endswith("]"):
-            try:
-                return int(name.lstrip("[").rstrip("]")) + self.STATIC_CHILD_COUNT
-            except Exception:
-                return -1
-        return self.STATIC_CHILD_INDEX.get(name, -1)
+        static_child_index = self._static_child_index()
+        if name in static_child_index:
+            return static_child_index[name]
+        index = self.range.child_index(name)
+        return index + len(static_child_index) if index >= 0 else -1
 
     def get_child_at_index(self, index):
         if index < 0 or index >= self.num_children():
             return None
-        if index == 0:
+        if index == 0 and not self.range.is_group:
             return self._build_size_child()
 
-        element_index = index - self.STATIC_CHILD_COUNT
-        if not self.data_ptr or not self.data_ptr.IsValid():
-            return None
-        if self.data_ptr.GetValueAsUnsigned(0) == 0:
+        child_index = index - len(self._static_child_index())
+        if self.range.is_grouped:
+            return create_range_child(self.valobj, *self.range.group_bounds(child_index))
+        return self._build_element_child(self.range.element_index(child_index))
+
+    def _build_element_child(self, element_index):
+        if self.data_addr == 0 or self.data_size <= 0:
             return None
-        return self.data_ptr.CreateChildAtOffset(
+        return self.valobj.CreateValueFromAddress(
             f"[{element_index}]",
-            element_index * self.data_size,
+            self.data_addr + element_index * self.data_size,
             self.data_type,
         )
 
     def update(self):
-        storage = self.valobj.GetChildMemberWithName("mStorage")
-        self.data_ptr = storage.GetChildMemberWithName("mpData")
-        self.data_type = self.data_ptr.GetType().GetPointeeType()
-        self.data_size = self.data_type.GetByteSize() if self.data_type and self.data_type.IsValid() else 0
-        self.size = self._resolve_size()
-        return False
+        self.size = 0
+        self.data_addr = 0
+        self.range = ChildRange(self.valobj, 0, get_setting("span-max-children"))
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        span_layout = get_layout(self.valobj).fact("span", _resolve_span_layout)
+        if not span_layout:
+            return False
+        self.data_type = span_layout["data_type"]
+        self.data_size = span_layout["data_size"]
+        header = read_value_bytes(self.valobj, get_layout(self.valobj).byte_size)
+        if not header:
+            return False
+        (self.data_addr,) = span_layout["data_fields"].unpack(header)
+        self.size = self._resolve_size(span_layout, header)
+        self.range = ChildRange(self.valobj, self.size, get_setting("span-max-children"))
+        self.fingerprint = header
+        return header == previous_fingerprint
 
 
 def span_SummaryProvider(valobj, internal_dict):
@@ -86,10 +126,13 @@ def span_SummaryProvider(valobj, internal_dict):
         probe = raw_valobj if raw_valobj and raw_valobj.IsValid() else valobj
         provider = span_SyntheticChildrenProvider(probe, internal_dict)
         provider.update()
+        # A range group summarizes the elements it covers.
+        size = provider.range.count
+        summary_size = get_setting("span-summary-size")
         preview = [
-            get_value_display(provider.get_child_at_index(index + provider.STATIC_CHILD_COUNT))
-            for index in range(min(provider.size, 6))
+            get_value_display(provider._build_element_child(provider.range.lo + index))
+            for index in range(min(size, summary_size))
         ]
-        return format_sequence_summary(provider.size, preview, truncated=provider.size > 6)
+        return format_sequence_summary(size, preview, truncated=size > summary_size)
     except Exception:
         return ""
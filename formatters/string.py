@@ -1,17 +1,96 @@
 import lldb
 
-from formatters.constants import (
-    STRING_MAX_SIZE
-)
+from formatters.constants import STRING_CHUNK_SIZE
+from formatters.layout import get_layout, has_load_address
+from formatters.settings import get_setting
 from formatters.utils import (
-    create_data_from_cstring,
+    create_data_from_bytes,
     create_data_from_uint,
+    decode_field,
     find_type,
+    get_array_type,
     get_non_synthetic_value,
-    get_raw_type,
     get_system_byte_order,
+    read_memory,
+    read_value_bytes,
 )
 
+def _resolve_string_layout(layout):
+    heap_begin = layout.offset("mPair.mFirst.heap.mpBegin")
+    heap_size = layout.member("mPair.mFirst.heap.mnSize")
+    heap_capacity = layout.offset("mPair.mFirst.heap.mnCapacity")
+    sso_data = layout.member("mPair.mFirst.sso.mData")
+    sso_remaining = layout.member("mPair.mFirst.sso.mRemainingSizeField.mnRemainingSize")
+    value_type = layout.template_argument_type(0)
+    if None in (heap_begin, heap_size, heap_capacity, sso_data, sso_remaining):
+        return None
+    if not value_type or not value_type.IsValid() or value_type.GetByteSize() <= 0:
+        return None
+    value_size = value_type.GetByteSize()
+    layout_member = layout.member("mPair.mFirst")
+    return {
+        "layout_end": layout_member[0] + layout_member[1].GetByteSize(),
+        "heap_begin_offset": heap_begin,
+        "heap_size_offset": heap_size[0],
+        "heap_capacity_offset": heap_capacity,
+        "sso_data_offset": sso_data[0],
+        "sso_remaining_offset": sso_remaining[0],
+        "sso_remaining_size": sso_remaining[1].GetByteSize(),
+        "sso_capacity": sso_data[1].GetByteSize() // value_size,
+        "size_type": heap_size[1],
+        "value_type": value_type,
+        "value_size": value_size,
+    }
+
+def get_character_encoding(target, value_size):
+    """Python codec of strings with characters of value_size bytes, or None."""
+    if value_size == 1:
+        return "utf-8"
+    is_little_endian = get_system_byte_order(target) != lldb.eByteOrderBig
+    if value_size == 2:
+        return "utf-16-le" if is_little_endian else "utf-16-be"
+    if value_size == 4:
+        return "utf-32-le" if is_little_endian else "utf-32-be"
+    return None
+
+def decode_characters(target, raw_bytes, value_size):
+    encoding = get_character_encoding(target, value_size)
+    if not raw_bytes or not encoding:
+        return None
+    return raw_bytes.decode(encoding, errors="replace")
+
+def escape_string_summary(value):
+    if not value:
+        return ""
+    return value.encode("unicode_escape").decode("ascii").replace('"', '\\"')
+
+def get_character_array_type(target, value_type, count):
+    """char[count] for narrow strings (so LLDB shows them as text), value_type[count] otherwise."""
+    element_type = find_type(target, "char") if value_type.GetByteSize() == 1 else value_type
+    return get_array_type(target, element_type, count)
+
+def get_chunk_count(length):
+    """Long strings expose their full contents as [lo:hi] children of STRING_CHUNK_SIZE characters."""
+    if length <= get_setting("string-max-length"):
+        return 0
+    return (length + STRING_CHUNK_SIZE - 1) // STRING_CHUNK_SIZE
+
+def get_chunk_bounds(index, length):
+    lo = index * STRING_CHUNK_SIZE
+    return (lo, min(lo + STRING_CHUNK_SIZE, length))
+
+def parse_chunk_name(name):
+    """Chunk index of a "[lo:hi]" child name, or None."""
+    if not (name.startswith("[") and name.endswith("]") and ":" in name):
+        return None
+    try:
+        lo = int(name[1:-1].split(":", 1)[0])
+    except ValueError:
+        return None
+    if lo % STRING_CHUNK_SIZE != 0:
+        return None
+    return lo // STRING_CHUNK_SIZE
+
 class basic_string_SyntheticChildrenProvider:
     STATIC_SYNTHETIC_CHILDREN = {
         "length": 0,
@@ -22,85 +101,105 @@ class basic_string_SyntheticChildrenProvider:
 
     def __init__(self, valobj, internal_dict):
         self._valobj = valobj
+        self._fingerprint = None
 
     def update(self):
         self._valid_layout = False
+        self._raw_layout = b""
 
-        layout = self._valobj.GetChildMemberWithName("mPair").GetChildMemberWithName("mFirst")
-        if not layout.IsValid():
+        string_layout = get_layout(self._valobj).fact("basic_string", _resolve_string_layout)
+        if not string_layout:
+            self._fingerprint = None
             return False
-
-        sso = layout.GetChildMemberWithName("sso")
-        heap = layout.GetChildMemberWithName("heap")
-        if not sso.IsValid() or not heap.IsValid():
+        # The whole Layout union (heap and SSO views alike) comes from one read and is decoded from those bytes.
+        # Heap characters are not read here at all: the summary reads its own budget and children are address
+        # backed, so a multi-megabyte string costs nothing until it is displayed.
+        raw_layout = read_value_bytes(self._valobj, string_layout["layout_end"])
+        if not raw_layout:
+            self._fingerprint = None
             return False
 
-        remaining_size_field = sso.GetChildMemberWithName("mRemainingSizeField").GetChildMemberWithName("mnRemainingSize")
-        value_type = get_raw_type(self._valobj).GetTemplateArgumentType(0)
-        heap_size = heap.GetChildMemberWithName("mnSize")
-
-        if not heap_size.IsValid() or not remaining_size_field.IsValid() or not value_type.IsValid():
-            return False
+        self._string_layout = string_layout
+        self._raw_layout = raw_layout
+        self._size_type = string_layout["size_type"]
+        self._value_type = string_layout["value_type"]
+        self._value_size = string_layout["value_size"]
+        self._is_heap = self._read_is_heap(string_layout, raw_layout)
+        self._length, self._capacity, self._data_address = self._read_memory(string_layout, raw_layout)
+        # A length beyond the capacity means uninitialized memory; do not offer chunks for it.
+        self._chunk_count = get_chunk_count(self._length) if self._length <= self._capacity else 0
+        self._valid_layout = True
+        # Every data backed child (length/capacity/uses_heap and the SSO value) derives from the layout bytes.
+        unchanged = raw_layout == self._fingerprint
+        self._fingerprint = raw_layout
+        return unchanged
 
-        size_type = heap_size.GetType()
-        if not size_type.IsValid() or value_type.GetByteSize() <= 0:
-            return False
+    def _read_field(self, raw_layout, offset, byte_size):
+        return decode_field(raw_layout, offset, byte_size, self._valobj.GetTarget())
 
-        self._size_type = size_type
-        self._value_type = value_type
-        self._value_size = value_type.GetByteSize()
-        self._is_heap = self._read_is_heap(remaining_size_field)
-        self._length, self._capacity, self._data_address = self._read_memory(heap, sso, heap_size)
-        self._string_value = self._read_string_value()
-        self._valid_layout = True
-        return False
+    def _read_remaining_size_field(self, string_layout, raw_layout):
+        return self._read_field(
+            raw_layout, string_layout["sso_remaining_offset"], string_layout["sso_remaining_size"]
+        ) & 0xFF
 
-    def _read_is_heap(self, remaining_size_field):
-        remaining_size_raw = remaining_size_field.GetValueAsUnsigned(0) & 0xFF
-        sso_mask = 0x1 if get_system_byte_order() == lldb.eByteOrderBig else 0x80
+    def _read_is_heap(self, string_layout, raw_layout):
+        remaining_size_raw = self._read_remaining_size_field(string_layout, raw_layout)
+        sso_mask = 0x1 if get_system_byte_order(self._valobj.GetTarget()) == lldb.eByteOrderBig else 0x80
         return bool(remaining_size_raw & sso_mask)
 
-    def _read_memory(self, heap, sso, heap_size):
+    def _read_memory(self, string_layout, raw_layout):
+        size_byte_size = self._size_type.GetByteSize()
         if self._is_heap:
-            heap_begin = heap.GetChildMemberWithName("mpBegin")
-            heap_capacity = heap.GetChildMemberWithName("mnCapacity")
-            if not heap_begin.IsValid() or not heap_capacity.IsValid():
-                return (0, 0, 0)
-            length = min(heap_size.GetValueAsUnsigned(0), STRING_MAX_SIZE)
-            capacity = self._decode_heap_capacity(heap_capacity.GetValueAsUnsigned(0))
-            data_address = heap_begin.GetValueAsUnsigned(0)
+            length = self._read_field(raw_layout, string_layout["heap_size_offset"], size_byte_size)
+            capacity = self._decode_heap_capacity(
+                self._read_field(raw_layout, string_layout["heap_capacity_offset"], size_byte_size)
+            )
+            data_address = self._read_field(
+                raw_layout, string_layout["heap_begin_offset"], self._valobj.GetTarget().GetAddressByteSize()
+            )
         else:
-            sso_data = sso.GetChildMemberWithName("mData")
-            remaining_size_field = sso.GetChildMemberWithName("mRemainingSizeField").GetChildMemberWithName("mnRemainingSize")
-            if not sso_data.IsValid() or not remaining_size_field.IsValid():
-                return (0, 0, 0)
-            sso_capacity = int(sso_data.GetType().GetByteSize() / self._value_size)
-            remaining_size_raw = remaining_size_field.GetValueAsUnsigned(0) & 0xFF
+            sso_capacity = string_layout["sso_capacity"]
+            remaining_size_raw = self._read_remaining_size_field(string_layout, raw_layout)
             remaining = min(self._decode_sso_remaining_capacity(remaining_size_raw), sso_capacity)
-            length = min(max(0, sso_capacity - remaining), STRING_MAX_SIZE)
+            length = max(0, sso_capacity - remaining)
             capacity = sso_capacity
-            data_address = sso_data.AddressOf().GetValueAsUnsigned(0)
+            data_address = 0
+            if has_load_address(self._valobj):
+                data_address = self._valobj.GetLoadAddress() + string_layout["sso_data_offset"]
         return (length, capacity, data_address)
 
-    def _read_string_value(self):
-        if self._data_address == 0:
-            return None
-        raw_bytes = self._read_bytes(self._data_address, self._length * self._value_size)
-        if not raw_bytes:
-            return None
-        if self._value_size == 1:
-            return raw_bytes.decode("utf-8", errors="replace")
-        is_little_endian = get_system_byte_order() != lldb.eByteOrderBig
-        if self._value_size == 2:
-            return raw_bytes.decode("utf-16-le" if is_little_endian else "utf-16-be", errors="replace")
-        if self._value_size == 4:
-            return raw_bytes.decode("utf-32-le" if is_little_endian else "utf-32-be", errors="replace")
-        return None
+    def read_characters(self, max_length):
+        """Raw bytes of the first max_length characters, with a single read (none for SSO strings)."""
+        byte_length = min(self._length, max_length) * self._value_size
+        if not self._is_heap:
+            offset = self._string_layout["sso_data_offset"]
+            return self._raw_layout[offset:offset + byte_length]
+        return read_memory(self._valobj.GetProcess(), self._data_address, byte_length)
+
+    def read_summary(self):
+        summary_length = get_setting("string-summary-length")
+        value = decode_characters(
+            self._valobj.GetTarget(), self.read_characters(summary_length), self._value_size
+        )
+        if value is None:
+            return ""
+        suffix = "..." if self._length > summary_length else ""
+        return f'"{escape_string_summary(value)}"{suffix}'
 
     def num_children(self):
-        return len(self.STATIC_SYNTHETIC_CHILDREN) if self._valid_layout else 0
+        if not self._valid_layout:
+            return 0
+        return len(self.STATIC_SYNTHETIC_CHILDREN) + self._chunk_count
 
     def get_child_index(self, name):
+        chunk = parse_chunk_name(name)
+        if chunk is not None:
+            # Only the exact name of an existing chunk resolves, like the element names of a ChildRange.
+            if not self._valid_layout or not 0 <= chunk < self._chunk_count:
+                return -1
+            if name != "[%d:%d]" % get_chunk_bounds(chunk, self._length):
+                return -1
+            return len(self.STATIC_SYNTHETIC_CHILDREN) + chunk
         return self.STATIC_SYNTHETIC_CHILDREN.get(name, -1)
 
     def get_child_at_index(self, index):
@@ -114,95 +213,79 @@ class basic_string_SyntheticChildrenProvider:
             return self._create_uses_heap_child()
         if index == 3:
             return self._create_value_child()
-        return None
+        return self._create_chunk_child(index - len(self.STATIC_SYNTHETIC_CHILDREN))
 
     def _decode_sso_remaining_capacity(self, remaining_size_raw):
-        if get_system_byte_order() == lldb.eByteOrderBig:
+        if get_system_byte_order(self._valobj.GetTarget()) == lldb.eByteOrderBig:
             return remaining_size_raw >> 2
         return remaining_size_raw
 
     def _decode_heap_capacity(self, encoded_capacity):
-        if get_system_byte_order() == lldb.eByteOrderBig:
+        if get_system_byte_order(self._valobj.GetTarget()) == lldb.eByteOrderBig:
             return encoded_capacity >> 1
         bits = self._size_type.GetByteSize() * 8
         if bits <= 1:
             return 0
         return encoded_capacity & ~(1 << (bits - 1))
 
-    def _read_bytes(self, address, length):
-        try:
-            error = lldb.SBError()
-            process = self._valobj.GetProcess()
-            if not process or not process.IsValid():
-                return b""
-            value = process.ReadMemory(address, length, error)
-            return value if error.Success() else b""
-        except Exception:
-            return b""
-
-    def _escape_string_summary(self):
-        if not self._string_value:
-            return ""
-        return self._string_value.encode("unicode_escape").decode("ascii").replace('"', '\\"')
-
     def _create_length_child(self):
         return self._valobj.CreateValueFromData(
             "length",
-            create_data_from_uint(self._length, self._size_type.GetByteSize()),
+            create_data_from_uint(self._valobj.GetTarget(), self._length, self._size_type.GetByteSize()),
             self._size_type,
         )
 
     def _create_capacity_child(self):
         return self._valobj.CreateValueFromData(
             "capacity",
-            create_data_from_uint(self._capacity, self._size_type.GetByteSize()),
+            create_data_from_uint(self._valobj.GetTarget(), self._capacity, self._size_type.GetByteSize()),
             self._size_type,
         )
 
     def _create_uses_heap_child(self):
         return self._valobj.CreateValueFromData(
             "uses_heap",
-            create_data_from_uint(1 if self._is_heap else 0, 1),
-            find_type("bool"),
+            create_data_from_uint(self._valobj.GetTarget(), 1 if self._is_heap else 0, 1),
+            find_type(self._valobj.GetTarget(), "bool"),
         )
 
     def _create_value_child(self):
         try:
-            if self._value_size == 1:
-                if self._data_address == 0:
-                    return self._valobj.CreateValueFromData(
-                        "value",
-                        create_data_from_cstring(""),
-                        find_type("char").GetArrayType(1),
-                    )
-                return self._valobj.CreateValueFromData(
-                    "value",
-                    self._valobj.CreateValueFromAddress(
-                        "__eastl_string_value",
-                        self._data_address,
-                        find_type("char").GetArrayType(self._length + 1),
-                    ).GetData(),
-                    find_type("char").GetArrayType(self._length + 1),
+            target = self._valobj.GetTarget()
+            length = min(self._length, get_setting("string-max-length"))
+            if self._data_address != 0:
+                return self._valobj.CreateValueFromAddress(
+                    "value", self._data_address, get_character_array_type(target, self._value_type, length + 1)
                 )
-            if self._data_address == 0:
-                return None
-            return self._valobj.CreateValueFromAddress(
-                "value", self._data_address, self._value_type.GetArrayType(max(1, self._length + 1))
+            # An SSO string without a load address: its characters are already in the layout bytes.
+            return self._valobj.CreateValueFromData(
+                "value",
+                create_data_from_bytes(target, self.read_characters(length) + b"\0" * self._value_size),
+                get_character_array_type(target, self._value_type, length + 1),
             )
         except Exception:
             return None
 
+    def _create_chunk_child(self, chunk):
+        if self._data_address == 0 or chunk >= self._chunk_count:
+            return None
+        lo, hi = get_chunk_bounds(chunk, self._length)
+        return self._valobj.CreateValueFromAddress(
+            f"[{lo}:{hi}]",
+            self._data_address + lo * self._value_size,
+            get_character_array_type(self._valobj.GetTarget(), self._value_type, hi - lo),
+        )
+
+
+def get_string_summary(provider):
+    provider.update()
+    if not provider._valid_layout:
+        return ""
+    return provider.read_summary()
+
 
 def basic_string_SummaryProvider(valobj, internal_dict):
     try:
-        provider = basic_string_SyntheticChildrenProvider(
-            get_non_synthetic_value(valobj), internal_dict
-        )
-        provider.update()
-        if not provider._valid_layout:
-            return ""
-        if provider._string_value is not None:
-            return f'"{provider._escape_string_summary()}"'
-        return ""
+        return get_string_summary(basic_string_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict))
     except Exception:
         return ""
@@ -0,0 +1,117 @@
+from formatters.layout import get_layout
+from formatters.settings import get_setting
+from formatters.string import (
+    basic_string_SyntheticChildrenProvider,
+    get_character_array_type,
+    get_chunk_count,
+)
+from formatters.utils import (
+    create_data_from_bytes,
+    decode_field,
+    get_non_synthetic_value,
+    read_value_bytes,
+)
+
+
+def _resolve_string_view_layout(layout):
+    begin = layout.member("mpBegin")
+    count = layout.member("mnCount")
+    value_type = layout.template_argument_type(0)
+    if not begin or not count:
+        return None
+    if not value_type or not value_type.IsValid() or value_type.GetByteSize() <= 0:
+        return None
+    return {
+        "header_end": max(begin[0] + begin[1].GetByteSize(), count[0] + count[1].GetByteSize()),
+        "begin_offset": begin[0],
+        "count_offset": count[0],
+        "size_type": count[1],
+        "value_type": value_type,
+        "value_size": value_type.GetByteSize(),
+    }
+
+
+class basic_string_view_SyntheticChildrenProvider(basic_string_SyntheticChildrenProvider):
+    """eastl::basic_string_view, decoded by the basic_string engine.
+
+    A view is read like a heap string: update() reads mpBegin and mnCount only, the summary reads its character
+    budget with one read and long views expose the same address backed [lo:hi] chunks, so a view into a huge buffer
+    never reads past what is displayed. Views own no storage, so there is no capacity or uses_heap child.
+    """
+
+    STATIC_SYNTHETIC_CHILDREN = {
+        "length": 0,
+        "value": 1,
+    }
+
+    def update(self):
+        self._valid_layout = False
+        self._raw_layout = b""
+
+        view_layout = get_layout(self._valobj).fact("basic_string_view", _resolve_string_view_layout)
+        if not view_layout:
+            self._fingerprint = None
+            return False
+        raw_layout = read_value_bytes(self._valobj, view_layout["header_end"])
+        if not raw_layout:
+            self._fingerprint = None
+            return False
+
+        target = self._valobj.GetTarget()
+        self._string_layout = view_layout
+        self._raw_layout = raw_layout
+        self._size_type = view_layout["size_type"]
+        self._value_type = view_layout["value_type"]
+        self._value_size = view_layout["value_size"]
+        # The characters always live outside the view, which is what the heap paths of the engine expect.
+        self._is_heap = True
+        self._data_address = decode_field(
+            raw_layout, view_layout["begin_offset"], target.GetAddressByteSize(), target
+        )
+        self._length = decode_field(raw_layout, view_layout["count_offset"], self._size_type.GetByteSize(), target)
+        if self._data_address == 0:
+            self._length = 0
+        self._capacity = self._length
+        self._chunk_count = get_chunk_count(self._length)
+        self._valid_layout = True
+        # length derives from the header and value/chunks are address backed through mpBegin.
+        unchanged = raw_layout == self._fingerprint
+        self._fingerprint = raw_layout
+        return unchanged
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children():
+            return None
+        if index == 0:
+            return self._create_length_child()
+        if index == 1:
+            return self._create_value_child()
+        return self._create_chunk_child(index - len(self.STATIC_SYNTHETIC_CHILDREN))
+
+    def _create_value_child(self):
+        try:
+            target = self._valobj.GetTarget()
+            length = min(self._length, get_setting("string-max-length"))
+            if length == 0:
+                return self._valobj.CreateValueFromData(
+                    "value",
+                    create_data_from_bytes(target, b"\0" * self._value_size),
+                    get_character_array_type(target, self._value_type, 1),
+                )
+            # Views are not null terminated, so the array covers exactly the viewed characters.
+            return self._valobj.CreateValueFromAddress(
+                "value", self._data_address, get_character_array_type(target, self._value_type, length)
+            )
+        except Exception:
+            return None
+
+
+def basic_string_view_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = basic_string_view_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        if not provider._valid_layout:
+            return ""
+        return provider.read_summary()
+    except Exception:
+        return ""
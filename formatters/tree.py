@@ -1,5 +1,85 @@
-from formatters.constants import TREE_MAX_SIZE
-from formatters.utils import create_data_from_uint, find_type, format_sequence_summary, get_value_display, get_non_synthetic_value
+from formatters.constants import TYPE_SIZE_T
+from formatters.layout import get_layout, has_load_address
+from formatters.settings import Deadline, get_setting
+from formatters.utils import (
+    PointerFields,
+    create_data_from_uint,
+    create_message_child,
+    decode_field,
+    find_type,
+    format_sequence_summary,
+    get_field,
+    get_field_offset,
+    get_non_synthetic_value,
+    get_value_display,
+    read_memory,
+    read_value_bytes,
+)
+
+
+def _find_rbtree_base(sbtype):
+    if not sbtype or not sbtype.IsValid():
+        return None
+    if (sbtype.GetName() or "").startswith("eastl::rbtree<"):
+        return sbtype
+    for idx in range(sbtype.GetNumberOfDirectBaseClasses()):
+        found = _find_rbtree_base(sbtype.GetDirectBaseClassAtIndex(idx).GetType().GetCanonicalType())
+        if found:
+            return found
+    return None
+
+
+def _find_node_type(target, rbtree_type, value_type):
+    for value_name in (value_type.GetName(), value_type.GetCanonicalType().GetName()):
+        node_type = target.FindFirstType(f"eastl::rbtree_node<{value_name}>")
+        if node_type and node_type.IsValid() and get_field(node_type, "mValue"):
+            return node_type
+    # rbtree_node<Value> is always named in the signatures of the node allocation helpers.
+    for idx in range(rbtree_type.GetNumberOfMemberFunctions()):
+        return_type = rbtree_type.GetMemberFunctionAtIndex(idx).GetReturnType()
+        if not return_type or not return_type.IsPointerType():
+            continue
+        node_type = return_type.GetPointeeType().GetCanonicalType()
+        if (node_type.GetName() or "").startswith("eastl::rbtree_node<") and get_field(node_type, "mValue"):
+            return node_type
+    return None
+
+
+def _resolve_rbtree_value_layout(target, container_type, node_base_type):
+    """Derives the rbtree_node<Value> payload layout from the container's template arguments and debug info."""
+    rbtree_type = _find_rbtree_base(container_type)
+    if not rbtree_type:
+        return (None, 0)
+    value_type = rbtree_type.GetTemplateArgumentType(1)
+    if not value_type or not value_type.IsValid():
+        return (None, 0)
+    node_type = _find_node_type(target, rbtree_type, value_type)
+    if node_type:
+        field = get_field(node_type, "mValue")
+        return (field.GetType(), field.GetOffsetInBytes())
+    # rbtree_node<Value> only adds mValue after the pointer-aligned node header.
+    return (value_type, node_base_type.GetByteSize())
+
+
+def _resolve_rbtree_layout(layout):
+    anchor = layout.member("mAnchor")
+    size = layout.member("mnSize")
+    if not anchor or not size:
+        return None
+    anchor_offset, node_base_type = anchor
+    header_offsets = [get_field_offset(node_base_type, name) for name in ("mpNodeLeft", "mpNodeRight", "mpNodeParent")]
+    if None in header_offsets:
+        return None
+    value_type, value_offset = _resolve_rbtree_value_layout(layout.target, layout.type, node_base_type)
+    return {
+        "anchor_offset": anchor_offset,
+        "node_base_type": node_base_type,
+        "node_header": PointerFields(layout.target, header_offsets),
+        "size_offset": size[0],
+        "size_byte_size": size[1].GetByteSize(),
+        "value_type": value_type,
+        "value_offset": value_offset,
+    }
 
 
 class RBTree_SyntheticChildrenProvider:
@@ -10,107 +90,98 @@ class RBTree_SyntheticChildrenProvider:
     def __init__(self, valobj, internal_dict):
         self.valobj = valobj
         self.size = 0
-        self.anchor = None
         self.anchor_addr = 0
         self.leftmost_addr = 0
         self.node_base_type = None
-        self.node_ptr_type = None
-
-    def _get_node_base_value(self, addr):
-        if addr == 0 or not self.node_base_type or not self.node_base_type.IsValid():
-            return None
-        return self.valobj.CreateValueFromAddress(
-            "__eastl_tree_node_base", addr, self.node_base_type
-        )
-
-    def _get_node_ptr(self, node_base):
-        if not node_base or not node_base.IsValid():
+        self.value_type = None
+        self.value_offset = 0
+        self.node_header_layout = None
+        # Decoded (left, right, parent) headers keyed by node address, valid until the next update().
+        self.node_headers = {}
+        # In-order node addresses discovered so far, filled lazily up to the highest index requested.
+        self.node_addrs = []
+        self.deadline = Deadline()
+        # Size, anchor header and the walked node addresses seen by the previous update().
+        self.fingerprint = None
+
+    def _read_node_header(self, addr):
+        """Returns (left, right, parent) for the node at addr, reading its header with a single memory read."""
+        if addr == 0 or not self.node_header_layout:
             return (0, 0, 0)
-        left = node_base.GetChildMemberWithName("mpNodeLeft").GetValueAsUnsigned(0)
-        right = node_base.GetChildMemberWithName("mpNodeRight").GetValueAsUnsigned(0)
-        parent = node_base.GetChildMemberWithName("mpNodeParent").GetValueAsUnsigned(0)
-        return (left, right, parent)
+        header = self.node_headers.get(addr)
+        if header is None:
+            raw = read_memory(self.valobj.GetProcess(), addr, self.node_header_layout.size)
+            if not raw:
+                return (0, 0, 0)
+            header = self.node_header_layout.unpack(raw)
+            self.node_headers[addr] = header
+        return header
 
     def _tree_increment(self, node_addr):
         if node_addr == 0:
             return 0
-        node = self._get_node_base_value(node_addr)
-        if not node:
-            return 0
 
-        (_, right, _) = self._get_node_ptr(node)
+        _, right, parent = self._read_node_header(node_addr)
         if right != 0:
             current = right
             while current != 0:
-                current_node = self._get_node_base_value(current)
-                if not current_node:
-                    return 0
-                left, _, _ = self._get_node_ptr(current_node)
+                left, _, _ = self._read_node_header(current)
                 if left == 0:
                     return current
                 current = left
             return 0
 
         current = node_addr
-        _, _, parent = self._get_node_ptr(node)
         while parent != 0 and parent != self.anchor_addr:
-            parent_node = self._get_node_base_value(parent)
-            if not parent_node:
-                return 0
-            _, parent_right, _ = self._get_node_ptr(parent_node)
+            _, parent_right, grandparent = self._read_node_header(parent)
             if parent_right != current:
                 return parent
             current = parent
-            _, _, parent = self._get_node_ptr(parent_node)
+            parent = grandparent
 
         return 0
 
-    def _resolve_node_ptr_type(self):
-        expressions = (
-            "(node_type*)mAnchor.mpNodeParent",
-            "(decltype(*this)::node_type*)mAnchor.mpNodeParent",
-        )
-        for expr in expressions:
-            probe = self.valobj.EvaluateExpression(expr)
-            if probe and probe.IsValid():
-                t = probe.GetType()
-                if t and t.IsValid() and t.IsPointerType():
-                    return t
-        return None
-
     def _build_size_child(self):
         return self.valobj.CreateValueFromData(
-            "size", create_data_from_uint(self.size), find_type("eastl_size_t")
+            "size",
+            create_data_from_uint(self.valobj.GetTarget(), self.size),
+            find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
         )
 
-    def _build_element_child(self, index):
-        node_addr = self.leftmost_addr
-        for _ in range(index):
-            node_addr = self._tree_increment(node_addr)
-            if node_addr == 0:
-                return None
+    def _get_node_addr(self, index):
+        if index < 0 or index >= self.size:
+            return 0
+        if not self.node_addrs:
+            if self.leftmost_addr == 0 or self.leftmost_addr == self.anchor_addr:
+                return 0
+            self.node_addrs.append(self.leftmost_addr)
+        while len(self.node_addrs) <= index:
+            if self.deadline.expired():
+                return 0
+            next_addr = self._tree_increment(self.node_addrs[-1])
+            if next_addr == 0:
+                return 0
+            self.node_addrs.append(next_addr)
+        return self.node_addrs[index]
 
-        if not self.node_ptr_type or not self.node_ptr_type.IsValid():
-            node_base = self._get_node_base_value(node_addr)
-            if node_base and node_base.IsValid():
-                return self.valobj.CreateValueFromData(
-                    f"[{index}]", node_base.GetData(), node_base.GetType()
-                )
+    def _build_element_child(self, index):
+        node_addr = self._get_node_addr(index)
+        if node_addr == 0:
+            if self.deadline.exceeded and index == len(self.node_addrs):
+                return create_message_child(self.valobj, "<truncated>", "time budget exceeded")
             return None
 
-        node_value = self.valobj.CreateValueFromAddress(
-            "__eastl_tree_node", node_addr, self.node_ptr_type.GetPointeeType()
+        if not self.value_type or not self.value_type.IsValid():
+            if not self.node_base_type or not self.node_base_type.IsValid():
+                return None
+            return self.valobj.CreateValueFromAddress(f"[{index}]", node_addr, self.node_base_type)
+
+        return self.valobj.CreateValueFromAddress(
+            f"[{index}]", node_addr + self.value_offset, self.value_type
         )
-        if not node_value or not node_value.IsValid():
-            return None
-        value = node_value.GetChildMemberWithName("mValue")
-        if value and value.IsValid():
-            value_addr = value.AddressOf().GetValueAsUnsigned(0)
-            return self.valobj.CreateValueFromAddress(f"[{index}]", value_addr, value.GetType())
-        return None
 
     def num_children(self):
-        return min(TREE_MAX_SIZE, self.size) + self.STATIC_CHILD_COUNT
+        return min(get_setting("tree-max-children"), self.size) + self.STATIC_CHILD_COUNT
 
     def get_child_index(self, name):
         if name.startswith("[") and name.endswith("]"):
@@ -123,29 +194,56 @@ class RBTree_SyntheticChildrenProvider:
     def get_child_at_index(self, index):
         if index < 0 or index >= self.num_children():
             return None
+        self.deadline = Deadline()
         if index == 0:
             return self._build_size_child()
         return self._build_element_child(index - self.STATIC_CHILD_COUNT)
 
     def update(self):
-        self.anchor = self.valobj.GetChildMemberWithName("mAnchor")
-        self.size = self.valobj.GetChildMemberWithName("mnSize").GetValueAsUnsigned(0)
-        self.anchor_addr = self.anchor.AddressOf().GetValueAsUnsigned(0)
-        self.leftmost_addr = self.anchor.GetChildMemberWithName("mpNodeLeft").GetValueAsUnsigned(
-            0
+        materialized_count = len(self.node_addrs)
+        self.deadline = Deadline()
+        self.size = 0
+        self.anchor_addr = 0
+        self.leftmost_addr = 0
+        self.node_headers = {}
+        self.node_addrs = []
+        tree_layout = get_layout(self.valobj).fact("rbtree", _resolve_rbtree_layout)
+        if not tree_layout:
+            self.fingerprint = None
+            return False
+        self.node_base_type = tree_layout["node_base_type"]
+        self.node_header_layout = tree_layout["node_header"]
+        self.value_type = tree_layout["value_type"]
+        self.value_offset = tree_layout["value_offset"]
+        self.size = decode_field(
+            read_value_bytes(self.valobj, tree_layout["size_byte_size"], tree_layout["size_offset"]),
+            0,
+            tree_layout["size_byte_size"],
+            self.valobj.GetTarget(),
         )
-        self.node_base_type = self.anchor.GetType()
-        self.node_ptr_type = self._resolve_node_ptr_type()
-        return False
+        if has_load_address(self.valobj):
+            self.anchor_addr = self.valobj.GetLoadAddress() + tree_layout["anchor_offset"]
+            self.leftmost_addr, _, _ = self._read_node_header(self.anchor_addr)
+        # An erase followed by an insert can leave size and anchor untouched, so the nodes LLDB already
+        # holds children for are re-walked with raw header reads; that is far cheaper than rebuilding them.
+        if materialized_count:
+            self._get_node_addr(min(materialized_count, self.size) - 1)
+        fingerprint = (self.size, self._read_node_header(self.anchor_addr), tuple(self.node_addrs))
+        unchanged = fingerprint == self.fingerprint
+        self.fingerprint = fingerprint
+        return unchanged
+
+
+def get_tree_summary(provider):
+    provider.update()
+    preview = []
+    if provider.size > 0:
+        preview.append(get_value_display(provider._build_element_child(0)))
+    return format_sequence_summary(provider.size, preview, truncated=provider.size > 1 or provider.deadline.exceeded)
 
 
 def RBTree_SummaryProvider(valobj, internal_dict):
     try:
-        provider = RBTree_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
-        provider.update()
-        preview = []
-        if provider.size > 0:
-            preview.append(get_value_display(provider._build_element_child(0)))
-        return format_sequence_summary(provider.size, preview, truncated=provider.size > 1)
+        return get_tree_summary(RBTree_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict))
     except Exception:
         return ""
@@ -0,0 +1,83 @@
+from formatters.layout import get_layout
+from formatters.utils import get_field, get_non_synthetic_value, get_value_display
+
+_LEAF_PREFIX = "eastl::Internal::TupleLeaf<"
+
+
+def _resolve_tuple_layout(layout):
+    element_types = layout.template_argument_types()
+    if element_types is None:
+        return None
+    if not element_types:
+        return ()
+    impl = layout.member("mImpl")
+    if not impl:
+        return None
+    # mImpl derives from one TupleLeaf<I, T> per element, in element order.
+    impl_offset, impl_type = impl
+    impl_type = impl_type.GetCanonicalType()
+    elements = []
+    for idx in range(impl_type.GetNumberOfDirectBaseClasses()):
+        base = impl_type.GetDirectBaseClassAtIndex(idx)
+        base_type = base.GetType().GetCanonicalType()
+        if not (base_type.GetName() or "").startswith(_LEAF_PREFIX):
+            continue
+        leaf_offset = impl_offset + base.GetOffsetInBytes()
+        value = get_field(base_type, "mValue")
+        if value:
+            elements.append((leaf_offset + value.GetOffsetInBytes(), value.GetType()))
+        elif len(elements) < len(element_types):
+            # Empty element types are a base of their leaf instead of an mValue member.
+            elements.append((leaf_offset, element_types[len(elements)]))
+    return tuple(elements) if len(elements) == len(element_types) else None
+
+
+class Tuple_SyntheticChildrenProvider:
+    """eastl::tuple, with its elements as "[0]".."[n-1]".
+
+    Element offsets are tabulated once per instantiation, so every child is one typed value at a known offset.
+    """
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.elements = None
+        self.fingerprint = None
+
+    def update(self):
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        self.elements = get_layout(self.valobj).fact("tuple", _resolve_tuple_layout)
+        if self.elements is None:
+            return False
+        # Children are children of the tuple itself and the table only depends on its type.
+        self.fingerprint = self.valobj.GetLoadAddress()
+        return self.fingerprint == previous_fingerprint
+
+    def num_children(self):
+        return len(self.elements) if self.elements else 0
+
+    def get_child_index(self, name):
+        if name.startswith("[") and name.endswith("]"):
+            try:
+                index = int(name[1:-1])
+            except ValueError:
+                return -1
+            return index if 0 <= index < self.num_children() else -1
+        return -1
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children():
+            return None
+        offset, element_type = self.elements[index]
+        return self.valobj.CreateChildAtOffset(f"[{index}]", offset, element_type)
+
+
+def Tuple_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = Tuple_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        if provider.elements is None:
+            return ""
+        fields = [get_value_display(provider.get_child_at_index(index)) for index in range(provider.num_children())]
+        return f"({', '.join(fields)})"
+    except Exception:
+        return ""
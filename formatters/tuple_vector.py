@@ -0,0 +1,334 @@
+import re
+
+from formatters.constants import TYPE_SIZE_T
+from formatters.layout import get_layout, has_load_address
+from formatters.paging import ChildRange, create_range_child
+from formatters.settings import get_setting
+from formatters.utils import (
+    PointerFields,
+    create_data_from_uint,
+    decode_field,
+    find_type,
+    format_sequence_summary,
+    get_field,
+    get_integer_decoder,
+    get_non_synthetic_value,
+    get_stop_cache,
+    get_value_display,
+    is_scalar_type,
+    read_memory,
+    read_value_bytes,
+)
+from formatters.vector import create_contiguous_element
+
+_IMPL_PREFIX = "eastl::TupleVecInternal::TupleVecImpl<"
+_LEAF_PREFIX = "eastl::TupleVecInternal::TupleVecLeaf<"
+# Row and column views are copies of the container typed as its TupleVecImpl base, which user code never holds,
+# so their names cannot be confused with an element of some other container.
+_ROW_NAME = re.compile(r"^\[(\d+)\]$")
+_COLUMN_NAME = re.compile(r"^column<(\d+)>(.*)$")
+
+STATIC_CHILD_NAMES = ("size", "capacity")
+
+def _find_impl(sbtype):
+    sbtype = sbtype.GetCanonicalType()
+    if (sbtype.GetName() or "").startswith(_IMPL_PREFIX):
+        return (0, sbtype)
+    for idx in range(sbtype.GetNumberOfDirectBaseClasses()):
+        base = sbtype.GetDirectBaseClassAtIndex(idx)
+        if (base.GetType().GetCanonicalType().GetName() or "").startswith(_IMPL_PREFIX):
+            return (base.GetOffsetInBytes(), base.GetType().GetCanonicalType())
+    return None
+
+
+def _resolve_tuple_vector_layout(layout):
+    impl = _find_impl(layout.type)
+    size = layout.member("mNumElements")
+    capacity = layout.member("mNumCapacity")
+    if not impl or not size or not capacity:
+        return None
+    impl_offset, impl_type = impl
+    # Every TupleVecLeaf<I, T> base holds the T* mpData of one column, in column order.
+    columns = []
+    for idx in range(impl_type.GetNumberOfDirectBaseClasses()):
+        base = impl_type.GetDirectBaseClassAtIndex(idx)
+        base_type = base.GetType().GetCanonicalType()
+        if not (base_type.GetName() or "").startswith(_LEAF_PREFIX):
+            continue
+        data = get_field(base_type, "mpData")
+        if not data:
+            return None
+        data_type = data.GetType().GetPointeeType()
+        if data_type.GetByteSize() <= 0:
+            return None
+        columns.append({
+            "pointer_offset": impl_offset + base.GetOffsetInBytes() + data.GetOffsetInBytes(),
+            "type": data_type,
+            "size": data_type.GetByteSize(),
+            "is_scalar": is_scalar_type(data_type),
+        })
+    if not columns:
+        return None
+    pointer_offsets = [column["pointer_offset"] for column in columns]
+    members = (size, capacity)
+    return {
+        "is_view": layout.name.startswith(_IMPL_PREFIX),
+        "impl_offset": impl_offset,
+        "impl_type": impl_type,
+        "columns": columns,
+        "pointers": PointerFields(layout.target, pointer_offsets),
+        "size_offset": size[0],
+        "size_byte_size": size[1].GetByteSize(),
+        "capacity_offset": capacity[0],
+        "capacity_byte_size": capacity[1].GetByteSize(),
+        "header_end": max(
+            max(pointer_offsets) + layout.target.GetAddressByteSize(),
+            max(offset + member_type.GetByteSize() for offset, member_type in members),
+        ),
+    }
+
+
+def read_column_window(process, column_addr, element_size, lo, count):
+    """Raw bytes of elements [lo, lo + count) of a column.
+
+    A window is read with one memory read and kept in the stop cache of the target, so row views and column views
+    of the same page slice it instead of reading their elements one by one.
+    """
+    windows = get_stop_cache(process, "tuple_vector_windows")
+    cached = windows.get(column_addr)
+    if cached:
+        cached_lo, raw = cached
+        start = (lo - cached_lo) * element_size
+        if lo >= cached_lo and start + count * element_size <= len(raw):
+            return raw[start:start + count * element_size]
+    raw = read_memory(process, column_addr + lo * element_size, count * element_size)
+    if count > 1 and len(raw) == count * element_size:
+        windows[column_addr] = (lo, raw)
+    return raw
+
+
+class TupleVector_SyntheticChildrenProvider:
+    """eastl::tuple_vector, a structure of arrays with one contiguous column per element type.
+
+    The container shows size, capacity, a "column<k>" view per column and the rows, paged into range groups. A row
+    "[i]" shows its fields "[0]".."[k-1]" and a column view shows that column's elements like a vector. The visible
+    page of each column is read with one bulk read and scalar fields are sliced from it.
+    """
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.layout = None
+        self.size = 0
+        self.capacity = 0
+        self.column_addrs = ()
+        self.view = ("container", None)
+        self.range = ChildRange(valobj, 0, get_setting("tuple-vector-max-children"))
+        self._header = None
+        # Raw bytes of the scalar fields of a row view, of the visible page of a scalar column view, or of the
+        # visible page of every scalar column once a container handed out row views.
+        self._window = None
+        self._fingerprint = None
+
+    def _parse_view(self):
+        name = self.valobj.GetName() or ""
+        if self.layout["is_view"]:
+            row = _ROW_NAME.match(name)
+            if row:
+                return ("row", int(row.group(1))), None
+            column = _COLUMN_NAME.match(name)
+            if column:
+                return ("column", int(column.group(1))), column.group(2)
+        return ("container", None), name
+
+    def update(self):
+        had_page = self.view[0] == "container" and self._window is not None
+        self.size = 0
+        self.column_addrs = ()
+        self.view = ("container", None)
+        self.range = ChildRange(self.valobj, 0, get_setting("tuple-vector-max-children"))
+        self._window = None
+        previous_fingerprint, self._fingerprint = self._fingerprint, None
+        self.layout = get_layout(self.valobj).fact("tuple_vector", _resolve_tuple_vector_layout)
+        if not self.layout:
+            return False
+        header = read_value_bytes(self.valobj, self.layout["header_end"])
+        if not header:
+            return False
+        target = self.valobj.GetTarget()
+        size = decode_field(header, self.layout["size_offset"], self.layout["size_byte_size"], target)
+        capacity = decode_field(header, self.layout["capacity_offset"], self.layout["capacity_byte_size"], target)
+        if size > capacity:
+            return False
+        self.size, self.capacity = size, capacity
+        self.column_addrs = self.layout["pointers"].unpack(header)
+        self.view, range_name = self._parse_view()
+        kind, index = self.view
+        if (kind == "row" and index >= self.size) or (kind == "column" and index >= len(self.column_addrs)):
+            self.size = 0
+            self.column_addrs = ()
+            return False
+        self.range = ChildRange(self.valobj, self.size, get_setting("tuple-vector-max-children"), name=range_name)
+        self._header = header
+        if kind == "row":
+            # Row fields are sliced in update(), so their bytes are part of the fingerprint.
+            self._window = self._read_row(index)
+            self._fingerprint = (header, self._window)
+            return self._fingerprint == previous_fingerprint
+        # Rows and groups are address backed copies and size/capacity derive from the header. A column view of
+        # scalars additionally compares its window, like a vector.
+        self._fingerprint = (header, None)
+        if kind == "column" and previous_fingerprint and previous_fingerprint[1] is not None:
+            self._get_window()
+        elif kind == "container" and had_page:
+            # Row views LLDB keeps from the previous stop update next and slice their fields from this page.
+            self._prefetch_page()
+        return self._fingerprint == previous_fingerprint
+
+    def _read_row(self, row):
+        process = self.valobj.GetProcess()
+        return tuple(
+            read_column_window(process, address, column["size"], row, 1) if column["is_scalar"] else None
+            for address, column in zip(self.column_addrs, self.layout["columns"])
+        )
+
+    def _get_window(self):
+        if self._window is None:
+            column = self.view[1]
+            count = 0 if self.range.is_grouped else self.range.count
+            self._window = read_column_window(
+                self.valobj.GetProcess(),
+                self.column_addrs[column],
+                self.layout["columns"][column]["size"],
+                self.range.lo,
+                count,
+            )
+            self._fingerprint = (self._header, self._window)
+        return self._window
+
+    def _prefetch_page(self):
+        """Reads the visible rows of every scalar column once, for the row views created from this page."""
+        if self._window is not None or self.range.is_grouped:
+            return
+        process = self.valobj.GetProcess()
+        self._window = tuple(
+            read_column_window(process, address, column["size"], self.range.lo, self.range.count)
+            for address, column in zip(self.column_addrs, self.layout["columns"])
+            if column["is_scalar"]
+        )
+
+    def _static_child_names(self):
+        if self.view[0] != "container" or self.range.is_group:
+            return ()
+        return STATIC_CHILD_NAMES + tuple(f"column<{k}>" for k in range(len(self.column_addrs)))
+
+    def num_children(self):
+        if not self.layout or not self.column_addrs:
+            return 0
+        if self.view[0] == "row":
+            return len(self.column_addrs)
+        return self.range.num_children() + len(self._static_child_names())
+
+    def get_child_index(self, name):
+        if self.view[0] == "row":
+            field = _ROW_NAME.match(name)
+            return int(field.group(1)) if field and int(field.group(1)) < len(self.column_addrs) else -1
+        static_names = self._static_child_names()
+        if name in static_names:
+            return static_names.index(name)
+        index = self.range.child_index(name)
+        return index + len(static_names) if index >= 0 else -1
+
+    def _create_view(self, name):
+        impl_type = self.layout["impl_type"]
+        if has_load_address(self.valobj):
+            return self.valobj.CreateValueFromAddress(
+                name, self.valobj.GetLoadAddress() + self.layout["impl_offset"], impl_type
+            )
+        return self.valobj.CreateChildAtOffset(name, self.layout["impl_offset"], impl_type)
+
+    def _create_field(self, row, column, raw):
+        # Fields are named by column; the row index is the name of the row view itself.
+        return create_contiguous_element(
+            self.valobj, row, self.column_addrs[column], self.layout["columns"][column]["type"], raw, row, f"[{column}]"
+        )
+
+    def _create_count_child(self, name, value):
+        return self.valobj.CreateValueFromData(
+            name,
+            create_data_from_uint(self.valobj.GetTarget(), value),
+            find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
+        )
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children():
+            return None
+        kind, view_index = self.view
+        if kind == "row":
+            return self._create_field(view_index, index, self._window[index])
+        static_names = self._static_child_names()
+        if index < len(static_names):
+            name = static_names[index]
+            if name == "size":
+                return self._create_count_child(name, self.size)
+            if name == "capacity":
+                return self._create_count_child(name, self.capacity)
+            return self._create_view(name)
+        child_index = index - len(static_names)
+        if self.range.is_grouped:
+            prefix = f"column<{view_index}>" if kind == "column" else ""
+            return create_range_child(self.valobj, *self.range.group_bounds(child_index), prefix=prefix)
+        element = self.range.element_index(child_index)
+        if kind == "container":
+            self._prefetch_page()
+            return self._create_view(f"[{element}]")
+        column = self.layout["columns"][view_index]
+        return create_contiguous_element(
+            self.valobj,
+            element,
+            self.column_addrs[view_index],
+            column["type"],
+            self._get_window() if column["is_scalar"] else None,
+            self.range.lo,
+        )
+
+    def _preview_column(self, column, lo, count):
+        """Display strings of elements [lo, lo + count) of a column, decoded from one read for integers."""
+        layout = self.layout["columns"][column]
+        raw = read_column_window(self.valobj.GetProcess(), self.column_addrs[column], layout["size"], lo, count)
+        decoder = get_integer_decoder(self.valobj.GetTarget(), layout["type"])
+        if decoder and len(raw) == count * layout["size"]:
+            return [str(value) for (value,) in decoder.iter_unpack(raw)]
+        raw = raw if layout["is_scalar"] else None
+        return [
+            get_value_display(
+                create_contiguous_element(self.valobj, lo + i, self.column_addrs[column], layout["type"], raw, lo)
+            )
+            for i in range(count)
+        ]
+
+    def get_summary(self):
+        kind, view_index = self.view
+        if kind == "row":
+            fields = [self._create_field(view_index, k, raw) for k, raw in enumerate(self._window)]
+            return f"({', '.join(get_value_display(field) for field in fields)})"
+        size = self.range.count
+        summary_size = get_setting("tuple-vector-summary-size")
+        count = min(size, summary_size)
+        if kind == "column":
+            preview = self._preview_column(view_index, self.range.lo, count)
+        else:
+            # One read per column for the previewed rows, then the rows are zipped together.
+            columns = [self._preview_column(k, self.range.lo, count) for k in range(len(self.column_addrs))]
+            preview = [f"({', '.join(fields)})" for fields in zip(*columns)]
+        return format_sequence_summary(size, preview, truncated=size > summary_size)
+
+
+def TupleVector_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = TupleVector_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        if not provider.layout or not provider.column_addrs:
+            return ""
+        return provider.get_summary()
+    except Exception:
+        return ""
@@ -1,3 +1,4 @@
+from formatters.layout import get_layout
 from formatters.utils import get_non_synthetic_value
 
 class unique_ptr_SyntheticChildrenProvider:
@@ -9,6 +10,7 @@ class unique_ptr_SyntheticChildrenProvider:
     def __init__(self, valobj, internal_dict):
         self.valobj = valobj
         self.pointer = None
+        self.fingerprint = None
 
     def num_children(self):
         return len(self.STATIC_SYNTHETIC_CHILDREN) if self.pointer and self.pointer.IsValid() else 0
@@ -24,23 +26,25 @@ class unique_ptr_SyntheticChildrenProvider:
         return None
 
     def update(self):
-        pair = self.valobj.GetChildMemberWithName("mPair")
-        self.pointer = pair.GetChildMemberWithName("mFirst")
-        return False
+        self.pointer = None
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        member = get_layout(self.valobj).member("mPair.mFirst")
+        if member:
+            self.pointer = self.valobj.CreateChildAtOffset("pointer", member[0], member[1])
+        if not self.pointer or not self.pointer.IsValid():
+            return False
+        # The value child lives at the pointee address, so it stays valid for as long as the pointer does.
+        self.fingerprint = self.pointer.GetValueAsUnsigned(0)
+        return self.fingerprint == previous_fingerprint
 
     def _get_pointer_child(self):
-        return self.valobj.CreateValueFromData(
-            "pointer", self.pointer.GetData(), self.pointer.GetType()
-        )
+        return self.pointer
 
     def _get_value_child(self):
         ptr = self.pointer.GetValueAsUnsigned(0)
         if ptr == 0:
             return None
-        value = self.pointer.Dereference()
-        if not value or not value.IsValid():
-            return None
-        return self.valobj.CreateValueFromData("value", value.GetData(), value.GetType())
+        return self.valobj.CreateValueFromAddress("value", ptr, self.pointer.GetType().GetPointeeType())
 
     
 
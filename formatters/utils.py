@@ -1,41 +1,219 @@
+import struct
+
 import lldb
 
-def get_system_byte_order():
-    return lldb.debugger.GetSelectedTarget().GetByteOrder()
+# Per-target memo of debug info lookups. FindFirstType scans every compile unit, so its results (and derived
+# types such as char[N]) are kept for as long as the target's module list is unchanged.
+_TARGET_CACHES = {}
+
+def _get_module_signature(target):
+    num_modules = target.GetNumModules()
+    if num_modules == 0:
+        return (0, "")
+    return (num_modules, target.GetModuleAtIndex(num_modules - 1).GetUUIDString() or "")
+
+def get_target_cache(target):
+    """Returns the memo dictionary of a target, dropping it whenever modules were loaded or unloaded."""
+    key = get_target_key(target)
+    signature = _get_module_signature(target)
+    cache = _TARGET_CACHES.get(key)
+    if cache is None or cache["modules"] != signature:
+        cache = {"modules": signature}
+        _TARGET_CACHES[key] = cache
+    return cache
+
+def get_stop_cache(process, key):
+    """Returns the memo dictionary key of the target of process for data read from its memory, emptied whenever
+    the stop ID changes, counting expression evaluations since they may write memory."""
+    cache = get_target_cache(process.GetTarget()).setdefault(key, {"stop": None, "entries": {}})
+    stop = process.GetStopID(True)
+    if cache["stop"] != stop:
+        cache["stop"] = stop
+        cache["entries"] = {}
+    return cache["entries"]
 
-def create_data_from_uint(value: int, byte_size=None) -> lldb.SBData:
-    target = lldb.debugger.GetSelectedTarget()
+def _memoize(target, key, resolver):
+    cache = get_target_cache(target)
+    if key not in cache:
+        cache[key] = resolver()
+    return cache[key]
+
+def get_system_byte_order(target):
+    return target.GetByteOrder()
+
+def create_data_from_uint(target, value: int, byte_size=None) -> lldb.SBData:
     data_byte_size = byte_size if byte_size is not None else target.GetAddressByteSize()
+    byte_order = get_system_byte_order(target)
 
     if data_byte_size <= 4:
         return lldb.SBData.CreateDataFromUInt32Array(
-            get_system_byte_order(), data_byte_size, [value & 0xFFFFFFFF]
+            byte_order, data_byte_size, [value & 0xFFFFFFFF]
         )
 
     if hasattr(lldb.SBData, "CreateDataFromUInt64Array"):
         return lldb.SBData.CreateDataFromUInt64Array(
-            get_system_byte_order(), data_byte_size, [value & 0xFFFFFFFFFFFFFFFF]
+            byte_order, data_byte_size, [value & 0xFFFFFFFFFFFFFFFF]
         )
 
     return lldb.SBData.CreateDataFromUInt32Array(
-        get_system_byte_order(), min(data_byte_size, 4), [value & 0xFFFFFFFF]
+        byte_order, min(data_byte_size, 4), [value & 0xFFFFFFFF]
     )
 
-def create_data_from_cstring(value: str) -> lldb.SBData:
-    addr_byte_size = lldb.debugger.GetSelectedTarget().GetAddressByteSize()
+def create_data_from_cstring(target, value: str) -> lldb.SBData:
     return lldb.SBData.CreateDataFromCString(
-        get_system_byte_order(), addr_byte_size, value
+        get_system_byte_order(target), target.GetAddressByteSize(), value
     )
 
-def create_data_from_bytes(value: bytes) -> lldb.SBData:
+def create_data_from_bytes(target, value: bytes) -> lldb.SBData:
+    data = lldb.SBData()
+    error = lldb.SBError()
+    data.SetData(error, value, get_system_byte_order(target), target.GetAddressByteSize())
+    if error.Success():
+        return data
     if hasattr(lldb.SBData, "CreateDataFromUInt8Array"):
         return lldb.SBData.CreateDataFromUInt8Array(
-            get_system_byte_order(), 1, list(value)
+            get_system_byte_order(target), 1, list(value)
         )
-    return create_data_from_cstring(value.decode("latin-1"))
+    return create_data_from_cstring(target, value.decode("latin-1"))
+
+def read_memory(process, address, size) -> bytes:
+    if address == 0 or size <= 0 or not process or not process.IsValid():
+        return b""
+    error = lldb.SBError()
+    value = process.ReadMemory(address, size, error)
+    return value if error.Success() and value else b""
+
+def read_value_bytes(valobj, size, offset=0) -> bytes:
+    """Reads size bytes at offset inside valobj: from target memory when it has a load address, else from its data."""
+    address = valobj.GetLoadAddress()
+    if address != lldb.LLDB_INVALID_ADDRESS:
+        return read_memory(valobj.GetProcess(), address + offset, size)
+    data = valobj.GetData()
+    if not data or not data.IsValid() or data.GetByteSize() < offset + size:
+        return b""
+    error = lldb.SBError()
+    value = data.ReadRawData(error, offset, size)
+    return value if error.Success() and value else b""
+
+def get_target_key(target):
+    """Identifies a target and the process it runs, so per-type caches never leak across binaries or launches."""
+    process = target.GetProcess()
+    process_id = process.GetUniqueID() if process and process.IsValid() else 0
+    executable = target.GetExecutable()
+    executable_path = str(executable) if executable and executable.IsValid() else ""
+    return (executable_path, target.GetTriple() or "", process_id)
+
+def get_field(sbtype, field_name):
+    sbtype = sbtype.GetCanonicalType()
+    for idx in range(sbtype.GetNumberOfFields()):
+        field = sbtype.GetFieldAtIndex(idx)
+        if field.GetName() == field_name:
+            return field
+    return None
+
+def get_field_offset(sbtype, field_name):
+    field = get_field(sbtype, field_name)
+    return field.GetOffsetInBytes() if field else None
+
+def decode_integer(raw, target, signed=False):
+    byteorder = "big" if target.GetByteOrder() == lldb.eByteOrderBig else "little"
+    return int.from_bytes(raw, byteorder, signed=signed)
+
+def decode_field(raw, offset, byte_size, target, signed=False):
+    if offset is None or len(raw) < offset + byte_size:
+        return 0
+    return decode_integer(raw[offset:offset + byte_size], target, signed)
 
-def find_type(type_name: str) -> lldb.SBType:
-    return lldb.debugger.GetSelectedTarget().FindFirstType(type_name)
+# Decodes pointer-sized fields at fixed byte offsets from raw memory using a precompiled struct layout,
+# so node-based traversals can read a whole node header with one ReadMemory call instead of going
+# through an SBValue per field.
+class PointerFields:
+    def __init__(self, target, offsets):
+        pointer_size = target.GetAddressByteSize()
+        pointer_code = "Q" if pointer_size == 8 else "I"
+        layout = ">" if target.GetByteOrder() == lldb.eByteOrderBig else "<"
+        self._order = sorted(range(len(offsets)), key=lambda idx: offsets[idx])
+        position = 0
+        for idx in self._order:
+            layout += f"{offsets[idx] - position}x{pointer_code}"
+            position = offsets[idx] + pointer_size
+        self._struct = struct.Struct(layout)
+        self.size = self._struct.size
+
+    def unpack(self, raw):
+        values = self._struct.unpack_from(raw)
+        result = [0] * len(values)
+        for position, idx in enumerate(self._order):
+            result[idx] = values[position]
+        return tuple(result)
+
+# Builtin types LLDB renders as characters or booleans rather than numbers.
+_NON_NUMERIC_BASIC_TYPES = {
+    getattr(lldb, name)
+    for name in (
+        "eBasicTypeBool",
+        "eBasicTypeChar",
+        "eBasicTypeSignedChar",
+        "eBasicTypeUnsignedChar",
+        "eBasicTypeWChar",
+        "eBasicTypeSignedWChar",
+        "eBasicTypeUnsignedWChar",
+        "eBasicTypeChar8",
+        "eBasicTypeChar16",
+        "eBasicTypeChar32",
+    )
+    if hasattr(lldb, name)
+}
+
+def is_scalar_type(sbtype):
+    """True for trivially copyable element types (builtins, pointers, enums) that can be bulk read and sliced."""
+    if not sbtype or not sbtype.IsValid():
+        return False
+    sbtype = sbtype.GetCanonicalType()
+    type_class = sbtype.GetTypeClass()
+    scalar_classes = lldb.eTypeClassBuiltin | lldb.eTypeClassPointer | lldb.eTypeClassEnumeration
+    return bool(type_class & scalar_classes) and sbtype.GetByteSize() > 0
+
+def get_integer_decoder(target, sbtype):
+    """Returns a struct.Struct decoding one element of an integer type LLDB displays as a plain number, else None."""
+    if not sbtype or not sbtype.IsValid():
+        return None
+    sbtype = sbtype.GetCanonicalType()
+
+    def resolve():
+        flags = sbtype.GetTypeFlags()
+        if not flags & lldb.eTypeIsInteger or flags & lldb.eTypeIsEnumeration:
+            return None
+        if sbtype.GetBasicType() in _NON_NUMERIC_BASIC_TYPES:
+            return None
+        code = {2: "h", 4: "i", 8: "q"}.get(sbtype.GetByteSize())
+        if code is None:
+            return None
+        if not flags & lldb.eTypeIsSigned:
+            code = code.upper()
+        return struct.Struct((">" if target.GetByteOrder() == lldb.eByteOrderBig else "<") + code)
+
+    return _memoize(target, ("integer_decoder", sbtype.GetName()), resolve)
+
+def find_type(target, type_name: str) -> lldb.SBType:
+    return _memoize(target, ("type", type_name), lambda: target.FindFirstType(type_name))
+
+def get_array_type(target, element_type, count: int) -> lldb.SBType:
+    return _memoize(
+        target,
+        ("array", element_type.GetName(), count),
+        lambda: element_type.GetArrayType(count),
+    )
+
+def find_array_type(target, element_type_name: str, count: int) -> lldb.SBType:
+    return get_array_type(target, find_type(target, element_type_name), count)
+
+def create_message_child(valobj, name, message):
+    """A char array child carrying a note for the user, e.g. that a provider stopped early."""
+    target = valobj.GetTarget()
+    return valobj.CreateValueFromData(
+        name, create_data_from_cstring(target, message), find_array_type(target, "char", len(message) + 1)
+    )
 
 # This function is most helpful in our summary providers that receive a synthetic instance of our object.
 # To provide the summary, we sometimes need to query information from the object and the logic is already
@@ -0,0 +1,96 @@
+from formatters.constants import TYPE_SIZE_T
+from formatters.layout import get_layout
+from formatters.utils import (
+    create_data_from_uint,
+    decode_field,
+    find_type,
+    get_non_synthetic_value,
+    get_value_display,
+    read_value_bytes,
+)
+
+STATIC_SYNTHETIC_CHILDREN = {
+    "index": 0,
+    "value": 1,
+}
+
+
+def _resolve_variant_layout(layout):
+    index = layout.member("mIndex")
+    buffer = layout.member("mStorage.mBuffer")
+    alternatives = layout.template_argument_types()
+    if not index or not buffer or not alternatives:
+        return None
+    # Dispatch table: every alternative is constructed at the start of the aligned buffer, so mIndex alone selects
+    # the (type, offset) of the active value.
+    return {
+        "index_offset": index[0],
+        "index_size": index[1].GetByteSize(),
+        "alternatives": tuple((alternative, buffer[0]) for alternative in alternatives),
+    }
+
+
+class Variant_SyntheticChildrenProvider:
+    """eastl::variant, with the active alternative index and its value.
+
+    Alternative types and offsets are tabulated once per instantiation, so a display is one read of mIndex followed
+    by one typed child, however many alternatives the variant has. A valueless variant only shows its index.
+    """
+
+    def __init__(self, valobj, internal_dict):
+        self.valobj = valobj
+        self.layout = None
+        self.index = None
+        self.alternative = None
+        self.fingerprint = None
+
+    def update(self):
+        self.index = None
+        self.alternative = None
+        previous_fingerprint, self.fingerprint = self.fingerprint, None
+        self.layout = get_layout(self.valobj).fact("variant", _resolve_variant_layout)
+        if not self.layout:
+            return False
+        raw = read_value_bytes(self.valobj, self.layout["index_size"], self.layout["index_offset"])
+        if not raw:
+            return False
+        self.index = decode_field(raw, 0, len(raw), self.valobj.GetTarget())
+        # variant_npos, or any index out of range, leaves the variant without a value.
+        if self.index < len(self.layout["alternatives"]):
+            self.alternative = self.layout["alternatives"][self.index]
+        self.fingerprint = (self.valobj.GetLoadAddress(), self.index)
+        return self.fingerprint == previous_fingerprint
+
+    def num_children(self):
+        if self.index is None:
+            return 0
+        return len(STATIC_SYNTHETIC_CHILDREN) if self.alternative else 1
+
+    def get_child_index(self, name):
+        return STATIC_SYNTHETIC_CHILDREN.get(name, -1)
+
+    def get_child_at_index(self, index):
+        if index < 0 or index >= self.num_children():
+            return None
+        if index == 0:
+            return self.valobj.CreateValueFromData(
+                "index",
+                create_data_from_uint(self.valobj.GetTarget(), self.index),
+                find_type(self.valobj.GetTarget(), TYPE_SIZE_T),
+            )
+        value_type, offset = self.alternative
+        return self.valobj.CreateChildAtOffset("value", offset, value_type)
+
+
+def Variant_SummaryProvider(valobj, internal_dict):
+    try:
+        provider = Variant_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict)
+        provider.update()
+        if provider.index is None:
+            return ""
+        if not provider.alternative:
+            return "valueless_by_exception"
+        value = provider.get_child_at_index(1)
+        return f"({provider.alternative[0].GetDisplayTypeName()}) {get_value_display(value)}"
+    except Exception:
+        return ""
@@ -1,12 +1,18 @@
-from formatters.constants import (
-    VECTOR_MAX_SIZE,
-    VECTOR_MAX_SUMMARY_SIZE,
-    TYPE_SIZE_T
-)
+from formatters.constants import TYPE_SIZE_T
+from formatters.layout import get_layout
+from formatters.paging import ChildRange, create_range_child
+from formatters.settings import get_setting
 from formatters.utils import (
+    PointerFields,
+    create_data_from_bytes,
     create_data_from_uint,
     find_type,
+    get_integer_decoder,
+    get_non_synthetic_value,
     get_value_display,
+    is_scalar_type,
+    read_memory,
+    read_value_bytes,
 )
 
 STATIC_SYNTHETIC_CHILDREN = {
@@ -14,78 +20,150 @@ STATIC_SYNTHETIC_CHILDREN = {
     "capacity": 1
 }
 
+def _resolve_vector_layout(layout):
+    offsets = [layout.offset(path) for path in ("mpBegin", "mpEnd", "mCapacityAllocator.mFirst")]
+    begin_type = layout.member_type("mpBegin")
+    if None in offsets or not begin_type:
+        return None
+    data_type = begin_type.GetPointeeType()
+    return (PointerFields(layout.target, offsets), data_type, data_type.GetByteSize(), is_scalar_type(data_type))
+
+def create_contiguous_element(valobj, index, begin_addr, data_type, raw=None, raw_lo=0, name=None):
+    """Child "[index]" (or name) of a contiguous array at begin_addr: sliced from raw (the elements from raw_lo on)
+    when it covers the element, else address backed."""
+    name = name or f"[{index}]"
+    data_size = data_type.GetByteSize()
+    offset = (index - raw_lo) * data_size
+    if raw and 0 <= offset and len(raw) >= offset + data_size:
+        return valobj.CreateValueFromData(
+            name, create_data_from_bytes(valobj.GetTarget(), raw[offset:offset + data_size]), data_type
+        )
+    return valobj.CreateValueFromAddress(name, begin_addr + index * data_size, data_type)
+
 class VectorBase_SyntheticChildrenProvider:
     def __init__(self, valobj, internal_dict):
         self._valobj = valobj
+        self._begin_addr = 0
+        self._size = 0
+        self._capacity = 0
+        self._range = ChildRange(valobj, 0, get_setting("vector-max-children"))
+        self._is_scalar = False
+        self._header = None
+        # Raw bytes of the visible elements of a scalar vector, read at most once per update().
+        self._window = None
+        # (header, window) as of the last update(); window is None until scalar children were sliced from it.
+        self._fingerprint = None
 
     def update(self):
+        self._begin_addr = 0
+        self._size = 0
+        self._capacity = 0
+        self._range = ChildRange(self._valobj, 0, get_setting("vector-max-children"))
+        self._window = None
+        previous_fingerprint, self._fingerprint = self._fingerprint, None
         try:
-            self._begin_addr = self._valobj.GetChildMemberWithName("mpBegin")
-            self._end_addr = self._valobj.GetChildMemberWithName("mpEnd")
-            self._capacity_addr = self._valobj.GetChildMemberWithName(
-                "mCapacityAllocator"
-            ).GetChildMemberWithName("mFirst")
-            self._data_type = self._begin_addr.GetType().GetPointeeType()
-            self._data_size = self._data_type.GetByteSize()
-            self._size = self._calculate_size()
-            self._capacity = self._calculate_capacity()
-            
+            vector_layout = get_layout(self._valobj).fact("vector", _resolve_vector_layout)
+            if not vector_layout:
+                return False
+            header_fields, self._data_type, self._data_size, self._is_scalar = vector_layout
+            header = read_value_bytes(self._valobj, header_fields.size)
+            if not header or self._data_size <= 0:
+                return False
+            begin_addr, end_addr, capacity_addr = header_fields.unpack(header)
+            self._begin_addr = begin_addr
+            self._size = self._calculate_size(begin_addr, end_addr, capacity_addr)
+            self._capacity = self._calculate_capacity(begin_addr, capacity_addr)
+            self._range = ChildRange(self._valobj, self._size, get_setting("vector-max-children"))
+            # size/capacity derive from the header and struct elements are address backed, so an unchanged
+            # begin/end/capacity triple keeps them valid. Scalar elements are sliced from the window instead,
+            # which then has to be compared as well.
+            self._header = header
+            self._fingerprint = (header, None)
+            if previous_fingerprint and previous_fingerprint[1] is not None:
+                self._get_window()
         except Exception as e:
             print(e)
-        return False
+        return self._fingerprint is not None and self._fingerprint == previous_fingerprint
+
+    def _static_children(self):
+        return {} if self._range.is_group else STATIC_SYNTHETIC_CHILDREN
 
     def num_children(self):
-        return min(VECTOR_MAX_SIZE, self._size) + len(STATIC_SYNTHETIC_CHILDREN)
+        return self._range.num_children() + len(self._static_children())
 
     def get_child_index(self, name):
-        if name.startswith("[") and name.endswith("]"):
-            try:
-                return int(name.lstrip("[").rstrip("]")) + len(STATIC_SYNTHETIC_CHILDREN)
-            except Exception:
-                return -1
-        return STATIC_SYNTHETIC_CHILDREN.get(name, -1)
+        static_children = self._static_children()
+        if name in static_children:
+            return static_children[name]
+        index = self._range.child_index(name)
+        return index + len(static_children) if index >= 0 else -1
 
     def get_child_at_index(self, index):
         if index < 0 or index >= self.num_children():
             return None
-        if index == 0:
-            return self._create_size_child(self._size)
-        if index == 1:
-            return self._create_capacity_child(self._capacity)
+        if not self._range.is_group:
+            if index == 0:
+                return self._create_size_child(self._size)
+            if index == 1:
+                return self._create_capacity_child(self._capacity)
         try:
-            return self._create_element_child(index)
+            return self._create_element_child(index - len(self._static_children()))
         except Exception:
             return None
 
     def _create_size_child(self, size):
         return self._valobj.CreateValueFromData(
             "size",
-            create_data_from_uint(size),
-            find_type(TYPE_SIZE_T),
+            create_data_from_uint(self._valobj.GetTarget(), size),
+            find_type(self._valobj.GetTarget(), TYPE_SIZE_T),
         )
 
     def _create_capacity_child(self, capacity):
         return self._valobj.CreateValueFromData(
             "capacity",
-            create_data_from_uint(capacity),
-            find_type(TYPE_SIZE_T),
+            create_data_from_uint(self._valobj.GetTarget(), capacity),
+            find_type(self._valobj.GetTarget(), TYPE_SIZE_T),
         )
     
-    def _create_element_child(self, index):
-        actual_index = index - len(STATIC_SYNTHETIC_CHILDREN)
-        offset = actual_index * self._data_size
-        return self._begin_addr.CreateChildAtOffset(
-            f"[{actual_index}]",
-            offset,
-            self._data_type
+    def _get_window(self):
+        if self._window is None:
+            count = 0 if self._range.is_grouped else self._range.count
+            self._window = read_memory(
+                self._valobj.GetProcess(), self._begin_addr + self._range.lo * self._data_size, count * self._data_size
+            )
+            self._fingerprint = (self._header, self._window)
+        return self._window
+
+    def _create_element_child(self, child_index):
+        if self._range.is_grouped:
+            return create_range_child(self._valobj, *self._range.group_bounds(child_index))
+        element_index = self._range.element_index(child_index)
+        return self._create_element_value(element_index, self._get_window() if self._is_scalar else None)
+
+    def _create_element_value(self, element_index, raw):
+        """Element element_index, sliced from raw when it holds the elements starting at the range start."""
+        return create_contiguous_element(
+            self._valobj, element_index, self._begin_addr, self._data_type, raw, self._range.lo
         )
 
-    def _calculate_size(self):
-        try:
-            begin_addr = self._begin_addr.GetValueAsUnsigned(0)
-            end_addr = self._end_addr.GetValueAsUnsigned(0)
-            capacity_addr = self._capacity_addr.GetValueAsUnsigned(0)
+    def get_preview(self, count):
+        """Display strings of the first count elements, decoded from a single read for scalar element types."""
+        count = min(count, self._range.count)
+        if count <= 0:
+            return []
+        first = self._range.lo
+        raw = None
+        if self._is_scalar:
+            raw = read_memory(
+                self._valobj.GetProcess(), self._begin_addr + first * self._data_size, count * self._data_size
+            )
+            decoder = get_integer_decoder(self._valobj.GetTarget(), self._data_type)
+            if decoder and len(raw) == count * self._data_size:
+                return [str(value) for (value,) in decoder.iter_unpack(raw)]
+        return [get_value_display(self._create_element_value(first + index, raw)) for index in range(count)]
 
+    def _calculate_size(self, begin_addr, end_addr, capacity_addr):
+        try:
             if begin_addr >= end_addr:
                 return 0
             if capacity_addr < end_addr:
@@ -97,11 +175,8 @@ class VectorBase_SyntheticChildrenProvider:
         except Exception:
             return 0
         
-    def _calculate_capacity(self):
+    def _calculate_capacity(self, begin_addr, capacity_addr):
         try:
-            begin_addr = self._begin_addr.GetValueAsUnsigned(0)
-            capacity_addr = self._capacity_addr.GetValueAsUnsigned(0)
-
             if capacity_addr < begin_addr:
                 return 0
             contiguous_bytes_length = capacity_addr - begin_addr
@@ -111,14 +186,17 @@ class VectorBase_SyntheticChildrenProvider:
         except Exception:
             return 0
 
-def VectorBase_SummaryProvider(valobj, internal_dict):
-    size = valobj.GetChildAtIndex(STATIC_SYNTHETIC_CHILDREN.get("size")).GetValueAsUnsigned(0)
-    elems = [ 
-        get_value_display(valobj.GetChildAtIndex(i + len(STATIC_SYNTHETIC_CHILDREN))) 
-        for i in range(min(size, VECTOR_MAX_SUMMARY_SIZE))
-    ]
-    if size > VECTOR_MAX_SUMMARY_SIZE:
+def get_vector_summary(provider):
+    provider.update()
+    # A range group summarizes the elements it covers.
+    size = provider._range.count
+    summary_size = get_setting("vector-summary-size")
+    elems = provider.get_preview(summary_size)
+    if size > summary_size:
         elems.append("...")
     if not elems:
         return f"[{size}] {{}}"
     return f"[{size}] {{ {', '.join(elems)} }}"
+
+def VectorBase_SummaryProvider(valobj, internal_dict):
+    return get_vector_summary(VectorBase_SyntheticChildrenProvider(get_non_synthetic_value(valobj), internal_dict))
@@ -0,0 +1,147 @@
+import re
+import struct
+
+import lldb
+
+from formatters.constants import VECTOR_MAP_FIND_MAX_MATCHES
+from formatters.layout import get_layout, get_type_layout
+from formatters.string import basic_string_SyntheticChildrenProvider, get_character_encoding
+from formatters.utils import get_integer_decoder, get_raw_type, get_value_display, read_memory
+from formatters.vector import VectorBase_SyntheticChildrenProvider
+
+_SORTED_VECTOR_NAME = re.compile(r"^eastl::vector_(multi)?(map|set)<")
+_FLOAT_CODES = {lldb.eBasicTypeFloat: "f", lldb.eBasicTypeDouble: "d"}
+
+
+def _resolve_sorted_vector_layout(layout):
+    match = _SORTED_VECTOR_NAME.match(layout.name)
+    begin_type = layout.member_type("mpBegin")
+    if not match or not begin_type:
+        return None
+    is_map = match.group(2) == "map"
+    # vector_map<Key, T, Compare, ...> and vector_set<Key, Compare, ...>; a binary search is only sound for the
+    # order it assumes, so anything but eastl::less is refused rather than searched wrongly.
+    compare_type = layout.template_argument_type(2 if is_map else 1)
+    compare_name = compare_type.GetCanonicalType().GetName() if compare_type and compare_type.IsValid() else ""
+    element_type = begin_type.GetPointeeType()
+    key_offset, key_type = 0, element_type
+    if is_map:
+        element_layout = get_type_layout(layout.target, element_type)
+        key = element_layout.member("first") if element_layout else None
+        if not key:
+            return None
+        key_offset, key_type = key
+    return {
+        "is_multi": bool(match.group(1)),
+        "is_less": compare_name.startswith("eastl::less<"),
+        "element_size": element_type.GetByteSize(),
+        "key_offset": key_offset,
+        "key_type": key_type,
+    }
+
+
+class _KeyReader:
+    """Reads the key of element i of a sorted vector with as few bytes as its comparison needs."""
+
+    def __init__(self, valobj, begin_addr, layout, key_text):
+        self.valobj = valobj
+        self.target = valobj.GetTarget()
+        self.begin_addr = begin_addr
+        self.layout = layout
+        self.reads = 0
+        key_type = layout["key_type"].GetCanonicalType()
+        self.key_type = key_type
+        self.key_size = key_type.GetByteSize()
+        byte_order = ">" if self.target.GetByteOrder() == lldb.eByteOrderBig else "<"
+        self.decoder = get_integer_decoder(self.target, key_type)
+        self.is_string = (key_type.GetName() or "").startswith("eastl::basic_string<")
+        if self.decoder:
+            self.needle = int(key_text, 0)
+        elif key_type.GetBasicType() in (lldb.eBasicTypeFloat, lldb.eBasicTypeDouble):
+            self.decoder = struct.Struct(byte_order + _FLOAT_CODES[key_type.GetBasicType()])
+            self.needle = float(key_text)
+        elif self.is_string:
+            if len(key_text) >= 2 and key_text[0] == key_text[-1] and key_text[0] in "\"'":
+                key_text = key_text[1:-1]
+            key_layout = get_type_layout(self.target, key_type)
+            char_type = key_layout.template_argument_type(0) if key_layout else None
+            self.char_size = char_type.GetByteSize() if char_type and char_type.IsValid() else 0
+            encoding = get_character_encoding(self.target, self.char_size)
+            if not encoding:
+                raise ValueError(f"keys of type {key_type.GetName()} cannot be searched")
+            self.char_format = byte_order + {2: "H", 4: "I"}.get(self.char_size, "")
+            self.needle = self._code_units(key_text.encode(encoding))
+        else:
+            raise ValueError(f"keys of type {key_type.GetName()} cannot be searched")
+
+    def _code_units(self, raw):
+        """eastl::basic_string orders by code unit: bytes for char, unsigned units in target byte order otherwise."""
+        if self.char_size == 1:
+            return bytes(raw)
+        count = len(raw) // self.char_size
+        return struct.unpack(f"{self.char_format[0]}{count}{self.char_format[1]}", raw[:count * self.char_size])
+
+    def _key_address(self, index):
+        return self.begin_addr + index * self.layout["element_size"] + self.layout["key_offset"]
+
+    def read(self, index):
+        self.reads += 1
+        if self.is_string:
+            return self._read_string(index)
+        raw = read_memory(self.valobj.GetProcess(), self._key_address(index), self.key_size)
+        if len(raw) != self.key_size:
+            raise ValueError(f"cannot read the key of element [{index}]")
+        return self.decoder.unpack(raw)[0]
+
+    def _read_string(self, index):
+        key = self.valobj.CreateValueFromAddress("key", self._key_address(index), self.layout["key_type"])
+        provider = basic_string_SyntheticChildrenProvider(key, None)
+        provider.update()
+        if not provider._valid_layout:
+            raise ValueError(f"cannot read the key of element [{index}]")
+        if provider._value_size != self.char_size:
+            raise ValueError(f"cannot read the key of element [{index}]")
+        # One code unit past the needle is enough to order any key against it.
+        return self._code_units(provider.read_characters(len(self.needle) + 1))
+
+
+def find_sorted_vector_key(valobj, key_text):
+    """Binary searches a vector_map/vector_set for key_text.
+
+    Returns (lower_bound, matches, reads): the index the key would be inserted at, up to
+    VECTOR_MAP_FIND_MAX_MATCHES (index, element) pairs holding the key, and the number of keys read.
+    Raises ValueError when the container or its key type cannot be searched.
+    """
+    layout = get_layout(valobj).fact("sorted_vector", _resolve_sorted_vector_layout)
+    if not layout:
+        raise ValueError(
+            f"{get_raw_type(valobj).GetName()} is not a vector_map, vector_multimap, vector_set or vector_multiset"
+        )
+    if not layout["is_less"]:
+        raise ValueError("only containers ordered by eastl::less can be searched")
+    vector = VectorBase_SyntheticChildrenProvider(valobj, None)
+    vector.update()
+    size = vector._size
+    keys = _KeyReader(valobj, vector._begin_addr, layout, key_text)
+    lo, hi = 0, size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if keys.read(mid) < keys.needle:
+            lo = mid + 1
+        else:
+            hi = mid
+    matches = []
+    index = lo
+    limit = VECTOR_MAP_FIND_MAX_MATCHES if layout["is_multi"] else 1
+    while index < size and len(matches) < limit and keys.read(index) == keys.needle:
+        matches.append((index, vector._create_element_value(index, None)))
+        index += 1
+    return lo, matches, keys.reads
+
+
+def format_find_result(name, key_text, result):
+    lower_bound, matches, reads = result
+    if not matches:
+        return f"{key_text} not found in {name}, it would be inserted at [{lower_bound}] ({reads} keys read)"
+    lines = [f"{name}[{index}] = {get_value_display(element)}" for index, element in matches]
+    return "\n".join(lines)
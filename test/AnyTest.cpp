@@ -0,0 +1,20 @@
+#include <EASTL/any.h>
+#include <EASTL/string.h>
+
+#include "Allocator.h"
+
+struct Large
+{
+    long values[16];
+};
+
+int main()
+{
+    eastl::any empty;
+    eastl::any number = 42;
+    Large large = {};
+    large.values[0] = 7;
+    eastl::any boxed = large;
+    // BREAK_ANY_VALUES
+    return 0;
+}
@@ -9,5 +9,11 @@ int main()
 
     eastl::array<int, 7> many_numbers{{1, 2, 3, 4, 5, 6, 7}};
     // BREAK_ARRAY_EXCEEDS_SUMMARY_MAX
+
+    eastl::array<int, 1000> large_numbers;
+    for (int i = 0; i < 1000; i++) {
+        large_numbers[i] = i;
+    }
+    // BREAK_ARRAY_RANGE_GROUPS
     return 0;
 }
@@ -0,0 +1,12 @@
+#include <EASTL/atomic.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::atomic<int> counter(5);
+    eastl::atomic<int64_t> negative(-42);
+    counter.fetch_add(2);
+    // BREAK_ATOMIC_VALUES
+    return 0;
+}
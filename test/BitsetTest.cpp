@@ -0,0 +1,23 @@
+#include <EASTL/bitset.h>
+#include <EASTL/bitvector.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::bitset<100> flags;
+    flags.set(3);
+    flags.set(17);
+    flags.set(64);
+    eastl::bitvector<> dirty(10);
+    dirty.set(1, true);
+    dirty.set(9, true);
+    // BREAK_BITSET_VALUES
+
+    eastl::bitset<1000000> visible;
+    for (int i = 0; i < 1000000; i += 1000) {
+        visible.set(i);
+    }
+    // BREAK_BITSET_LARGE
+    return 0;
+}
@@ -0,0 +1,21 @@
+#include <EASTL/deque.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::deque<int> jobs;
+    for (int i = 1; i <= 5; i++) {
+        jobs.push_back(i);
+    }
+    jobs.push_front(0);
+    // BREAK_DEQUE_VALUES
+
+    eastl::deque<int> large;
+    for (int i = 0; i < 1000; i++) {
+        large.push_back(i);
+    }
+    large.pop_front();
+    // BREAK_DEQUE_LARGE
+    return 0;
+}
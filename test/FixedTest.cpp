@@ -0,0 +1,23 @@
+#include <EASTL/fixed_hash_map.h>
+#include <EASTL/fixed_list.h>
+#include <EASTL/fixed_map.h>
+#include <EASTL/fixed_string.h>
+#include <EASTL/fixed_vector.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::fixed_vector<int, 4> inline_vector = {1, 2, 3};
+    eastl::fixed_vector<int, 4> heap_vector = {1, 2, 3, 4, 5};
+    eastl::fixed_string<char, 16> inline_string = "fixed";
+    eastl::fixed_string<char, 4> heap_string = "spills into the heap";
+    eastl::fixed_map<int, int, 4> inline_map = {{1, 10}, {2, 20}};
+    eastl::fixed_map<int, int, 2> heap_map = {{1, 10}, {2, 20}, {3, 30}};
+    eastl::fixed_hash_map<int, int, 4> inline_hash_map;
+    inline_hash_map[1] = 10;
+    eastl::fixed_list<int, 4> inline_list = {7, 8};
+    eastl::fixed_list<int, 2> heap_list = {7, 8, 9};
+    // BREAK_FIXED_VALUES
+    return 0;
+}
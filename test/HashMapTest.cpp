@@ -0,0 +1,24 @@
+#include <EASTL/hash_map.h>
+#include <EASTL/hash_set.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::hash_map<int, int> squares;
+    squares[1] = 1;
+    squares[2] = 4;
+    squares[3] = 9;
+    eastl::hash_set<int> primes = {2, 3, 5, 7};
+    eastl::hash_multimap<int, int> pairs;
+    pairs.insert(eastl::make_pair(1, 10));
+    pairs.insert(eastl::make_pair(1, 11));
+    // BREAK_HASH_VALUES
+
+    eastl::hash_map<int, int> large;
+    for (int i = 0; i < 100000; i++) {
+        large[i] = i;
+    }
+    // BREAK_HASH_LARGE
+    return 0;
+}
@@ -0,0 +1,44 @@
+#include <EASTL/intrusive_hash_map.h>
+#include <EASTL/intrusive_list.h>
+
+#include "Allocator.h"
+
+struct Tagged
+{
+    int mTag;
+};
+
+// The hook follows another base, so it does not sit at offset 0 of the element.
+struct Entity : public Tagged, public eastl::intrusive_list_node
+{
+    int mId;
+};
+
+struct Player : public eastl::intrusive_hash_node_key<int>
+{
+    int mHealth;
+};
+
+int main()
+{
+    Entity entities[3];
+    eastl::intrusive_list<Entity> active;
+    for (int i = 0; i < 3; i++) {
+        entities[i].mTag = 10 * i;
+        entities[i].mId = i + 1;
+        active.push_back(entities[i]);
+    }
+
+    Player players[2];
+    eastl::intrusive_hash_map<int, Player, 37> lookup;
+    for (int i = 0; i < 2; i++) {
+        players[i].mKey = i + 1;
+        players[i].mHealth = 100 + i;
+        lookup.insert(players[i]);
+    }
+    // BREAK_INTRUSIVE_VALUES
+
+    active.clear();
+    lookup.clear();
+    return 0;
+}
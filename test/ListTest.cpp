@@ -0,0 +1,22 @@
+#include <EASTL/list.h>
+#include <EASTL/slist.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::list<int> numbers = {1, 2, 3};
+    numbers.push_front(0);
+    eastl::slist<int> forward = {4, 5, 6};
+    // BREAK_LIST_VALUES
+
+    eastl::list<int> cyclic = {7, 8, 9};
+    auto* first = cyclic.begin().mpNode;
+    auto* second = first->mpNext;
+    auto* third = second->mpNext;
+    // Point the second node back at the first, which a naive walk would follow forever.
+    second->mpNext = first;
+    // BREAK_LIST_CYCLE
+    second->mpNext = third;
+    return 0;
+}
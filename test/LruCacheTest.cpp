@@ -0,0 +1,26 @@
+#include <EASTL/bonus/lru_cache.h>
+#include <EASTL/string.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::lru_cache<int, int> numbers(16);
+    numbers.insert(1, 10);
+    numbers.insert(2, 20);
+    numbers.insert(3, 30);
+    numbers.touch(1);
+    // BREAK_LRU_CACHE_VALUES
+
+    eastl::lru_cache<eastl::string, int> assets(4);
+    assets.insert("a.png", 1);
+    assets.insert("b.png", 2);
+    // BREAK_LRU_CACHE_STRINGS
+
+    eastl::lru_cache<int, int> large(50000);
+    for (int i = 0; i < 50000; i++) {
+        large.insert(i, i * 2);
+    }
+    // BREAK_LRU_CACHE_LARGE
+    return 0;
+}
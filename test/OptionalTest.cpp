@@ -0,0 +1,13 @@
+#include <EASTL/optional.h>
+#include <EASTL/string.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::optional<int> empty;
+    eastl::optional<int> number = 42;
+    eastl::optional<eastl::string> name = eastl::string("hello");
+    // BREAK_OPTIONAL_VALUES
+    return 0;
+}
@@ -0,0 +1,25 @@
+#include <EASTL/deque.h>
+#include <EASTL/ring_buffer.h>
+#include <EASTL/vector.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::ring_buffer<int> samples(4);
+    for (int i = 1; i <= 6; i++) {
+        samples.push_back(i);
+    }
+    eastl::ring_buffer<int, eastl::deque<int>> queued(3);
+    for (int i = 1; i <= 5; i++) {
+        queued.push_back(i);
+    }
+    // BREAK_RING_BUFFER_VALUES
+
+    eastl::ring_buffer<int> telemetry(65536);
+    for (int i = 0; i < 100000; i++) {
+        telemetry.push_back(i);
+    }
+    // BREAK_RING_BUFFER_LARGE
+    return 0;
+}
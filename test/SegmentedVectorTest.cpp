@@ -0,0 +1,19 @@
+#include <EASTL/segmented_vector.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::segmented_vector<int, 4> small;
+    for (int i = 0; i < 10; i++) {
+        small.push_back(i * 10);
+    }
+    // BREAK_SEGMENTED_VECTOR_SMALL
+
+    eastl::segmented_vector<int, 1024> pool;
+    for (int i = 0; i < 1000000; i++) {
+        pool.push_back(i);
+    }
+    // BREAK_SEGMENTED_VECTOR_LARGE
+    return 0;
+}
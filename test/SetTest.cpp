@@ -9,5 +9,11 @@ int main()
     numbers.insert(3);
     numbers.insert(8);
     // BREAK_SET_VALUES
+
+    eastl::set<int> many_numbers;
+    for (int i = 0; i < 1000; i++) {
+        many_numbers.insert(999 - i);
+    }
+    // BREAK_SET_LARGE
     return 0;
 }
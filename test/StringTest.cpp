@@ -30,6 +30,9 @@ int main()
     eastl::string32 s32 = U"even wider string";
     // BREAK_VARIABLE_WIDTH_STRING
 
+    eastl::string huge(10000, 'x');
+    // BREAK_STRING_HUGE
+
     eastl::vector<eastl::string> strings = {"hello", "world", "foo"};
     volatile int dummy = 0;
     for (const auto& s : strings) {
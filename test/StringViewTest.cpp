@@ -0,0 +1,21 @@
+#include <EASTL/string.h>
+#include <EASTL/string_view.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::string_view empty;
+    eastl::string_view hello = "hello world";
+    eastl::string_view word = hello.substr(6, 5);
+    // BREAK_STRING_VIEW
+
+    eastl::u16string_view v16 = u"wide view";
+    eastl::u32string_view v32 = U"even wider view";
+    // BREAK_VARIABLE_WIDTH_STRING_VIEW
+
+    eastl::string buffer(1000000, 'x');
+    eastl::string_view huge = buffer;
+    // BREAK_STRING_VIEW_HUGE
+    return 0;
+}
@@ -0,0 +1,14 @@
+#include <EASTL/tuple.h>
+#include <EASTL/string.h>
+
+#include "Allocator.h"
+
+struct Empty {};
+
+int main()
+{
+    eastl::tuple<int, float, bool> values(1, 0.5f, true);
+    eastl::tuple<Empty, int, eastl::string> mixed(Empty(), 7, "hello");
+    // BREAK_TUPLE_VALUES
+    return 0;
+}
@@ -0,0 +1,19 @@
+#include <EASTL/bonus/tuple_vector.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::tuple_vector<int, float, bool> particles;
+    particles.push_back(1, 0.5f, true);
+    particles.push_back(2, 1.5f, false);
+    particles.push_back(3, 2.5f, true);
+    // BREAK_TUPLE_VECTOR_VALUES
+
+    eastl::tuple_vector<int, int> large;
+    for (int i = 0; i < 100000; i++) {
+        large.push_back(i, -i);
+    }
+    // BREAK_TUPLE_VECTOR_LARGE
+    return 0;
+}
@@ -0,0 +1,19 @@
+#include <EASTL/variant.h>
+#include <EASTL/string.h>
+#include <EASTL/vector.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::variant<int, float, eastl::string> number = 2.5f;
+    eastl::variant<int, float, eastl::string> text = eastl::string("hello");
+    // BREAK_VARIANT_VALUES
+
+    eastl::vector<eastl::variant<int, float, eastl::string>> messages;
+    messages.push_back(1);
+    messages.push_back(1.5f);
+    messages.push_back(eastl::string("three"));
+    // BREAK_VARIANT_VECTOR
+    return 0;
+}
@@ -0,0 +1,31 @@
+#include <EASTL/string.h>
+#include <EASTL/vector_map.h>
+#include <EASTL/vector_multimap.h>
+#include <EASTL/vector_set.h>
+
+#include "Allocator.h"
+
+int main()
+{
+    eastl::vector_map<int, int> evens;
+    evens.reserve(200000);
+    for (int i = 0; i < 200000; i++) {
+        evens.insert(evens.end(), eastl::make_pair(i * 2, i));
+    }
+    eastl::vector_set<int> primes = {2, 3, 5, 7, 11};
+    eastl::vector_multimap<int, int> pairs;
+    pairs.insert(eastl::make_pair(1, 10));
+    pairs.insert(eastl::make_pair(1, 11));
+    pairs.insert(eastl::make_pair(2, 20));
+    eastl::vector_map<eastl::string, int> names;
+    names["alpha"] = 1;
+    names["beta"] = 2;
+    names["gamma"] = 3;
+    // Code unit order: the surrogate pair of U+1F600 sorts before U+FF21, unlike their code points.
+    eastl::vector_map<eastl::u16string, int> glyphs;
+    glyphs[u"a"] = 1;
+    glyphs[u"\U0001F600"] = 2;
+    glyphs[u"\uFF21"] = 3;
+    // BREAK_VECTOR_MAP_VALUES
+    return 0;
+}
@@ -16,5 +16,9 @@ int main()
     // BREAK_LARGE_VECTOR
     v.resize(100);
     // BREAK_VECTOR_RESIZED
+    eastl::vector<float> floats = {0.5f, 1.5f, -2.25f};
+    eastl::vector<unsigned short> shorts = {1, 65535};
+    eastl::vector<char> chars = {'a', 'b'};
+    // BREAK_SCALAR_VECTORS
     return 0;
 }
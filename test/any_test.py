@@ -0,0 +1,48 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "AnyTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class AnyFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def _frame_var(self, name):
+        return lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_ANY_VALUES"),
+            name,
+        )
+
+    def test_empty(self):
+        self.assertIn("empty = empty", self._frame_var("empty"))
+
+    def test_internal_storage(self):
+        output = self._frame_var("number")
+        self.assertIn("number = (int) 42", output)
+        self.assertIn("(int) value = 42", output)
+
+    def test_external_storage(self):
+        output = self._frame_var("boxed")
+        self.assertIn("(Large) value = {", output)
+        self.assertIn("[0] = 7", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -43,6 +43,19 @@ class ArrayFormatterTests(unittest.TestCase):
         self.assertIn("many_numbers = [7] { 1, 2, 3, 4, 5, 6, ... } {", output)
         self.assertIn("[6] = 7", output)
 
+    def test_array_range_groups(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_ARRAY_RANGE_GROUPS"),
+            "large_numbers",
+        )
+        # More elements than ARRAY_MAX_SIZE are grouped into ranges that expand into their own elements.
+        self.assertIn("large_numbers = [1000] { 0, 1, 2, 3, 4, 5, ... } {", output)
+        self.assertIn("(eastl_size_t) size = 1000", output)
+        self.assertIn("[990..999] = [10] { 990, 991, 992, 993, 994, 995, ... }", output)
+        self.assertIn("(int) [999] = 999", output)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
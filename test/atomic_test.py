@@ -0,0 +1,37 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "AtomicTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class AtomicFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_atomic_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_ATOMIC_VALUES"),
+            "counter negative",
+        )
+        self.assertIn("counter = 7", output)
+        self.assertIn("negative = -42", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "BitsetTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class BitsetFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_bitset_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_BITSET_VALUES"),
+            "flags",
+        )
+        self.assertIn("flags = [100 bits, 3 set] {3, 17, 64}", output)
+        self.assertIn("(eastl_size_t) size = 100", output)
+        self.assertIn("(eastl_size_t) count = 3", output)
+        self.assertIn("(bool) [3] = true", output)
+        self.assertIn("(bool) [4] = false", output)
+        self.assertIn("(bool) [99] = false", output)
+
+    def test_bitvector_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_BITSET_VALUES"),
+            "dirty",
+        )
+        self.assertIn("dirty = [10 bits, 2 set] {1, 9}", output)
+        self.assertIn("(bool) [9] = true", output)
+
+    def test_large_bitset_range_groups(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_BITSET_LARGE"),
+            "visible",
+        )
+        self.assertIn("visible = [1000000 bits, 1000 set] {0, 1000, 2000, 3000, 4000, 5000, ...}", output)
+        self.assertIn("[990000..999999] = [10000 bits, 10 set] {990000, 991000, 992000, 993000, 994000, 995000, ...}", output)
+        self.assertIn("(bool) [999000] = true", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
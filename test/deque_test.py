@@ -0,0 +1,51 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "DequeTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class DequeFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_deque_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_DEQUE_VALUES"),
+            "jobs",
+        )
+        self.assertIn("(eastl::deque<int>) jobs = [6] { 0, 1, 2, 3, 4, 5 }", output)
+        self.assertIn("(eastl_size_t) size = 6", output)
+        self.assertIn("(int) [0] = 0", output)
+        self.assertIn("(int) [5] = 5", output)
+
+    def test_large_deque_range_groups(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_DEQUE_LARGE"),
+            "large",
+        )
+        # Elements beyond the cap are reached through range groups and read at their computed address.
+        self.assertIn("(eastl::deque<int>) large = [999] { 1, 2, 3, 4, 5, 6, ... }", output)
+        self.assertIn("[990..998] = [9] { 991, 992, 993, 994, 995, 996, ... }", output)
+        self.assertIn("(int) [998] = 999", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
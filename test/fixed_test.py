@@ -0,0 +1,83 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "FixedTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class FixedFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def frame_var(self, name):
+        return lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_FIXED_VALUES"),
+            name,
+        )
+
+    def test_fixed_vector(self):
+        output = self.frame_var("inline_vector")
+        self.assertIn("inline_vector = [3] { 1, 2, 3 }", output)
+        self.assertIn("(int) [2] = 3", output)
+        self.assertIn("(bool) overflowed = false", output)
+
+    def test_fixed_vector_overflow(self):
+        output = self.frame_var("heap_vector")
+        self.assertIn("heap_vector = [5] { 1, 2, 3, 4, 5 } (overflowed)", output)
+        self.assertIn("(int) [4] = 5", output)
+        self.assertIn("(bool) overflowed = true", output)
+
+    def test_fixed_string(self):
+        output = self.frame_var("inline_string")
+        self.assertIn('inline_string = "fixed"', output)
+        self.assertIn("(bool) overflowed = false", output)
+
+    def test_fixed_string_overflow(self):
+        output = self.frame_var("heap_string")
+        self.assertIn('heap_string = "spills into the heap" (overflowed)', output)
+        self.assertIn("(bool) overflowed = true", output)
+
+    def test_fixed_map(self):
+        output = self.frame_var("inline_map")
+        self.assertIn("inline_map = [2]", output)
+        self.assertIn("(bool) overflowed = false", output)
+
+    def test_fixed_map_overflow(self):
+        output = self.frame_var("heap_map")
+        self.assertIn("(overflowed)", output)
+        self.assertIn("(bool) overflowed = true", output)
+
+    def test_fixed_hash_map(self):
+        output = self.frame_var("inline_hash_map")
+        self.assertIn("inline_hash_map = [1]", output)
+        self.assertIn("(bool) overflowed = false", output)
+
+    def test_fixed_list(self):
+        output = self.frame_var("inline_list")
+        self.assertIn("inline_list = [2] { 7, ... }", output)
+        self.assertIn("(int) [1] = 8", output)
+        self.assertIn("(bool) overflowed = false", output)
+
+    def test_fixed_list_overflow(self):
+        output = self.frame_var("heap_list")
+        self.assertIn("heap_list = [3] { 7, ... } (overflowed)", output)
+        self.assertIn("(bool) overflowed = true", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,67 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+from formatters.constants import HASH_MAX_SIZE
+
+
+CMAKE_TARGET = "HashMapTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class HashMapFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_hash_map_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_HASH_VALUES"),
+            "squares",
+        )
+        # Iteration order follows the buckets, so only the shape of the summary is fixed.
+        self.assertIn("squares = [3] { (", output)
+        self.assertIn("(eastl_size_t) size = 3", output)
+        self.assertIn("(const int) first = 1", output)
+        self.assertIn("(const int) first = 2", output)
+        self.assertIn("(const int) first = 3", output)
+        self.assertIn("(int) second = 9", output)
+
+    def test_hash_set_and_multimap(self):
+        line = marker_line(CPP_SOURCE_FILE, "BREAK_HASH_VALUES")
+        output = lldb_frame_var(TEST_EXECUTABLE, CPP_SOURCE_FILE, line, "primes")
+        self.assertIn("primes = [4] {", output)
+        for prime in (2, 3, 5, 7):
+            self.assertIn(f"] = {prime}", output)
+
+        output = lldb_frame_var(TEST_EXECUTABLE, CPP_SOURCE_FILE, line, "pairs")
+        self.assertIn("pairs = [2] { (1, 1", output)
+        self.assertIn("(int) second = 10", output)
+        self.assertIn("(int) second = 11", output)
+
+    def test_large_hash_map_is_capped(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_HASH_LARGE"),
+            "large",
+        )
+        self.assertIn("large = [100000] {", output)
+        self.assertIn("(eastl_size_t) size = 100000", output)
+        self.assertIn(f"[{HASH_MAX_SIZE - 1}] = ", output)
+        self.assertNotIn(f"[{HASH_MAX_SIZE}] = ", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,52 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "IntrusiveTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class IntrusiveFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_intrusive_list_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_INTRUSIVE_VALUES"),
+            "active",
+        )
+        self.assertIn("(eastl_size_t) size = 3", output)
+        self.assertIn("(Entity) [0] = {", output)
+        # Children are the containing objects, so fields before the hook are shown correctly too.
+        self.assertIn("(int) mTag = 20", output)
+        self.assertIn("(int) mId = 3", output)
+
+    def test_intrusive_hash_map_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_INTRUSIVE_VALUES"),
+            "lookup",
+        )
+        self.assertIn("(eastl_size_t) size = 2", output)
+        self.assertIn("(Player) [0] = {", output)
+        self.assertIn("(int) mHealth = 100", output)
+        self.assertIn("(int) mHealth = 101", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,61 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "ListTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class ListFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_list_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_LIST_VALUES"),
+            "numbers",
+        )
+        self.assertIn("numbers = [4] { 0, ... }", output)
+        self.assertIn("(eastl_size_t) size = 4", output)
+        self.assertIn("(int) [0] = 0", output)
+        self.assertIn("(int) [3] = 3", output)
+
+    def test_slist_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_LIST_VALUES"),
+            "forward",
+        )
+        self.assertIn("forward = [3] { 4, ... }", output)
+        self.assertIn("(int) [0] = 4", output)
+        self.assertIn("(int) [2] = 6", output)
+
+    def test_cyclic_list_stops(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_LIST_CYCLE"),
+            "cyclic",
+        )
+        self.assertIn("cyclic = [3] { 7, ... }", output)
+        self.assertIn("(int) [1] = 8", output)
+        self.assertIn('<corrupted> = "broken or cyclic node chain"', output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,66 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+from formatters.constants import LRU_CACHE_MAX_SIZE
+
+
+CMAKE_TARGET = "LruCacheTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class LruCacheFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_recency_order(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_LRU_CACHE_VALUES"),
+            "numbers",
+        )
+        # touch(1) moved the oldest entry to the most recently used end.
+        self.assertIn("numbers = [3/16] { 1 → 10, 3 → 30, 2 → 20 }", output)
+        self.assertIn("(eastl_size_t) size = 3", output)
+        self.assertIn("(eastl_size_t) capacity = 16", output)
+        self.assertIn("(int) [1] = 10", output)
+        self.assertLess(output.index("[3] = 30"), output.index("[2] = 20"))
+
+    def test_string_keys(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_LRU_CACHE_STRINGS"),
+            "assets",
+        )
+        self.assertIn('assets = [2/4] { "b.png" → 2, "a.png" → 1 }', output)
+        self.assertIn('(int) ["b.png"] = 2', output)
+
+    def test_large_cache_shows_hot_end(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_LRU_CACHE_LARGE"),
+            "large",
+        )
+        self.assertIn("large = [50000/50000] { 49999 → 99998, 49998 → 99996, 49997 → 99994,", output)
+        self.assertIn("(int) [49999] = 99998", output)
+        oldest_shown = 50000 - LRU_CACHE_MAX_SIZE
+        self.assertIn(f"(int) [{oldest_shown}] = {oldest_shown * 2}", output)
+        self.assertNotIn(f"[{oldest_shown - 1}] =", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
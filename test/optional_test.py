@@ -0,0 +1,49 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "OptionalTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class OptionalFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def _frame_var(self, name):
+        return lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_OPTIONAL_VALUES"),
+            name,
+        )
+
+    def test_disengaged(self):
+        output = self._frame_var("empty")
+        self.assertIn("empty = nullopt", output)
+        self.assertNotIn("value", output)
+
+    def test_engaged(self):
+        output = self._frame_var("number")
+        self.assertIn("number = 42", output)
+        self.assertIn("(int) value = 42", output)
+
+    def test_engaged_string(self):
+        output = self._frame_var("name")
+        self.assertIn("name = \"hello\"", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
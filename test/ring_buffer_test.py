@@ -0,0 +1,63 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "RingBufferTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class RingBufferFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_wrapped_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_RING_BUFFER_VALUES"),
+            "samples",
+        )
+        self.assertIn("samples = [4] { 3, 4, 5, 6 }", output)
+        self.assertIn("(eastl_size_t) size = 4", output)
+        self.assertIn("(eastl_size_t) capacity = 4", output)
+        self.assertIn("(int) [0] = 3", output)
+        self.assertIn("(int) [3] = 6", output)
+
+    def test_deque_backed_values(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_RING_BUFFER_VALUES"),
+            "queued",
+        )
+        self.assertIn("queued = [3] { 3, 4, 5 }", output)
+        self.assertIn("(int) [2] = 5", output)
+
+    def test_large_ring_buffer_range_groups(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_RING_BUFFER_LARGE"),
+            "telemetry",
+        )
+        self.assertIn("telemetry = [65536] { 34464, 34465, 34466, 34467, 34468, 34469, ... }", output)
+        self.assertIn("[0..999] = [1000] { 34464, 34465, 34466, 34467, 34468, 34469, ... }", output)
+        # The newest samples are one expansion away.
+        self.assertIn("[65000..65535] = [536] { 99464, 99465, 99466, 99467, 99468, 99469, ... }", output)
+        self.assertIn("(int) [65535] = 99999", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
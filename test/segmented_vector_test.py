@@ -0,0 +1,55 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "SegmentedVectorTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class SegmentedVectorFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_elements_across_segments(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_SEGMENTED_VECTOR_SMALL"),
+            "small",
+        )
+        self.assertIn("small = [10] { 0, 10, 20, 30, 40, 50, ... }", output)
+        self.assertIn("(eastl_size_t) size = 10", output)
+        self.assertIn("(eastl_size_t) segment_count = 3", output)
+        self.assertIn("(int) [3] = 30", output)
+        self.assertIn("(int) [4] = 40", output)
+        self.assertIn("(int) [9] = 90", output)
+
+    def test_large_range_groups(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_SEGMENTED_VECTOR_LARGE"),
+            "pool",
+        )
+        self.assertIn("pool = [1000000] { 0, 1, 2, 3, 4, 5, ... }", output)
+        self.assertIn("(eastl_size_t) segment_count = 977", output)
+        # The segment table reaches the last segment, so a range group at the end resolves without a per-element walk.
+        self.assertIn("[990000..999999] = [10000] { 990000, 990001, 990002, 990003, 990004, 990005, ... }", output)
+        self.assertIn("[999900..999999] = [100] { 999900, 999901, 999902, 999903, 999904, 999905, ... }", output)
+        self.assertIn("(int) [999999] = 999999", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
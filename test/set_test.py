@@ -10,6 +10,7 @@ add_repo_root_to_path()
 
 import unittest
 from pathlib import Path
+from formatters.constants import TREE_MAX_SIZE
 
 
 CMAKE_TARGET = "SetTest"
@@ -35,6 +36,20 @@ class SetFormatterTests(unittest.TestCase):
         self.assertIn("(int) [1] = 8", output)
         self.assertIn("(int) [2] = 10", output)
 
+    def test_large_set_children_in_order(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_SET_LARGE"),
+            "many_numbers",
+        )
+        self.assertIn("many_numbers = [1000] { 0, ... }", output)
+        self.assertIn("(eastl_size_t) size = 1000", output)
+        self.assertIn("(int) [0] = 0", output)
+        self.assertIn("(int) [250] = 250", output)
+        self.assertIn(f"(int) [{TREE_MAX_SIZE - 1}] = {TREE_MAX_SIZE - 1}", output)
+        self.assertNotIn(f"(int) [{TREE_MAX_SIZE}] =", output)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
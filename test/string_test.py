@@ -10,6 +10,8 @@ import unittest
 
 add_repo_root_to_path()
 
+from formatters.constants import STRING_CHUNK_SIZE, STRING_MAX_SUMMARY_SIZE
+
 CMAKE_TARGET = "StringTest"
 CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
 TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
@@ -20,6 +22,7 @@ MARKER_FRAMES = [
     ("BREAK_STRING_HEAP",               ["heap"]),
     ("BREAK_STRING_SSO_TO_HEAP_APPEND", ["ssoToHeap"]),
     ("BREAK_VARIABLE_WIDTH_STRING",     ["s8", "su8", "s16", "s32"]),
+    ("BREAK_STRING_HUGE",               ["huge"]),
     ("BREAK_STRING_RANGE_LOOP",         ["s"]),
 ]
 
@@ -88,5 +91,12 @@ class StringFormatterTests(unittest.TestCase):
         self.assertIn("length = 5", output)
         self.assertIn('value = "hello"', output)
 
+    def test_string_huge_chunks(self):
+        output = self._frames["BREAK_STRING_HUGE"]
+        self.assertIn(f'(eastl::string) huge = "{"x" * STRING_MAX_SUMMARY_SIZE}"...', output)
+        self.assertIn("length = 10000", output)
+        self.assertIn(f"[0:{STRING_CHUNK_SIZE}] = ", output)
+        self.assertIn(f"[{2 * STRING_CHUNK_SIZE}:10000] = ", output)
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,68 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_run_markers,
+)
+
+from pathlib import Path
+import unittest
+
+add_repo_root_to_path()
+
+from formatters.constants import STRING_CHUNK_SIZE, STRING_MAX_SIZE, STRING_MAX_SUMMARY_SIZE
+
+CMAKE_TARGET = "StringViewTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+MARKER_FRAMES = [
+    ("BREAK_STRING_VIEW",                 ["empty", "hello", "word"]),
+    ("BREAK_VARIABLE_WIDTH_STRING_VIEW",  ["v16", "v32"]),
+    ("BREAK_STRING_VIEW_HUGE",            ["huge"]),
+]
+
+class StringViewFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+        cls._frames = lldb_run_markers(TEST_EXECUTABLE, CPP_SOURCE_FILE, MARKER_FRAMES)
+
+    def test_string_view(self):
+        output = self._frames["BREAK_STRING_VIEW"]
+        self.assertIn('(eastl::string_view) hello = "hello world"', output)
+        self.assertIn("length = 11", output)
+        self.assertNotIn("capacity", output)
+        self.assertNotIn("uses_heap", output)
+
+    def test_empty_string_view(self):
+        output = self._frames["BREAK_STRING_VIEW"]
+        self.assertIn('(eastl::string_view) empty = ""', output)
+        self.assertIn("length = 0", output)
+
+    def test_substring_view_stops_at_its_length(self):
+        # The viewed characters are followed by more of the literal, not by a terminator.
+        output = self._frames["BREAK_STRING_VIEW"]
+        self.assertIn('(eastl::string_view) word = "world"', output)
+        self.assertIn("length = 5", output)
+
+    def test_u16string_view(self):
+        output = self._frames["BREAK_VARIABLE_WIDTH_STRING_VIEW"]
+        self.assertIn('(eastl::u16string_view) v16 = "wide view"', output)
+        self.assertIn("length = 9", output)
+
+    def test_u32string_view(self):
+        output = self._frames["BREAK_VARIABLE_WIDTH_STRING_VIEW"]
+        self.assertIn('(eastl::u32string_view) v32 = "even wider view"', output)
+        self.assertIn("length = 15", output)
+
+    def test_huge_string_view_chunks(self):
+        output = self._frames["BREAK_STRING_VIEW_HUGE"]
+        self.assertIn(f'(eastl::string_view) huge = "{"x" * STRING_MAX_SUMMARY_SIZE}"...', output)
+        self.assertIn("length = 1000000", output)
+        self.assertIn(f'value = "{"x" * STRING_MAX_SIZE}"', output)
+        self.assertIn(f"[0:{STRING_CHUNK_SIZE}] = ", output)
+        self.assertIn(f"[{(1000000 // STRING_CHUNK_SIZE) * STRING_CHUNK_SIZE}:1000000] = ", output)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,28 +1,62 @@
 import argparse
 
+import any_test
 import array_test
+import atomic_test
+import bitset_test
+import deque_test
+import fixed_test
+import hash_map_test
+import intrusive_test
+import list_test
+import lru_cache_test
 import map_test
+import optional_test
 import pair_test
+import ring_buffer_test
+import segmented_vector_test
 import set_test
 import shared_ptr_test
 import span_test
 import string_test
+import string_view_test
+import tuple_test
+import tuple_vector_test
 import unique_ptr_test
+import variant_test
+import vector_map_test
 import vector_test
 import weak_ptr_test
 
 import unittest
 
 TEST_MODULES = {
+    "any": any_test,
     "array": array_test,
+    "atomic": atomic_test,
+    "bitset": bitset_test,
+    "deque": deque_test,
+    "fixed": fixed_test,
+    "hash_map": hash_map_test,
+    "intrusive": intrusive_test,
+    "list": list_test,
+    "lru_cache": lru_cache_test,
     "map": map_test,
+    "optional": optional_test,
     "pair": pair_test,
+    "ring_buffer": ring_buffer_test,
+    "segmented_vector": segmented_vector_test,
     "set": set_test,
     "shared_ptr": shared_ptr_test,
     "span": span_test,
     "string": string_test,
+    "string_view": string_view_test,
+    "tuple": tuple_test,
+    "tuple_vector": tuple_vector_test,
     "unique_ptr": unique_ptr_test,
+    "variant": variant_test,
     "vector": vector_test,
+    "vector_map": vector_map_test,
     "weak_ptr": weak_ptr_test,
 }
 
@@ -100,16 +100,22 @@ def lldb_run_markers(exe_path, cpp_path, marker_frames):
     return results
 
 
-def lldb_frame_var(exe_path, cpp_path, source_line, expression):
+def lldb_frame_var(exe_path, cpp_path, source_line, expression, setup_commands=(), stop_commands=()):
     command = [
         "lldb",
         "-b", str(exe_path),
         "-o", f"command script import {FORMATTER_SCRIPT}",
+    ]
+    for setup_command in setup_commands:
+        command.extend(["-o", setup_command])
+    command += [
         "-o", f"breakpoint set --file {cpp_path.name} --line {source_line}",
         "-o", "run",
         "-o", f"frame variable -TA {expression}",
-        "-o", "quit",
     ]
+    for stop_command in stop_commands:
+        command.extend(["-o", stop_command])
+    command += ["-o", "quit"]
     completed = subprocess.run(
         command,
         cwd=str(REPO_ROOT),
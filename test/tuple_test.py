@@ -0,0 +1,49 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "TupleTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class TupleFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_scalar_elements(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_TUPLE_VALUES"),
+            "values",
+        )
+        self.assertIn("values = (1, 0.5, true)", output)
+        self.assertIn("(int) [0] = 1", output)
+        self.assertIn("(float) [1] = 0.5", output)
+        self.assertIn("(bool) [2] = true", output)
+
+    def test_empty_and_string_elements(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_TUPLE_VALUES"),
+            "mixed",
+        )
+        self.assertIn("(int) [1] = 7", output)
+        self.assertIn("[2] = \"hello\"", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
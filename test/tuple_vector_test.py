@@ -0,0 +1,55 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "TupleVectorTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class TupleVectorFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_rows_and_columns(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_TUPLE_VECTOR_VALUES"),
+            "particles",
+        )
+        self.assertIn("particles = [3] { (1, 0.5, true), (2, 1.5, false), (3, 2.5, true) }", output)
+        self.assertIn("(eastl_size_t) size = 3", output)
+        self.assertIn("column<0> = [3] { 1, 2, 3 }", output)
+        self.assertIn("column<1> = [3] { 0.5, 1.5, 2.5 }", output)
+        self.assertIn("[1] = (2, 1.5, false)", output)
+        self.assertIn("(float) [1] = 2.5", output)
+        self.assertIn("(bool) [2] = true", output)
+
+    def test_large_range_groups(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_TUPLE_VECTOR_LARGE"),
+            "large",
+        )
+        self.assertIn("large = [100000] { (0, 0), (1, -1), (2, -2), (3, -3), (4, -4), (5, -5), ... }", output)
+        self.assertIn("[99000..99999] = [1000] { (99000, -99000), (99001, -99001),", output)
+        self.assertIn("column<1> = [100000] { 0, -1, -2, -3, -4, -5, ... }", output)
+        self.assertIn("column<1>[99000..99999] = [1000] { -99000, -99001, -99002, -99003, -99004, -99005, ... }", output)
+        self.assertIn("[99999] = (99999, -99999)", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,59 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "VariantTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class VariantFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def test_active_alternative(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_VARIANT_VALUES"),
+            "number",
+        )
+        self.assertIn("number = (float) 2.5", output)
+        self.assertIn("(eastl_size_t) index = 1", output)
+        self.assertIn("(float) value = 2.5", output)
+
+    def test_string_alternative(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_VARIANT_VALUES"),
+            "text",
+        )
+        self.assertIn("text = (eastl::string) \"hello\"", output)
+        self.assertIn("(eastl_size_t) index = 2", output)
+
+    def test_vector_of_variants(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_VARIANT_VECTOR"),
+            "messages",
+        )
+        self.assertIn("[0] = (int) 1", output)
+        self.assertIn("[1] = (float) 1.5", output)
+        self.assertIn("[2] = (eastl::string) \"three\"", output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
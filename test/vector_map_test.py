@@ -0,0 +1,71 @@
+from test_utils import (
+    BUILD_DIR,
+    add_repo_root_to_path,
+    build_target,
+    lldb_frame_var,
+    marker_line,
+)
+
+add_repo_root_to_path()
+
+import unittest
+from pathlib import Path
+
+
+CMAKE_TARGET = "VectorMapTest"
+CPP_SOURCE_FILE = Path(__file__).resolve().parent / f"{CMAKE_TARGET}.cpp"
+TEST_EXECUTABLE = BUILD_DIR / CMAKE_TARGET
+
+
+class VectorMapFormatterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        build_target(CMAKE_TARGET)
+
+    def frame_var(self, name, stop_commands=()):
+        return lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_VECTOR_MAP_VALUES"),
+            name,
+            stop_commands=stop_commands,
+        )
+
+    def test_vector_set_values(self):
+        output = self.frame_var("primes")
+        self.assertIn("primes = [5] { 2, 3, 5, 7, 11 }", output)
+        self.assertIn("(int) [4] = 11", output)
+
+    def test_vector_map_values(self):
+        output = self.frame_var("pairs")
+        self.assertIn("pairs = [3] { (1, 10), (1, 11), (2, 20) }", output)
+        self.assertIn("(int) first = 2", output)
+        self.assertIn("(int) second = 20", output)
+
+    def test_find_key(self):
+        output = self.frame_var("evens", stop_commands=["eastl find evens 299998", "eastl find evens 7"])
+        self.assertIn("evens = [200000] { (0, 0), (2, 1), (4, 2), (6, 3), (8, 4), (10, 5), ... }", output)
+        self.assertIn("evens[149999] = (299998, 149999)", output)
+        self.assertIn("7 not found in evens, it would be inserted at [4]", output)
+
+    def test_find_multi_key(self):
+        output = self.frame_var("primes", stop_commands=["eastl find pairs 1"])
+        self.assertIn("pairs[0] = (1, 10)", output)
+        self.assertIn("pairs[1] = (1, 11)", output)
+        self.assertNotIn("pairs[2]", output)
+
+    def test_find_string_key(self):
+        output = self.frame_var("primes", stop_commands=['eastl find names "beta"'])
+        self.assertIn('names[1] = ("beta", 2)', output)
+
+    def test_find_utf16_key_in_code_unit_order(self):
+        output = self.frame_var(
+            "primes", stop_commands=['eastl find glyphs "\uFF21"', 'eastl find glyphs "\U0001F600"']
+        )
+        # Summaries escape non-ASCII characters.
+        self.assertIn('glyphs[2] = ("\\uff21", 3)', output)
+        self.assertIn('glyphs[1] = ("\\U0001f600", 2)', output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -63,12 +63,14 @@ class VectorFormatterTests(unittest.TestCase):
             marker_line(CPP_SOURCE_FILE, "BREAK_LARGE_VECTOR"),
             "v",
         )
-        # The max size cap is used to limit the number of synthetic children that LLDB creates, but
-        # it should not affect the summary or size values.
+        # Beyond VECTOR_MAX_SIZE the elements are grouped into ranges, which does not affect the summary or
+        # size values and keeps every element reachable.
         self.assertIn("(eastl::vector<int>) v = [10000] { 0, 1, 2, 3, 4, 5, ... }", output)
         self.assertIn("(eastl_size_t) size = 10000", output)
-        self.assertIn(f"(int) [{VECTOR_MAX_SIZE - 1}] = {VECTOR_MAX_SIZE - 1}", output)
-        self.assertNotIn(f"(int) [{VECTOR_MAX_SIZE}] =", output)
+        self.assertIn("(eastl::vector<int>) [0..99] = [100] { 0, 1, 2, 3, 4, 5, ... }", output)
+        self.assertIn("(eastl::vector<int>) [9900..9999] = [100] { 9900, 9901, 9902, 9903, 9904, 9905, ... }", output)
+        self.assertIn(f"(int) [{VECTOR_MAX_SIZE}] = {VECTOR_MAX_SIZE}", output)
+        self.assertIn("(int) [9999] = 9999", output)
 
     def test_resize(self):
         output = lldb_frame_var(
@@ -80,5 +82,33 @@ class VectorFormatterTests(unittest.TestCase):
         self.assertIn("(eastl::vector<int>) v = [100] { 0, 1, 2, 3, 4, 5, ... }", output)
         self.assertIn("(eastl_size_t) size = 100", output)
 
+    def test_scalar_elements(self):
+        line = marker_line(CPP_SOURCE_FILE, "BREAK_SCALAR_VECTORS")
+        output = lldb_frame_var(TEST_EXECUTABLE, CPP_SOURCE_FILE, line, "floats")
+        self.assertIn("(eastl::vector<float>) floats = [3] { 0.5, 1.5, -2.25 }", output)
+        self.assertIn("(float) [2] = -2.25", output)
+
+        output = lldb_frame_var(TEST_EXECUTABLE, CPP_SOURCE_FILE, line, "shorts")
+        self.assertIn("(eastl::vector<unsigned short>) shorts = [2] { 1, 65535 }", output)
+        self.assertIn("(unsigned short) [1] = 65535", output)
+
+        output = lldb_frame_var(TEST_EXECUTABLE, CPP_SOURCE_FILE, line, "chars")
+        self.assertIn("(eastl::vector<char>) chars = [2] { 'a', 'b' }", output)
+        self.assertIn("(char) [1] = 'b'", output)
+
+    def test_settings_command(self):
+        output = lldb_frame_var(
+            TEST_EXECUTABLE,
+            CPP_SOURCE_FILE,
+            marker_line(CPP_SOURCE_FILE, "BREAK_VECTOR_INITIALIZED"),
+            "v",
+            setup_commands=["eastl settings set vector-summary-size 2", "eastl settings set vector-max-children 3"],
+        )
+        self.assertIn("vector-summary-size = 2 (default 6)", output)
+        self.assertIn("(eastl::vector<int>) v = [5] { 1, 2, ... }", output)
+        # Five elements over a cap of three are grouped into one range of ten.
+        self.assertIn("(eastl::vector<int>) [0..4] = [5] { 1, 2, ... }", output)
+        self.assertIn("(int) [4] = 5", output)
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)